@@ -0,0 +1,85 @@
+"""
+CustomRoute 로깅을 pure ASGI 미들웨어로 구현 시
+- api_router_custom.py의 CustomRoute와 같은 로깅, route_class 교체 없이 app에 한 번 등록
+- path prefix로 특정 router(/users)에만 적용 -> CustomRoute의 "특정 router에만 적용" 장점 유지
+- @app.middleware("http")(BaseHTTPMiddleware)와 달리 요청마다 task/memory stream을 추가하지 않고,
+  streaming 응답도 그대로 흘려보냄 (send만 감싸서 status 확인)
+- ASGIMiddleware를 상속해 hook만 구현하면 다른 공통 처리(header 추가, 감사 로그 등)에도 재사용 가능
+- ASGIMiddleware는 08_db_app/common/asgi_middleware.py의 학습용 축약본 (예제 단독 실행용)
+"""
+import uvicorn
+from fastapi import FastAPI, APIRouter
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+# 학습용 축약본: 이 예제 디렉터리만으로 실행되도록 같은 파일에 둠
+# 실제 app에서 쓰는 기준 구현은 08_db_app/common/asgi_middleware.py (scope_types, 타입 힌트 포함)
+# - 동작을 바꿀 때는 그쪽을 수정하고, 이 파일은 hook 구조만 맞춰 둠
+class ASGIMiddleware:
+    """Pure ASGI middleware base (teaching copy): subclass에서 on_request / on_response_start / on_complete 구현"""
+
+    def __init__(self, app: ASGIApp, path_prefixes: tuple = None):
+        self.app = app
+        self.path_prefixes = path_prefixes
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        # http 외 요청(websocket, lifespan)과 대상이 아닌 path는 그대로 통과
+        if scope["type"] != "http" or (self.path_prefixes and not scope["path"].startswith(self.path_prefixes)):
+            await self.app(scope, receive, send)
+            return
+
+        state = self.on_request(scope)
+        status = 500
+
+        async def send_wrapper(message: Message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                self.on_response_start(scope, message, state)
+            await send(message)
+
+        exc = None
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except BaseException as e:
+            exc = e
+            raise
+        finally:
+            self.on_complete(scope, status, state, exc)
+
+    def on_request(self, scope: Scope):
+        return None
+
+    def on_response_start(self, scope: Scope, message: Message, state):
+        pass
+
+    def on_complete(self, scope: Scope, status: int, state, exc):
+        pass
+
+
+class LoggingMiddleware(ASGIMiddleware):
+    def on_request(self, scope: Scope):
+        query = f"?{scope['query_string'].decode()}" if scope["query_string"] else ""
+        print(f"Custom logging: {scope['method']} {scope['path']}{query}")
+
+    def on_complete(self, scope: Scope, status: int, state, exc):
+        print(f"Response status: {status}")
+
+
+# 사용자 라우터 (route_class 지정 불필요)
+user_router = APIRouter(prefix="/users", tags=["users"])
+
+
+@user_router.get("/")
+async def get_users():
+    return [{"id": 1, "name": "John"}]
+
+
+app = FastAPI()
+app.include_router(user_router)
+app.add_middleware(LoggingMiddleware, path_prefixes=("/users",))
+
+
+# app run as debug
+if __name__ == "__main__":
+    uvicorn.run("api_router_asgi:app", port=8000, reload=True)
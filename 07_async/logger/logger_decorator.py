@@ -1,32 +1,32 @@
 from functools import wraps
-from datetime import datetime
-import time
 import inspect
+import logging
+import time
+
+logger = logging.getLogger("request_timing")
 
 
 # ------------------------------
 # 실행 시간 측정 데코레이터
+# - 시각 문자열 포맷/print 없이 perf_counter 한 쌍만 사용, 로그 메시지는 logging이 필요할 때만 포맷
+# - 동기 함수는 동기 wrapper로 감싸 FastAPI가 계속 threadpool에서 실행하도록 유지
 # ------------------------------
 def log_request_time(func):
-    @wraps(func)
-    async def wrapper(*args, **kwargs):
-        # 요청 시작 시간 기록
-        start_time = time.time()
-        start_dt = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        print(f"Request received at: {start_dt}")
+    if inspect.iscoroutinefunction(func):
+        @wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            start_time = time.perf_counter()
+            try:
+                return await func(*args, **kwargs)  # 비동기 함수
+            finally:
+                logger.info("%s took %.4f seconds", func.__name__, time.perf_counter() - start_time)
+        return async_wrapper
 
-        # 동기/비동기 함수 처리 분기
-        if inspect.iscoroutinefunction(func):
-            response = await func(*args, **kwargs)  # 비동기 함수
-        else:
-            response = func(*args, **kwargs)  # 동기 함수
-
-        # 응답 종료 시간 기록
-        end_time = time.time()
-        end_dt = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        total_time = end_time - start_time
-        print(f"Response sent at: {end_dt}")
-        print(f"Total execution time: {total_time:.2f} seconds")
-
-        return response
-    return wrapper
+    @wraps(func)
+    def sync_wrapper(*args, **kwargs):
+        start_time = time.perf_counter()
+        try:
+            return func(*args, **kwargs)  # 동기 함수
+        finally:
+            logger.info("%s took %.4f seconds", func.__name__, time.perf_counter() - start_time)
+    return sync_wrapper
@@ -3,9 +3,12 @@ from concurrent.futures import ThreadPoolExecutor
 import asyncio
 import threading
 import time
+import logging
 from logger.logger_decorator import log_request_time
 from logger.logger_depends import depend_log_request
 
+logging.basicConfig(level=logging.INFO)
+
 app = FastAPI()
 
 # ThreadPoolExecutor 생성
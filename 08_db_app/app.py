@@ -1,12 +1,14 @@
 import uvicorn
-from fastapi import FastAPI, Request, HTTPException
+from fastapi import FastAPI, HTTPException
 from common.error_handler_custom import generic_exception_handler, http_exception_handler
-import time
+from common.timing_middleware import TimingMiddleware, metrics_endpoint
+from contextlib import asynccontextmanager
 import logging
 
 from dotenv import load_dotenv
-from app_mariadb.routes import mariadb_router
+from app_mariadb.routes import mariadb_router, service as mariadb_service
 from app_elasticsearch.routes import es_router
+from app_elasticsearch.service import get_es_service, close_es_client
 
 
 load_dotenv()
@@ -14,7 +16,23 @@ load_dotenv()
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title="Database CRUD API", version="1.0")
+
+# lifespan: DB 초기화, 공유 Elasticsearch client(connection pool) 생성/종료, 종료 시 pool 정리
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await mariadb_service.init_db()
+    logger.info("Database initialization completed.")
+    try:
+        await get_es_service().bootstrap_index()
+    except Exception as e:
+        # Elasticsearch 장애가 MariaDB API 기동을 막지 않도록 경고만 남김
+        logger.warning(f"Elasticsearch index bootstrap failed: {e}")
+    yield
+    await close_es_client()
+    await mariadb_service.close_db()
+
+
+app = FastAPI(title="Database CRUD API", version="1.0", lifespan=lifespan)
 app.openapi_version = "3.0.2"
 
 # Custom Error handler
@@ -22,16 +40,9 @@ app.add_exception_handler(HTTPException, http_exception_handler)
 app.add_exception_handler(Exception, generic_exception_handler)
 
 
-# middleware: API 요청 시간 로깅
-@app.middleware("http")
-async def log_request_time(request: Request, call_next):
-    start_time = time.perf_counter()  # 요청 시작 시간
-    response = await call_next(request)  # 다음 처리로 넘어감
-    end_time = time.perf_counter()  # 요청 종료 시간
-
-    process_time = end_time - start_time
-    logger.info(f"Request: {request.method} {request.url} completed in {process_time:.4f} seconds")
-    return response
+# middleware(pure ASGI): 요청 처리 시간을 route별 histogram에 기록, 로그는 sampling
+app.add_middleware(TimingMiddleware)
+app.add_route("/metrics", metrics_endpoint, include_in_schema=False)
 
 
 # Include routers
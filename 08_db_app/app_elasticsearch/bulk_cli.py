@@ -0,0 +1,61 @@
+"""
+Product bulk indexing CLI
+
+run (08_db_app 디렉터리에서)
+    python -m app_elasticsearch.bulk_cli products.ndjson --chunk-size 1000 --concurrency 4
+    python -m app_elasticsearch.bulk_cli products.ndjson --bulk-load-mode
+    cat products.ndjson | python -m app_elasticsearch.bulk_cli -
+"""
+import argparse
+import asyncio
+import contextlib
+import sys
+
+import orjson
+
+from app_elasticsearch.service import get_es_service, close_es_client
+from app_elasticsearch.service import BULK_CHUNK_SIZE, BULK_MAX_CHUNK_BYTES, BULK_CONCURRENCY, BULK_MAX_RETRIES
+
+
+async def read_ndjson(path: str):
+    # 한 줄씩 읽어 전달: 파일 전체를 메모리에 올리지 않음
+    stream = sys.stdin.buffer if path == "-" else open(path, "rb")
+    try:
+        for line in stream:
+            if line.strip():
+                yield line
+    finally:
+        if stream is not sys.stdin.buffer:
+            stream.close()
+
+
+async def main(args):
+    service = get_es_service()
+    try:
+        await service.bootstrap_index()
+        # bulk load mode: 적재 중 refresh/replica 중지, 종료 후 복원
+        load_mode = service.bulk_load_mode() if args.bulk_load_mode else contextlib.nullcontext()
+        async with load_mode:
+            summary = await service.index_products(
+                read_ndjson(args.path),
+                chunk_size=args.chunk_size,
+                max_chunk_bytes=args.max_chunk_bytes,
+                concurrency=args.concurrency,
+                max_retries=args.max_retries
+            )
+    finally:
+        await close_es_client()
+
+    print(orjson.dumps(summary, option=orjson.OPT_INDENT_2).decode())
+    return 1 if summary["failed"] else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Bulk index products from an NDJSON file")
+    parser.add_argument("path", help="NDJSON file path ('-' for stdin)")
+    parser.add_argument("--chunk-size", type=int, default=BULK_CHUNK_SIZE)
+    parser.add_argument("--max-chunk-bytes", type=int, default=BULK_MAX_CHUNK_BYTES)
+    parser.add_argument("--concurrency", type=int, default=BULK_CONCURRENCY)
+    parser.add_argument("--max-retries", type=int, default=BULK_MAX_RETRIES)
+    parser.add_argument("--bulk-load-mode", action="store_true", help="refresh_interval=-1, replicas=0 while loading")
+    sys.exit(asyncio.run(main(parser.parse_args())))
@@ -0,0 +1,44 @@
+"""
+Products index management CLI
+
+run (08_db_app 디렉터리에서)
+    python -m app_elasticsearch.index_cli bootstrap
+    python -m app_elasticsearch.index_cli reindex --delete-old
+
+reindex 중에는 기존 index가 쓰기 차단됨 (읽기는 계속 가능): 쓰기 요청은 403으로 거부되므로
+쓰기를 멈추거나 재시도하도록 한 뒤 실행
+"""
+import argparse
+import asyncio
+import logging
+import sys
+
+import orjson
+
+from app_elasticsearch.service import get_es_service, close_es_client
+
+
+async def main(args):
+    service = get_es_service()
+    try:
+        if args.command == "bootstrap":
+            await service.bootstrap_index()
+            summary = {"alias": service.repo.index_name, "indices": await service.repo.get_alias_indices()}
+        else:
+            summary = await service.reindex(delete_old=args.delete_old, poll_interval=args.poll_interval)
+    finally:
+        await close_es_client()
+
+    print(orjson.dumps(summary, option=orjson.OPT_INDENT_2).decode())
+    return 1 if summary.get("failures") else 0
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    parser = argparse.ArgumentParser(description="Manage the products index template and alias")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser("bootstrap", help="put the index template and create the alias if missing")
+    reindex_parser = subparsers.add_parser("reindex", help="copy into a new index and swap the alias (writes are blocked until the swap)")
+    reindex_parser.add_argument("--delete-old", action="store_true", help="delete the previous backing indices")
+    reindex_parser.add_argument("--poll-interval", type=float, default=5.0)
+    sys.exit(asyncio.run(main(parser.parse_args())))
@@ -0,0 +1,65 @@
+"""
+Products index template / mappings
+
+- PRODUCTS_INDEX는 alias로 사용하고, 실제 index는 "<alias>-<timestamp>" 이름으로 생성
+- index template이 "<alias>" / "<alias>-*" 에 mapping을 적용하므로 dynamic mapping에 의존하지 않음
+"""
+import os
+from datetime import datetime, timezone
+
+PRODUCTS_SHARDS = int(os.getenv("ES_PRODUCTS_SHARDS", 1))
+PRODUCTS_REPLICAS = int(os.getenv("ES_PRODUCTS_REPLICAS", 1))
+PRODUCTS_REFRESH_INTERVAL = os.getenv("ES_PRODUCTS_REFRESH_INTERVAL", "1s")
+
+# category/tags는 term filter와 facet 집계에 쓰이므로 keyword
+PRODUCTS_MAPPINGS = {
+    "properties": {
+        "name": {
+            "type": "text",
+            "fields": {
+                "keyword": {"type": "keyword", "ignore_above": 256},
+                # 자동완성: completion suggester (in-memory FST, prefix 조회 전용)
+                "suggest": {"type": "completion"},
+            },
+        },
+        "category": {"type": "keyword"},
+        "tags": {"type": "keyword"},
+        "description": {"type": "text"},
+        "price": {"type": "scaled_float", "scaling_factor": 100},
+        "stock": {"type": "integer"},
+    }
+}
+
+# 대량 적재 중 설정: refresh 중지, replica 없음 (적재 후 원래 값으로 복원)
+BULK_LOAD_SETTINGS = {
+    "index.refresh_interval": "-1",
+    "index.number_of_replicas": 0,
+}
+
+# reindex 중 source index 쓰기 차단 (copy 이후의 쓰기가 새 index에서 유실되지 않도록)
+WRITE_BLOCK_SETTING = "index.blocks.write"
+
+
+def products_template_name(alias: str) -> str:
+    return f"{alias}-template"
+
+
+def products_index_template(alias: str) -> dict:
+    """put_index_template body for the products alias and its backing indices"""
+    return {
+        "index_patterns": [alias, f"{alias}-*"],
+        "priority": 100,
+        "template": {
+            "settings": {
+                "number_of_shards": PRODUCTS_SHARDS,
+                "number_of_replicas": PRODUCTS_REPLICAS,
+                "refresh_interval": PRODUCTS_REFRESH_INTERVAL,
+            },
+            "mappings": PRODUCTS_MAPPINGS,
+        },
+    }
+
+
+def new_index_name(alias: str) -> str:
+    """Backing index name for the alias, e.g. products-20250101120000"""
+    return f"{alias}-{datetime.now(timezone.utc).strftime('%Y%m%d%H%M%S')}"
@@ -1,5 +1,5 @@
-from pydantic import BaseModel, Field
-from typing import List, Optional, Dict
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+from typing import Annotated, List, Optional, Dict, Literal, Union
 
 
 class ProductCreate(BaseModel):
@@ -8,6 +8,11 @@ class ProductCreate(BaseModel):
     description: Optional[str] = Field(None, example="A compact wireless keyboard")
     price: float = Field(..., example=29.99)
     tags: Optional[List[str]] = Field(default_factory=list, example=["keyboard", "wireless", "compact"])
+    stock: Optional[int] = Field(None, ge=0, example=100)
+
+
+class ProductBulkItem(ProductCreate):
+    id: Optional[str] = Field(None, description="document id (생략 시 자동 생성)")
 
 
 class ProductResponse(BaseModel):
@@ -17,6 +22,47 @@ class ProductResponse(BaseModel):
     description: Optional[str]
     price: float
     tags: List[str] = Field(default_factory=list)  # 기본값 빈 리스트 제공
+    stock: Optional[int] = None
+
+
+class PriceRange(BaseModel):
+    model_config = ConfigDict(populate_by_name=True)
+
+    key: Optional[str] = Field(None, example="under-50")
+    from_: Optional[float] = Field(None, alias="from", example=0)
+    to: Optional[float] = Field(None, example=50)
+
+    @model_validator(mode="after")
+    def check_bounds(self):
+        if self.from_ is None and self.to is None:
+            raise ValueError("range needs 'from' or 'to'")
+        return self
+
+
+# Facet aggregation: type 별로 필요한 파라미터가 다름 (type으로 구분)
+class TermsAggregation(BaseModel):
+    type: Literal["terms"]
+    field: Literal["category", "tags"]
+    size: int = Field(10, ge=1, le=100, description="반환할 bucket 수")
+
+
+class RangeAggregation(BaseModel):
+    type: Literal["range"]
+    field: Literal["price"]
+    ranges: List[PriceRange] = Field(..., min_length=1, max_length=20)
+
+
+class HistogramAggregation(BaseModel):
+    type: Literal["histogram"]
+    field: Literal["price"]
+    interval: float = Field(..., gt=0, example=10)
+    min_doc_count: int = Field(0, ge=0)
+
+
+ProductAggregation = Annotated[
+    Union[TermsAggregation, RangeAggregation, HistogramAggregation], Field(discriminator="type")
+]
+AggregationName = Annotated[str, Field(pattern=r"^[A-Za-z0-9_-]{1,64}$")]
 
 
 class ProductSearchQuery(BaseModel):
@@ -24,6 +70,22 @@ class ProductSearchQuery(BaseModel):
     filters: Optional[Dict[str, str]] = Field(None, description="필터 조건 (e.g., {'category': 'electronics'})")
     sort_by: Optional[str] = Field(None, description="정렬 기준 필드 (e.g., 'price')")
     order: Optional[str] = Field(None, pattern="^(asc|desc)$", description="order by: 'asc' or 'desc'")
+    size: int = Field(10, ge=0, le=1000, description="페이지 크기")
+    cursor: Optional[str] = Field(None, description="이전 응답의 next_cursor (search_after 기반 다음 페이지)")
+    use_pit: bool = Field(False, description="point-in-time 기반 cursor pagination 시작 (next_cursor 반환)")
+    fields: Optional[List[Literal["name", "category", "description", "price", "tags", "stock"]]] = Field(
+        None, description="응답에 포함할 필드 (_source includes, id는 항상 포함)"
+    )
+    aggs: Optional[Dict[AggregationName, ProductAggregation]] = Field(
+        None,
+        max_length=10,
+        description="hit과 같은 요청으로 계산할 facet (size=0 이면 count/facet만 반환)",
+        example={"categories": {"type": "terms", "field": "category", "size": 10}},
+    )
+
+
+class ProductBatchQuery(BaseModel):
+    ids: List[str] = Field(..., min_length=1, max_length=1000, example=["product-1", "product-2"])
 
 
 class ProductUpdate(BaseModel):
@@ -32,3 +94,33 @@ class ProductUpdate(BaseModel):
     description: Optional[str] = Field(None, example="Updated description")
     price: Optional[float] = Field(None, example=24.99)
     tags: Optional[List[str]] = Field(None, example=["updated", "keyboard"])
+    stock: Optional[int] = Field(None, ge=0, example=80)
+
+
+# Counter update: 현재 값에 더함 (script 기반, 동시 요청에도 값 유실 없음)
+class ProductIncrement(BaseModel):
+    stock: Optional[int] = Field(None, example=-1, description="재고 증감 (결과가 음수가 되면 409)")
+    price: Optional[float] = Field(None, example=1.5, description="가격 증감")
+
+    @model_validator(mode="after")
+    def check_not_empty(self):
+        if not self.stock and not self.price:
+            raise ValueError("increment needs a non-zero 'stock' or 'price'")
+        return self
+
+
+# Batched partial update: ProductUpdate 필드(doc) 또는 increment 중 하나
+class ProductBulkUpdate(ProductUpdate):
+    id: str = Field(..., example="product-1")
+    increment: Optional[ProductIncrement] = None
+    if_seq_no: Optional[int] = Field(None, ge=0, description="optimistic concurrency: 마지막으로 읽은 _seq_no")
+    if_primary_term: Optional[int] = Field(None, ge=1, description="optimistic concurrency: 마지막으로 읽은 _primary_term")
+
+    @model_validator(mode="after")
+    def check_update(self):
+        fields = self.model_dump(exclude_unset=True, exclude={"id", "increment", "if_seq_no", "if_primary_term"})
+        if bool(fields) == bool(self.increment):
+            raise ValueError("set either product fields or 'increment'")
+        if (self.if_seq_no is None) != (self.if_primary_term is None):
+            raise ValueError("if_seq_no and if_primary_term must be set together")
+        return self
@@ -1,15 +1,79 @@
-from elasticsearch_dsl import Search, Q
+import base64
+from functools import lru_cache
+
+import orjson
+from elasticsearch_dsl import Search, Q, A
+
+# facet 필드 -> 집계에 사용할 실제 필드 (category/tags는 index template에서 keyword로 mapping)
+AGGREGATION_FIELDS = {
+    "category": "category",
+    "tags": "tags",
+    "price": "price",
+}
+
+
+# 템플릿 자리표시자: 쿼리 shape별로 한 번만 DSL을 만들고, 요청마다 값만 치환
+def _param(name: str) -> str:
+    return f"\x00{name}\x00"
+
+
+def _fill(node, values: dict):
+    if isinstance(node, dict):
+        return {key: _fill(value, values) for key, value in node.items()}
+    if isinstance(node, list):
+        return [_fill(value, values) for value in node]
+    if isinstance(node, str) and node.startswith("\x00"):
+        return values[node]
+    return node
+
+
+# 자동완성 suggester 이름 / 응답에서 필요한 경로
+SUGGEST_NAME = "product-suggest"
+SUGGEST_FILTER_PATH = f"suggest.{SUGGEST_NAME}.options.text,suggest.{SUGGEST_NAME}.options._id"
+
+# 숫자 필드 증감 script: source가 고정이라 cluster에서 한 번만 컴파일되고 값은 params로 전달
+# 재고가 음수가 되는 요청은 ctx.op = 'noop' 으로 변경 없이 종료
+INCREMENT_SCRIPT = """
+def increments = params.increments;
+if (increments.containsKey('stock') && (ctx._source.stock == null ? 0 : ctx._source.stock) + increments.stock < 0) {
+  ctx.op = 'noop';
+} else {
+  for (entry in increments.entrySet()) {
+    def current = ctx._source[entry.getKey()];
+    ctx._source[entry.getKey()] = (current == null ? 0 : current) + entry.getValue();
+  }
+}
+""".strip()
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a search_after cursor cannot be decoded"""
 
 
 class QueryBuilder:
     @staticmethod
-    def build_search_query(query: str = None, filters: dict = None, sort_by: str = None, order: str = "asc"):
+    def build_search_query(
+        query: str = None,
+        filters: dict = None,
+        sort_by: str = None,
+        order: str = "asc",
+        size: int = None,
+        search_after: list = None,
+        pit_id: str = None,
+        keep_alive: str = "1m",
+        aggs: dict = None
+    ):
         """
         상품 검색 쿼리 생성
         :param query: 검색어
         :param filters: 필터 조건
         :param sort_by: 정렬 기준
         :param order: 정렬 방향
+        :param size: 반환할 hit 수
+        :param search_after: 이전 페이지 마지막 hit의 sort 값
+        :param pit_id: point-in-time id (deep pagination)
+        :param keep_alive: point-in-time 유지 시간
+        :param aggs: facet 집계 {name: {"type": terms|range|histogram, "field": .., ...}}
         :return: Elasticsearch Query DSL
         """
         search = Search()
@@ -24,7 +88,154 @@ class QueryBuilder:
                 search = search.filter(Q("term", **{field: value}))
 
         # 정렬 추가
+        sort = list()
         if sort_by:
-            search = search.sort({sort_by: {"order": order}})
+            sort.append({sort_by: {"order": order}})
+        # point-in-time 사용 시 _shard_doc을 tie-breaker로 추가해 search_after가 항상 유일하도록 함
+        if pit_id:
+            sort.append({"_shard_doc": "asc"})
+        if sort:
+            search = search.sort(*sort)
+
+        # 페이지 크기 및 search_after / point-in-time
+        if size is not None:
+            search = search.extra(size=size)
+        if search_after:
+            search = search.extra(search_after=search_after)
+        if pit_id:
+            search = search.extra(pit={"id": pit_id, "keep_alive": keep_alive})
+
+        # facet 집계: hit과 같은 요청에서 계산
+        for name, agg in (aggs or {}).items():
+            search.aggs.bucket(name, QueryBuilder.build_aggregation(agg))
 
         return search
+
+    @staticmethod
+    def build_aggregation(agg: dict) -> A:
+        """Facet spec -> terms / range / histogram aggregation"""
+        field = AGGREGATION_FIELDS[agg["field"]]
+        if agg["type"] == "terms":
+            return A("terms", field=field, size=agg.get("size", 10))
+        if agg["type"] == "range":
+            ranges = list()
+            for bound in agg["ranges"]:
+                ranges.append({k: v for k, v in bound.items() if v is not None})
+            return A("range", field=field, ranges=ranges)
+        if agg["type"] == "histogram":
+            return A("histogram", field=field, interval=agg["interval"], min_doc_count=agg.get("min_doc_count", 0))
+        raise ValueError(f"Unsupported aggregation type: {agg['type']}")
+
+    @staticmethod
+    def parse_aggregations(response_aggs: dict) -> dict:
+        """Flatten aggregation buckets: {name: [{"key": .., "count": .., ("from"/"to")}]}"""
+        facets = dict()
+        for name, result in (response_aggs or {}).items():
+            buckets = list()
+            for bucket in result.get("buckets", []):
+                entry = {"key": bucket["key"], "count": bucket["doc_count"]}
+                for bound in ("from", "to"):
+                    if bound in bucket:
+                        entry[bound] = bucket[bound]
+                buckets.append(entry)
+            facets[name] = buckets
+        return facets
+
+    @staticmethod
+    def build_search_body(
+        query: str = None,
+        filters: dict = None,
+        sort_by: str = None,
+        order: str = "asc",
+        size: int = None,
+        search_after: list = None,
+        pit_id: str = None,
+        keep_alive: str = "1m",
+        aggs: dict = None
+    ) -> dict:
+        """
+        build_search_query(...).to_dict() 와 동일한 request body를 반환.
+        쿼리 shape(검색어 유무, 필터 필드, 정렬 필드/방향, paging 옵션)별로 컴파일된 템플릿을 캐시하고
+        요청마다 값만 치환하므로 DSL 객체 그래프를 매번 만들지 않음.
+        aggs는 요청마다 파라미터가 달라 템플릿 밖에서 추가함.
+        """
+        filters = filters or {}
+        shape = (
+            query is not None and query != "",
+            tuple(sorted(filters)),
+            sort_by or None,
+            order if sort_by else None,
+            size is not None,
+            bool(search_after),
+            pit_id is not None,
+        )
+        values = {
+            _param("query"): query,
+            _param("size"): size,
+            _param("search_after"): search_after,
+            _param("pit_id"): pit_id,
+            _param("keep_alive"): keep_alive,
+        }
+        for field, value in filters.items():
+            values[_param(f"filter:{field}")] = value
+
+        body = _fill(_compile_search_template(shape), values)
+        if aggs:
+            body["aggs"] = {name: QueryBuilder.build_aggregation(agg).to_dict() for name, agg in aggs.items()}
+        return body
+
+    @staticmethod
+    def build_suggest_body(prefix: str, size: int = 5) -> dict:
+        """Completion suggester on name.suggest: no hits, no _source (option text only)"""
+        return {
+            "size": 0,
+            "_source": False,
+            "suggest": {
+                SUGGEST_NAME: {
+                    "prefix": prefix,
+                    "completion": {"field": "name.suggest", "size": size, "skip_duplicates": True},
+                }
+            },
+        }
+
+    @staticmethod
+    def build_increment_script(increments: dict) -> dict:
+        """Script update body that adds each value to the current field value ({"stock": -1, "price": 1.5})"""
+        return {"script": {"source": INCREMENT_SCRIPT, "lang": "painless", "params": {"increments": increments}}}
+
+    @staticmethod
+    def cache_stats() -> dict:
+        info = _compile_search_template.cache_info()
+        return {"hits": info.hits, "misses": info.misses, "size": info.currsize, "max_size": info.maxsize}
+
+    @staticmethod
+    def encode_cursor(pit_id: str, sort_values: list) -> str:
+        """Opaque cursor for the next page: point-in-time id + last hit's sort values"""
+        raw = orjson.dumps({"pit": pit_id, "sort": sort_values})
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    @staticmethod
+    def decode_cursor(cursor: str) -> tuple:
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            payload = orjson.loads(base64.urlsafe_b64decode(padded.encode()))
+            return payload["pit"], payload["sort"]
+        except (ValueError, TypeError, KeyError) as e:
+            raise InvalidCursorError("Malformed cursor") from e
+
+
+@lru_cache(maxsize=256)
+def _compile_search_template(shape: tuple) -> dict:
+    """Build the request body once per query shape, with placeholders instead of values"""
+    has_query, filter_fields, sort_by, order, has_size, has_search_after, has_pit = shape
+    search = QueryBuilder.build_search_query(
+        query=_param("query") if has_query else None,
+        filters={field: _param(f"filter:{field}") for field in filter_fields},
+        sort_by=sort_by,
+        order=order,
+        size=_param("size") if has_size else None,
+        search_after=_param("search_after") if has_search_after else None,
+        pit_id=_param("pit_id") if has_pit else None,
+        keep_alive=_param("keep_alive"),
+    )
+    return search.to_dict()
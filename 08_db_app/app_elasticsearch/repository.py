@@ -1,37 +1,294 @@
-from elasticsearch import AsyncElasticsearch
+import asyncio
+from typing import AsyncIterator, Callable
+from elasticsearch import AsyncElasticsearch, NotFoundError
+from elasticsearch.helpers import async_streaming_bulk
+
+# bulk worker 종료 신호
+_BULK_DONE = object()
 
 
 class ElasticsearchRepository:
-    def __init__(self, es_client: AsyncElasticsearch, index_name: str):
+    def __init__(self, es_client: AsyncElasticsearch, index_name: str, timeouts: dict = None):
         self.es_client = es_client
         self.index_name = index_name
+        # 요청 종류별 timeout(초): {"search": .., "get": .., "write": .., "bulk": ..}, 없으면 client 기본값
+        self.timeouts = timeouts or dict()
+
+    def _client(self, kind: str) -> AsyncElasticsearch:
+        """Client bound to the per-request timeout of this kind of call (shares the same connection pool)"""
+        timeout = self.timeouts.get(kind)
+        if timeout is None:
+            return self.es_client
+        return self.es_client.options(request_timeout=timeout)
+
+    # Cluster health (health check용, 짧은 timeout)
+    async def cluster_health(self) -> dict:
+        response = await self._client("get").cluster.health(index=self.index_name)
+        return dict(response)
+
+    # Index template / alias 관리 (index_name은 alias)
+    async def put_index_template(self, name: str, body: dict):
+        await self.es_client.indices.put_index_template(name=name, **body)
+
+    async def get_alias_indices(self) -> list:
+        """Backing indices of the alias, [] when the alias does not exist"""
+        try:
+            response = await self.es_client.indices.get_alias(name=self.index_name)
+        except NotFoundError:
+            return list()
+        return list(response.keys())
+
+    async def index_exists(self, index: str) -> bool:
+        return bool(await self.es_client.indices.exists(index=index))
+
+    async def create_index(self, index: str, aliases: dict = None):
+        await self.es_client.indices.create(index=index, aliases=aliases)
+
+    async def delete_index(self, index: str):
+        await self.es_client.indices.delete(index=index)
+
+    async def get_index_settings(self, index: str, names: list) -> dict:
+        """{concrete index: {setting: value}} for the requested flat setting names"""
+        response = await self.es_client.indices.get_settings(index=index, name=names, flat_settings=True)
+        return {name: dict(body["settings"]) for name, body in response.items()}
+
+    async def put_index_settings(self, index: str, settings: dict):
+        await self.es_client.indices.put_settings(index=index, settings=settings)
+
+    async def refresh(self, index: str = None):
+        await self.es_client.indices.refresh(index=index or self.index_name)
+
+    async def update_aliases(self, actions: list):
+        await self.es_client.indices.update_aliases(actions=actions)
+
+    # Reindex: background task로 실행하고 task id 반환
+    async def start_reindex(self, source: str, dest: str) -> str:
+        response = await self.es_client.reindex(
+            source={"index": source}, dest={"index": dest}, wait_for_completion=False, slices="auto"
+        )
+        return response["task"]
+
+    async def get_task(self, task_id: str) -> dict:
+        return dict(await self.es_client.tasks.get(task_id=task_id))
 
     # Create or update a document in Elasticsearch
     async def create_document(self, doc_id: str, document: dict):
         if doc_id:
-            response = await self.es_client.index(index=self.index_name, id=doc_id, body=document)
+            response = await self._client("write").index(index=self.index_name, id=doc_id, body=document)
         else:
-            response = await self.es_client.index(index=self.index_name, body=document)
+            response = await self._client("write").index(index=self.index_name, body=document)
         return response
 
     # Retrieve a document by its ID
     async def get_document(self, doc_id: str):
-        response = await self.es_client.get(index=self.index_name, id=doc_id)
+        response = await self._client("get").get(index=self.index_name, id=doc_id)
         if response.get("found"):
             return response["_source"]
         return None
 
+    # Retrieve many documents by ID in one round-trip (_mget)
+    async def get_documents(self, ids: list) -> dict:
+        """Return {doc_id: {"_source", "_seq_no", "_primary_term"}} for the ids that exist"""
+        response = await self._client("get").mget(index=self.index_name, ids=ids)
+        return {
+            doc["_id"]: {"_source": doc["_source"], "_seq_no": doc.get("_seq_no"), "_primary_term": doc.get("_primary_term")}
+            for doc in response["docs"] if doc.get("found")
+        }
+
     # Search for documents using Query DSL
-    async def search_documents(self, query: dict):
-        response = await self.es_client.search(index=self.index_name, query=query)
+    async def search_documents(
+        self,
+        query: dict,
+        source_includes: list = None,
+        source_excludes: list = None,
+        docvalue_fields: list = None,
+        filter_path: str = None
+    ):
+        options = self._search_options(source_includes, source_excludes, docvalue_fields, filter_path)
+        response = await self._client("search").search(index=self.index_name, query=query, **options)
         return response
 
+    # Search with a full request body (size, sort, search_after, pit ...)
+    async def search(
+        self,
+        body: dict,
+        source_includes: list = None,
+        source_excludes: list = None,
+        docvalue_fields: list = None,
+        filter_path: str = None
+    ):
+        options = self._search_options(source_includes, source_excludes, docvalue_fields, filter_path)
+        # point-in-time 검색은 index를 지정하지 않음 (pit에 index가 포함됨)
+        if "pit" in body:
+            return await self._client("search").search(**body, **options)
+        return await self._client("search").search(index=self.index_name, **body, **options)
+
+    @staticmethod
+    def _search_options(source_includes, source_excludes, docvalue_fields, filter_path) -> dict:
+        """
+        Projection options: 필요한 필드만 전송/디코딩
+        - source_includes/excludes: _source filtering
+        - docvalue_fields: doc values에서 직접 읽을 필드 (hits[].fields)
+        - filter_path: 응답 JSON 자체를 축소 (e.g. "hits.hits._id,hits.hits._source")
+        """
+        options = dict()
+        if source_includes is not None:
+            options["source_includes"] = source_includes
+        if source_excludes is not None:
+            options["source_excludes"] = source_excludes
+        if docvalue_fields is not None:
+            options["docvalue_fields"] = docvalue_fields
+        if filter_path is not None:
+            options["filter_path"] = filter_path
+        return options
+
+    # Suggest (completion suggester): 요청 body는 QueryBuilder.build_suggest_body
+    async def suggest(self, body: dict, filter_path: str = None) -> dict:
+        options = self._search_options(None, None, None, filter_path)
+        return await self._client("suggest").search(index=self.index_name, **body, **options)
+
+    # Point-in-time: 일관된 snapshot 기반 deep pagination
+    async def open_point_in_time(self, keep_alive: str = "1m") -> str:
+        response = await self._client("search").open_point_in_time(index=self.index_name, keep_alive=keep_alive)
+        return response["id"]
+
+    async def close_point_in_time(self, pit_id: str):
+        await self._client("search").close_point_in_time(id=pit_id)
+
+    # 전체 문서 순회: point-in-time + search_after (scroll 미사용)
+    async def iter_all(self, batch_size: int = 1000, keep_alive: str = "1m") -> AsyncIterator[list]:
+        pit_id = await self.open_point_in_time(keep_alive)
+        search_after = None
+        try:
+            while True:
+                body = {
+                    "size": batch_size,
+                    "sort": [{"_shard_doc": "asc"}],
+                    "pit": {"id": pit_id, "keep_alive": keep_alive},
+                    "track_total_hits": False,
+                }
+                if search_after:
+                    body["search_after"] = search_after
+                response = await self._client("search").search(**body)
+                pit_id = response.get("pit_id", pit_id)
+                hits = response["hits"]["hits"]
+                if not hits:
+                    return
+                yield hits
+                if len(hits) < batch_size:
+                    return
+                search_after = hits[-1]["sort"]
+        finally:
+            await self.close_point_in_time(pit_id)
+
     # Update
-    async def update_document(self, doc_id: str, query: dict):
-        response = await self.es_client.update(index=self.index_name, id=doc_id, body=query)
+    async def update_document(
+        self,
+        doc_id: str,
+        query: dict,
+        if_seq_no: int = None,
+        if_primary_term: int = None,
+        retry_on_conflict: int = None
+    ):
+        """
+        Partial update (doc 또는 script).
+        - if_seq_no/if_primary_term: 다른 요청이 먼저 수정했으면 ConflictError(409)
+        - retry_on_conflict: OCC 없이 script update 시 version 충돌 재시도 횟수
+        """
+        options = dict()
+        if if_seq_no is not None and if_primary_term is not None:
+            options = {"if_seq_no": if_seq_no, "if_primary_term": if_primary_term}
+        elif retry_on_conflict:
+            options = {"retry_on_conflict": retry_on_conflict}
+        response = await self._client("write").update(index=self.index_name, id=doc_id, body=query, **options)
         return response
 
     # Delete a document by its ID
     async def delete_document(self, doc_id: str):
-        response = await self.es_client.delete(index=self.index_name, id=doc_id)
+        response = await self._client("write").delete(index=self.index_name, id=doc_id)
         return response
+
+    # Bulk indexing: _bulk API, 청크 크기/바이트 제한, 동시 요청 수 제한, 429 재시도(backoff)
+    async def bulk_index(
+        self,
+        actions: AsyncIterator[dict],
+        chunk_size: int = 500,
+        max_chunk_bytes: int = 10 * 1024 * 1024,
+        concurrency: int = 2,
+        max_retries: int = 3,
+        initial_backoff: float = 2,
+        max_backoff: float = 60,
+        max_errors: int = 100,
+        noop_rejected: Callable[[str], bool] = None
+    ) -> dict:
+        """
+        Index bulk actions with at most `concurrency` _bulk requests in flight.
+        Actions are pulled through a bounded queue, so a slow cluster slows the producer down
+        (back-pressure) instead of buffering the whole input. Documents rejected with 429 are
+        retried by the bulk helper with exponential backoff.
+        Returns a summary: indexed/noop/failed counts and the first `max_errors` per-document errors
+        (indexed counts every successful action, noop the updates that changed nothing).
+        noop_rejected(_id): noop인 update 중 script가 거부한 것 -> 409 실패로 집계 (e.g. 재고 부족)
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=chunk_size * concurrency)
+        summary = {"total": 0, "indexed": 0, "noop": 0, "failed": 0, "errors": list()}
+
+        def record_error(doc_id, status, error):
+            summary["failed"] += 1
+            if len(summary["errors"]) < max_errors:
+                summary["errors"].append({"id": doc_id, "status": status, "error": error})
+
+        async def queued_actions():
+            while True:
+                action = await queue.get()
+                if action is _BULK_DONE:
+                    return
+                yield action
+
+        async def worker():
+            try:
+                async for ok, item in async_streaming_bulk(
+                    self._client("bulk"),
+                    queued_actions(),
+                    chunk_size=chunk_size,
+                    max_chunk_bytes=max_chunk_bytes,
+                    max_retries=max_retries,
+                    initial_backoff=initial_backoff,
+                    max_backoff=max_backoff,
+                    raise_on_error=False,
+                    raise_on_exception=False,
+                    yield_ok=True,
+                ):
+                    if ok:
+                        info = next(iter(item.values()))
+                        # update action이 변경 없이 끝난 경우 (detect_noop / script ctx.op = 'noop')
+                        if info.get("result") == "noop":
+                            if noop_rejected and noop_rejected(info.get("_id")):
+                                record_error(info.get("_id"), 409, "update rejected by script")
+                                continue
+                            summary["noop"] += 1
+                        summary["indexed"] += 1
+                        continue
+                    _, info = next(iter(item.items()))
+                    error = info.get("error")
+                    if error is None and "exception" in info:
+                        error = str(info["exception"])
+                    record_error(info.get("_id"), info.get("status"), error)
+            except Exception as e:
+                # worker가 중단되어도 producer가 막히지 않도록 남은 action을 소진
+                record_error(None, None, str(e))
+                while await queue.get() is not _BULK_DONE:
+                    summary["failed"] += 1
+
+        workers = [asyncio.create_task(worker()) for _ in range(concurrency)]
+        try:
+            async for action in actions:
+                action.setdefault("_index", self.index_name)
+                summary["total"] += 1
+                await queue.put(action)
+        finally:
+            for _ in workers:
+                await queue.put(_BULK_DONE)
+            await asyncio.gather(*workers)
+
+        return summary
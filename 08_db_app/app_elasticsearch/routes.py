@@ -1,49 +1,139 @@
-from fastapi import APIRouter, Depends
-from app_elasticsearch.service import get_es_client
-from app_elasticsearch.service import get_es_service
-from app_elasticsearch.models import ProductCreate, ProductUpdate, ProductSearchQuery
+from fastapi import APIRouter, Depends, Request, Query
+from app_elasticsearch.service import ElasticsearchService, get_es_service
+from app_elasticsearch.service import BULK_CHUNK_SIZE, BULK_MAX_CHUNK_BYTES, BULK_CONCURRENCY, BULK_MAX_RETRIES
+from app_elasticsearch.service import EXPORT_BATCH_SIZE
+from app_elasticsearch.models import ProductCreate, ProductUpdate, ProductSearchQuery, ProductBulkItem, ProductBatchQuery
+from app_elasticsearch.models import ProductIncrement, ProductBulkUpdate
+from common.ndjson_helper import iter_request_rows, bulk_request_body
 from typing import Optional
 
 es_router = APIRouter()
-service = get_es_service()
 
+# app lifespan에서 생성되는 공유 service (client/connection pool 하나를 재사용)
+es_service = Depends(get_es_service)
 
-# Close Elasticsearch on application shutdown
-@es_router.on_event("shutdown")
-async def shutdown_event():
-    await get_es_client().close()
 
+# Cluster health + connection pool 사용량
+@es_router.get("/health")
+async def health(service: ElasticsearchService = es_service):
+    return await service.health()
 
+
+# 상품 목록: data는 상품 list, 전체 건수는 X-Total-Count, 다음 페이지 cursor는 X-Next-Cursor header
 @es_router.get("/products")
-async def get_all_products():
-    return await service.get_all_products()
+async def get_all_products(
+    size: int = Query(10, ge=0, le=1000),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    use_pit: bool = Query(False, description="start point-in-time cursor pagination"),
+    service: ElasticsearchService = es_service
+):
+    return await service.get_all_products(size=size, cursor=cursor, use_pit=use_pit)
+
+
+# 전체 상품 NDJSON export (point-in-time + search_after, scroll 미사용)
+@es_router.get("/products/export")
+async def export_products(
+    batch_size: int = Query(EXPORT_BATCH_SIZE, ge=1, le=10000),
+    service: ElasticsearchService = es_service
+):
+    return service.export_products(batch_size)
 
 
 @es_router.post("/products")
-async def add_products(product: ProductCreate, doc_id: Optional[str] = None):
+async def add_products(product: ProductCreate, doc_id: Optional[str] = None, service: ElasticsearchService = es_service):
     result = await service.create_product(doc_id, product)
     return result
 
 
+# Bulk indexing: JSON array 또는 NDJSON stream (application/x-ndjson)
+@es_router.post("/products/bulk", openapi_extra=bulk_request_body(ProductBulkItem))
+async def bulk_add_products(
+    request: Request,
+    chunk_size: int = Query(BULK_CHUNK_SIZE, ge=1, le=10000),
+    max_chunk_bytes: int = Query(BULK_MAX_CHUNK_BYTES, ge=1024),
+    concurrency: int = Query(BULK_CONCURRENCY, ge=1, le=16),
+    max_retries: int = Query(BULK_MAX_RETRIES, ge=0, le=10),
+    service: ElasticsearchService = es_service
+):
+    rows = iter_request_rows(request)
+    return await service.bulk_index_products(rows, chunk_size, max_chunk_bytes, concurrency, max_retries)
+
+
+# Batched partial update: 여러 partial update/increment를 _bulk 요청으로 전송
+@es_router.put("/products/bulk", openapi_extra=bulk_request_body(ProductBulkUpdate))
+async def bulk_update_products(
+    request: Request,
+    chunk_size: int = Query(BULK_CHUNK_SIZE, ge=1, le=10000),
+    max_chunk_bytes: int = Query(BULK_MAX_CHUNK_BYTES, ge=1024),
+    concurrency: int = Query(BULK_CONCURRENCY, ge=1, le=16),
+    max_retries: int = Query(BULK_MAX_RETRIES, ge=0, le=10),
+    service: ElasticsearchService = es_service
+):
+    rows = iter_request_rows(request)
+    return await service.bulk_update_products(rows, chunk_size, max_chunk_bytes, concurrency, max_retries)
+
+
+# Multi-get: 여러 id를 한 번의 _mget으로 조회, 없는 id는 missing으로 반환
+@es_router.post("/products/batch")
+async def get_products_batch(query: ProductBatchQuery, service: ElasticsearchService = es_service):
+    return await service.get_products_by_ids(query.ids)
+
+
 @es_router.get("/products/{doc_id}")
-async def get_product(doc_id: str):
+async def get_product(doc_id: str, service: ElasticsearchService = es_service):
     result = await service.get_product_by_id(doc_id)
     return result
 
 
 @es_router.post("/search")
-async def search_documents(query: ProductSearchQuery):
+async def search_documents(query: ProductSearchQuery, service: ElasticsearchService = es_service):
     result = await service.search(query)
     return result
 
 
+# 자동완성: 검색창 keystroke 마다 호출 (completion suggester + prefix 캐시)
+@es_router.get("/suggest")
+async def suggest_products(
+    q: str = Query(..., min_length=1, max_length=100, description="입력 중인 상품명 prefix"),
+    size: int = Query(5, ge=1, le=20),
+    service: ElasticsearchService = es_service
+):
+    return await service.suggest(q, size)
+
+
+# 검색 템플릿 캐시 hit/miss
+@es_router.get("/search/cache-stats")
+async def search_cache_stats(service: ElasticsearchService = es_service):
+    return service.search_cache_stats()
+
+
+# if_seq_no/if_primary_term: GET 응답의 seq_no/primary_term, 그 사이 다른 수정이 있었으면 409
 @es_router.put("/products/{doc_id}")
-async def update_product(doc_id: str, product: ProductUpdate):
-    result = await service.update_product(doc_id, product)
+async def update_product(
+    doc_id: str,
+    product: ProductUpdate,
+    if_seq_no: Optional[int] = Query(None, ge=0),
+    if_primary_term: Optional[int] = Query(None, ge=1),
+    service: ElasticsearchService = es_service
+):
+    result = await service.update_product(doc_id, product, if_seq_no, if_primary_term)
+    return result
+
+
+# Counter update (stock/price 증감), script 기반
+@es_router.post("/products/{doc_id}/increment")
+async def increment_product(
+    doc_id: str,
+    increment: ProductIncrement,
+    if_seq_no: Optional[int] = Query(None, ge=0),
+    if_primary_term: Optional[int] = Query(None, ge=1),
+    service: ElasticsearchService = es_service
+):
+    result = await service.increment_product(doc_id, increment, if_seq_no, if_primary_term)
     return result
 
 
 @es_router.delete("/products/{doc_id}")
-async def delete_product(doc_id: str):
+async def delete_product(doc_id: str, service: ElasticsearchService = es_service):
     result = await service.delete_product(doc_id)
     return result
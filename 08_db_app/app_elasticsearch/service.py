@@ -1,45 +1,311 @@
 from dotenv import load_dotenv
+import asyncio
+import logging
 import os
+from contextlib import asynccontextmanager
 from fastapi import HTTPException
-from typing import Optional
-from common.get_conn import get_elasticsearch_client
-from app_elasticsearch.query_builder import QueryBuilder
+from fastapi.responses import StreamingResponse
+from elasticsearch import BadRequestError, ConflictError, NotFoundError
+from pydantic import ValidationError
+from typing import Any, AsyncIterator, Optional
+from common.get_conn import get_elasticsearch_client, get_elasticsearch_pool_stats
+from app_elasticsearch.query_builder import QueryBuilder, InvalidCursorError, SUGGEST_NAME, SUGGEST_FILTER_PATH
 from app_elasticsearch.repository import ElasticsearchRepository
-from app_elasticsearch.models import ProductResponse, ProductCreate, ProductUpdate, ProductSearchQuery
+from app_elasticsearch.models import ProductResponse, ProductCreate, ProductUpdate, ProductSearchQuery, ProductBulkItem
+from app_elasticsearch.models import ProductIncrement, ProductBulkUpdate
 from common.result_helper import create_response
+from common.ndjson_helper import ndjson_stream, NDJSON_MEDIA_TYPE
+from common.coalescer import RequestCoalescer
+from common.cache import LRUCache
+from app_elasticsearch.index_settings import (
+    BULK_LOAD_SETTINGS, WRITE_BLOCK_SETTING, products_template_name, products_index_template, new_index_name
+)
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+# Bulk indexing 기본값
+BULK_CHUNK_SIZE = int(os.getenv("ES_BULK_CHUNK_SIZE", 500))
+BULK_MAX_CHUNK_BYTES = int(os.getenv("ES_BULK_MAX_CHUNK_BYTES", 10 * 1024 * 1024))
+BULK_CONCURRENCY = int(os.getenv("ES_BULK_CONCURRENCY", 2))
+BULK_MAX_RETRIES = int(os.getenv("ES_BULK_MAX_RETRIES", 3))
+
+# Pagination / export
+PIT_KEEP_ALIVE = os.getenv("ES_PIT_KEEP_ALIVE", "1m")
+EXPORT_BATCH_SIZE = int(os.getenv("ES_EXPORT_BATCH_SIZE", 1000))
+# GET /products: data(list) 형태를 유지하기 위해 paging 정보는 header로 반환
+TOTAL_COUNT_HEADER = "X-Total-Count"
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+# 단건 조회 coalescing: window 안에 들어온 GET /products/{doc_id} 요청을 하나의 _mget으로 병합
+MGET_WINDOW_MS = float(os.getenv("ES_MGET_WINDOW_MS", 2))
+MGET_MAX_BATCH = int(os.getenv("ES_MGET_MAX_BATCH", 100))
+
+# OCC 없이 script update 시 version 충돌 재시도 횟수
+UPDATE_RETRY_ON_CONFLICT = int(os.getenv("ES_UPDATE_RETRY_ON_CONFLICT", 3))
+
+# Search projection: 기본 검색 응답이 사용하는 필드와 응답 JSON 경로
+SEARCH_DEFAULT_FIELDS = ["name", "category", "price", "description"]
+SEARCH_FILTER_PATH = "hits.total.value,hits.hits._id,hits.hits._source,hits.hits.sort,pit_id,aggregations"
+
+
+def _timeout(name: str) -> Optional[float]:
+    value = os.getenv(name)
+    return float(value) if value else None
+
+
+# 요청 종류별 timeout(초), 미설정 시 ELASTICSEARCH_REQUEST_TIMEOUT 사용
+REQUEST_TIMEOUTS = {
+    "search": _timeout("ES_SEARCH_TIMEOUT"),
+    "get": _timeout("ES_GET_TIMEOUT"),
+    "write": _timeout("ES_WRITE_TIMEOUT"),
+    "bulk": _timeout("ES_BULK_TIMEOUT"),
+    "suggest": _timeout("ES_SUGGEST_TIMEOUT"),
+}
+
+# 자동완성: 짧은 TTL의 in-process prefix 캐시
+SUGGEST_CACHE_TTL = float(os.getenv("ES_SUGGEST_CACHE_TTL", 30))
+SUGGEST_CACHE_SIZE = int(os.getenv("ES_SUGGEST_CACHE_SIZE", 2048))
+
+# process 당 하나의 client(= 하나의 connection pool)를 공유, app lifespan에서 생성/종료
+_es_client = None
+_es_service = None
+
 
 def get_es_client():
-    es_client = get_elasticsearch_client()
-    return es_client
+    global _es_client
+    if _es_client is None:
+        _es_client = get_elasticsearch_client()
+    return _es_client
 
 
 def get_es_service():
-    es_client = get_es_client()
-    products_index = os.getenv("PRODUCTS_INDEX", "products")
-    repository = ElasticsearchRepository(es_client, products_index)
-    return ElasticsearchService(repository)
+    global _es_service
+    if _es_service is None:
+        products_index = os.getenv("PRODUCTS_INDEX", "products")
+        timeouts = {kind: timeout for kind, timeout in REQUEST_TIMEOUTS.items() if timeout is not None}
+        repository = ElasticsearchRepository(get_es_client(), products_index, timeouts)
+        _es_service = ElasticsearchService(repository)
+    return _es_service
+
+
+async def close_es_client():
+    global _es_client, _es_service
+    if _es_client is not None:
+        await _es_client.close()
+    _es_client, _es_service = None, None
 
 
 class ElasticsearchService:
     def __init__(self, repository: ElasticsearchRepository):
         self.repo = repository
+        self.coalescer = RequestCoalescer(
+            self.repo.get_documents, window=MGET_WINDOW_MS / 1000, max_batch_size=MGET_MAX_BATCH
+        )
+        self.suggest_cache = LRUCache(max_size=SUGGEST_CACHE_SIZE)
+
+    async def bootstrap_index(self):
+        """
+        Put the products index template and make sure PRODUCTS_INDEX exists as an alias
+        over a "<alias>-<timestamp>" index, so later reindexing can swap it without read downtime.
+        """
+        alias = self.repo.index_name
+        await self.repo.put_index_template(products_template_name(alias), products_index_template(alias))
+        if await self.repo.get_alias_indices():
+            return
+        if await self.repo.index_exists(alias):
+            # 이전 버전이 dynamic mapping으로 만든 concrete index: reindex로 alias 구조로 이전
+            logger.warning("'%s' is a concrete index with dynamic mappings, run the reindex command to migrate it", alias)
+            return
+        index = new_index_name(alias)
+        await self.repo.create_index(index, aliases={alias: {}})
+        logger.info("Created index %s with alias %s", index, alias)
 
-    async def get_all_products(self):
-        query = {"match_all": {}}
-        response = await self.repo.search_documents(query)
-        product_list = response["hits"]["hits"]
+    @asynccontextmanager
+    async def bulk_load_mode(self, index: str = None):
+        """
+        Disable refresh and replicas while loading, then restore the previous values and refresh.
+        Settings are restored per backing index; run one bulk load at a time per index.
+        """
+        index = index or self.repo.index_name
+        original = await self.repo.get_index_settings(index, list(BULK_LOAD_SETTINGS))
+        await self.repo.put_index_settings(index, BULK_LOAD_SETTINGS)
+        try:
+            yield
+        finally:
+            # 명시적으로 설정되지 않았던 값은 None으로 되돌려 기본값 사용
+            for name, settings in original.items():
+                await self.repo.put_index_settings(name, {key: settings.get(key) for key in BULK_LOAD_SETTINGS})
+            await self.repo.refresh(index)
+
+    async def reindex(self, delete_old: bool = False, poll_interval: float = 5.0) -> dict:
+        """
+        Reindex: copy the alias into a new index built from the current template
+        (in bulk load mode), then atomically point the alias to it.
+        A concrete index named like the alias (dynamic mapping era) is replaced by the alias.
+        Reads keep working throughout. _reindex only copies the documents that exist when it starts,
+        so the source indices are write-blocked (index.blocks.write) until the swap: writes in that
+        window fail with 403 cluster_block_exception instead of being silently lost.
+        Pause writers (or let them retry) while this runs.
+        """
+        alias = self.repo.index_name
+        await self.repo.put_index_template(products_template_name(alias), products_index_template(alias))
+        old_indices = await self.repo.get_alias_indices()
+        legacy = not old_indices and await self.repo.index_exists(alias)
+        source = old_indices or [alias]
+
+        dest = new_index_name(alias)
+        await self.repo.create_index(dest)
+        await self.repo.put_index_settings(",".join(source), {WRITE_BLOCK_SETTING: True})
+        swapped = False
+        try:
+            async with self.bulk_load_mode(dest):
+                task_id = await self.repo.start_reindex(alias, dest)
+                while True:
+                    task = await self.repo.get_task(task_id)
+                    if task.get("completed"):
+                        break
+                    status = task["task"]["status"]
+                    logger.info("reindex %s -> %s: %s/%s", alias, dest, status.get("created", 0), status.get("total", 0))
+                    await asyncio.sleep(poll_interval)
+
+            result = task.get("response", {})
+            failures = result.get("failures", []) or ([task["error"]] if "error" in task else [])
+            summary = {
+                "source": source,
+                "dest": dest,
+                "total": result.get("total", 0),
+                "created": result.get("created", 0),
+                "failures": failures[:100],
+                "swapped": False,
+            }
+            if failures:
+                # alias는 기존 index를 계속 가리킴, 새 index는 확인 후 수동 삭제
+                return summary
+
+            actions = [{"add": {"index": dest, "alias": alias}}]
+            if legacy:
+                actions.append({"remove_index": {"index": alias}})
+            else:
+                actions += [{"remove": {"index": index, "alias": alias}} for index in old_indices]
+            await self.repo.update_aliases(actions)
+            swapped = summary["swapped"] = True
+        finally:
+            # swap으로 삭제된 legacy index를 제외하고 쓰기 차단 해제 (alias는 이미 새 index를 가리킴)
+            if not (legacy and swapped):
+                await self.repo.put_index_settings(",".join(source), {WRITE_BLOCK_SETTING: None})
+
+        summary["deleted"] = [alias] if legacy else list()
+        if delete_old and not legacy:
+            for index in old_indices:
+                await self.repo.delete_index(index)
+            summary["deleted"] = old_indices
+        return summary
+
+    async def health(self):
+        """Cluster health + connection pool usage of the shared client"""
+        pool = get_elasticsearch_pool_stats(self.repo.es_client)
+        try:
+            cluster = await self.repo.cluster_health()
+        except Exception as e:
+            data = {"status": "unavailable", "error": str(e), "pool": pool}
+            return create_response(result_code=503, data=data)
+
+        data = {
+            "status": cluster.get("status"),
+            "cluster_name": cluster.get("cluster_name"),
+            "number_of_nodes": cluster.get("number_of_nodes"),
+            "active_shards": cluster.get("active_shards"),
+            "pool": pool,
+            "mget": self.coalescer.stats,
+        }
+        return create_response(result_code=200, data=data)
+
+    async def get_all_products(self, size: int = 10, cursor: Optional[str] = None, use_pit: bool = False):
+        query = ProductSearchQuery(size=size, cursor=cursor, use_pit=use_pit)
+        response, next_cursor = await self._paged_search(query)
 
         data = list()
-        for product_data in product_list:
+        for product_data in response["hits"]["hits"]:
             product = product_data["_source"]
             product["id"] = product_data["_id"]
             validated_data = ProductResponse.model_validate(product)
             data.append(validated_data)
 
-        return create_response(result_code=200, data=data)
+        # data는 기존 client와 같은 상품 list 유지, 전체 건수와 다음 페이지 cursor는 header로 전달
+        result = create_response(result_code=200, data=data)
+        result.headers[TOTAL_COUNT_HEADER] = str(response["hits"]["total"]["value"])
+        if next_cursor:
+            result.headers[NEXT_CURSOR_HEADER] = next_cursor
+        return result
+
+    # 전체 상품 export: point-in-time + search_after 기반 NDJSON stream
+    def export_products(self, batch_size: int = EXPORT_BATCH_SIZE):
+        async def products():
+            async for hits in self.repo.iter_all(batch_size=batch_size, keep_alive=PIT_KEEP_ALIVE):
+                yield [{**hit["_source"], "id": hit["_id"]} for hit in hits]
+
+        return StreamingResponse(ndjson_stream(products()), media_type=NDJSON_MEDIA_TYPE)
+
+    async def _paged_search(self, query: ProductSearchQuery, **options):
+        """
+        Run a product search with size / search_after / point-in-time paging.
+        options: projection options passed to the repository (source_includes, filter_path, ...)
+        Returns the raw response and the next_cursor (None on the last page or without PIT).
+        """
+        pit_id, search_after = None, None
+        if query.cursor:
+            try:
+                pit_id, search_after = QueryBuilder.decode_cursor(query.cursor)
+            except InvalidCursorError as e:
+                raise HTTPException(status_code=400, detail=str(e))
+        elif query.use_pit and query.size > 0:
+            pit_id = await self.repo.open_point_in_time(PIT_KEEP_ALIVE)
+
+        # facet은 첫 페이지에서만 계산 (같은 point-in-time의 다음 페이지에서는 값이 동일)
+        aggs = None
+        if query.aggs and not query.cursor:
+            aggs = {name: agg.model_dump(by_alias=True) for name, agg in query.aggs.items()}
+
+        search_body = QueryBuilder.build_search_body(
+            query=query.query,
+            filters=query.filters,
+            sort_by=query.sort_by,
+            order=query.order or "desc",
+            size=query.size,
+            search_after=search_after,
+            pit_id=pit_id,
+            keep_alive=PIT_KEEP_ALIVE,
+            aggs=aggs
+        )
+        try:
+            response = await self.repo.search(search_body, **options)
+        except NotFoundError:
+            if pit_id:
+                raise HTTPException(status_code=410, detail="Cursor expired, start a new search")
+            raise
+        except BaseException:
+            # timeout/취소 등 다른 오류: 열린 PIT를 keep_alive까지 남겨두지 않고 닫은 뒤 다시 raise
+            if pit_id:
+                await self._close_pit_quietly(pit_id)
+            raise
+
+        next_cursor = None
+        if pit_id:
+            hits = response["hits"].get("hits", [])
+            pit_id = response.get("pit_id", pit_id)
+            if hits and len(hits) == query.size:
+                next_cursor = QueryBuilder.encode_cursor(pit_id, hits[-1]["sort"])
+            else:
+                await self.repo.close_point_in_time(pit_id)
+        return response, next_cursor
+
+    async def _close_pit_quietly(self, pit_id: str):
+        try:
+            await self.repo.close_point_in_time(pit_id)
+        except Exception as e:
+            logger.warning("Failed to close point in time: %s", e)
 
     async def create_product(self, doc_id: Optional[str], product: ProductCreate):
         product_data = product.model_dump()
@@ -49,17 +315,68 @@ class ElasticsearchService:
         return create_response(result_code=201, data="created")
 
     async def get_product_by_id(self, doc_id: str):
-        product = await self.repo.get_document(doc_id=doc_id)
-        if product is None:
+        document = await self.coalescer.load(doc_id)
+        if document is None:
             return create_response(result_code=404, data="Product not found")
-        return create_response(result_code=200, data=product)
+        return create_response(result_code=200, data=self._with_version(document))
+
+    async def get_products_by_ids(self, ids: list):
+        unique_ids = list(dict.fromkeys(ids))
+        documents = await self.repo.get_documents(unique_ids)
+
+        product_list = [{**self._with_version(documents[doc_id]), "id": doc_id} for doc_id in unique_ids if doc_id in documents]
+        missing = [doc_id for doc_id in unique_ids if doc_id not in documents]
+        return create_response(result_code=200, data={"list": product_list, "missing": missing})
+
+    @staticmethod
+    def _with_version(document: dict) -> dict:
+        # seq_no/primary_term: 다음 update의 if_seq_no/if_primary_term으로 전달 (optimistic concurrency)
+        return {**document["_source"], "seq_no": document["_seq_no"], "primary_term": document["_primary_term"]}
 
-    async def update_product(self, doc_id: str, product: ProductUpdate):
+    async def update_product(
+        self,
+        doc_id: str,
+        product: ProductUpdate,
+        if_seq_no: Optional[int] = None,
+        if_primary_term: Optional[int] = None
+    ):
+        # detect_noop: 값이 같으면 색인/refresh 없이 "noop"으로 끝남 (정상 응답)
         update_data = product.model_dump(exclude_unset=True)
-        response = await self.repo.update_document(doc_id, {"doc": update_data})
-        if response["result"] != "updated":
+        body = {"doc": update_data, "detect_noop": True}
+        response = await self._update(doc_id, body, if_seq_no, if_primary_term)
+        if response["result"] not in ("updated", "noop"):
             raise HTTPException(status_code=500, detail="Failed to update product")
-        return create_response(result_code=200, data="updated")
+        return create_response(result_code=200, data=self._update_result(response))
+
+    async def increment_product(
+        self,
+        doc_id: str,
+        increment: ProductIncrement,
+        if_seq_no: Optional[int] = None,
+        if_primary_term: Optional[int] = None
+    ):
+        """Add to stock/price server-side, so concurrent counter updates are not lost"""
+        increments = increment.model_dump(exclude_none=True)
+        body = QueryBuilder.build_increment_script(increments)
+        response = await self._update(doc_id, body, if_seq_no, if_primary_term, retry_on_conflict=UPDATE_RETRY_ON_CONFLICT)
+        if response["result"] == "noop":
+            # script가 변경을 거부한 경우: 재고 부족
+            raise HTTPException(status_code=409, detail="Insufficient stock")
+        return create_response(result_code=200, data=self._update_result(response))
+
+    async def _update(self, doc_id: str, body: dict, if_seq_no, if_primary_term, retry_on_conflict: int = None):
+        try:
+            return await self.repo.update_document(
+                doc_id, body, if_seq_no=if_seq_no, if_primary_term=if_primary_term, retry_on_conflict=retry_on_conflict
+            )
+        except NotFoundError:
+            raise HTTPException(status_code=404, detail="Product not found")
+        except ConflictError:
+            raise HTTPException(status_code=409, detail="Product was modified by another request, reload and retry")
+
+    @staticmethod
+    def _update_result(response) -> dict:
+        return {"result": response["result"], "seq_no": response["_seq_no"], "primary_term": response["_primary_term"]}
 
     async def delete_product(self, doc_id: str):
         response = await self.repo.delete_document(doc_id)
@@ -67,25 +384,151 @@ class ElasticsearchService:
             raise HTTPException(status_code=404, detail="Product not found")
         return create_response(result_code=200, data="Product deleted successfully")
 
+    async def suggest(self, prefix: str, size: int = 5):
+        """Product name autocomplete; hot prefixes are served from the in-process cache"""
+        prefix = " ".join(prefix.lower().split())
+        if not prefix:
+            return create_response(result_code=200, data={"list": []})
+        key = f"{size}:{prefix}"
+        suggestions = self.suggest_cache.get(key)
+        if suggestions is None:
+            try:
+                response = await self.repo.suggest(QueryBuilder.build_suggest_body(prefix, size), filter_path=SUGGEST_FILTER_PATH)
+            except BadRequestError as e:
+                # 이전 dynamic mapping index: name.suggest가 completion 필드가 아님
+                logger.warning("suggest failed, is the products index migrated? %s", e)
+                raise HTTPException(
+                    status_code=409,
+                    detail="Products index has no completion mapping, run: python -m app_elasticsearch.index_cli reindex"
+                )
+            options = response.get("suggest", {}).get(SUGGEST_NAME, [{}])[0].get("options", [])
+            suggestions = [{"id": option["_id"], "name": option["text"]} for option in options]
+            self.suggest_cache.set(key, suggestions, SUGGEST_CACHE_TTL)
+        return create_response(result_code=200, data={"list": suggestions})
+
     async def search(self, query: ProductSearchQuery):
-        search_query = QueryBuilder.build_search_query(
-            query=query.query,
-            filters=query.filters,
-            sort_by=query.sort_by,
-            order=query.order or "desc"
+        # _source에서 필요한 필드만 받고, filter_path로 응답 JSON 자체도 축소
+        # size=0: hit 없이 total/facet만 계산 (count-only widget)
+        includes = query.fields or SEARCH_DEFAULT_FIELDS
+        response, next_cursor = await self._paged_search(
+            query, source_includes=includes, filter_path=SEARCH_FILTER_PATH
         )
-        response = await self.repo.search_documents(query=search_query.to_dict()["query"])
         total = response["hits"]["total"]["value"]
-        product_list = [
-            ProductResponse(
-                id=hit["_id"],
-                name=hit["_source"]["name"],
-                category=hit["_source"]["category"],
-                price=hit["_source"]["price"],
-                description=hit["_source"].get("description"),
-            )
-            for hit in response["hits"]["hits"]
-        ]
+        hits = response["hits"].get("hits", [])
 
-        data = {"total": total, "list": product_list}
+        if query.fields:
+            # 요청한 필드만 반환
+            product_list = [{"id": hit["_id"], **hit.get("_source", {})} for hit in hits]
+        else:
+            product_list = [
+                ProductResponse(
+                    id=hit["_id"],
+                    name=hit["_source"]["name"],
+                    category=hit["_source"]["category"],
+                    price=hit["_source"]["price"],
+                    description=hit["_source"].get("description"),
+                )
+                for hit in hits
+            ]
+
+        data = {"total": total, "list": product_list, "next_cursor": next_cursor}
+        if "aggregations" in response:
+            data["aggregations"] = QueryBuilder.parse_aggregations(response["aggregations"])
         return create_response(result_code=200, data=data)
+
+    def search_cache_stats(self):
+        """Compiled search template cache hit/miss"""
+        return create_response(result_code=200, data=QueryBuilder.cache_stats())
+
+    async def bulk_index_products(
+        self,
+        rows: AsyncIterator[Any],
+        chunk_size: int = BULK_CHUNK_SIZE,
+        max_chunk_bytes: int = BULK_MAX_CHUNK_BYTES,
+        concurrency: int = BULK_CONCURRENCY,
+        max_retries: int = BULK_MAX_RETRIES
+    ):
+        summary = await self.index_products(rows, chunk_size, max_chunk_bytes, concurrency, max_retries)
+        return create_response(result_code=200, data=summary)
+
+    async def index_products(self, rows: AsyncIterator[Any], chunk_size: int, max_chunk_bytes: int, concurrency: int, max_retries: int) -> dict:
+        """Validate rows as ProductBulkItem and stream them to the _bulk API (shared by the API and the CLI)"""
+        def to_action(product: ProductBulkItem) -> dict:
+            action = {"_source": product.model_dump(exclude={"id"})}
+            if product.id:
+                action["_id"] = product.id
+            return action
+
+        return await self._run_bulk(rows, ProductBulkItem, to_action, chunk_size, max_chunk_bytes, concurrency, max_retries)
+
+    async def bulk_update_products(
+        self,
+        rows: AsyncIterator[Any],
+        chunk_size: int = BULK_CHUNK_SIZE,
+        max_chunk_bytes: int = BULK_MAX_CHUNK_BYTES,
+        concurrency: int = BULK_CONCURRENCY,
+        max_retries: int = BULK_MAX_RETRIES
+    ):
+        """
+        Many partial updates in _bulk requests: doc updates (detect_noop) or increments (script).
+        noop counts unchanged documents. Stock decrements rejected by the script are failures
+        (status 409, per id in errors).
+        """
+        # increment script의 noop은 "재고 부족" 거부 (같은 id에 doc update와 increment를 섞으면 구분 불가)
+        increment_ids = set()
+
+        def to_action(update: ProductBulkUpdate) -> dict:
+            action = {"_op_type": "update", "_id": update.id}
+            if update.increment:
+                increment_ids.add(update.id)
+                action.update(QueryBuilder.build_increment_script(update.increment.model_dump(exclude_none=True)))
+            else:
+                fields = update.model_dump(exclude_unset=True, exclude={"id", "increment", "if_seq_no", "if_primary_term"})
+                action.update({"doc": fields, "detect_noop": True})
+            if update.if_seq_no is not None:
+                action.update({"if_seq_no": update.if_seq_no, "if_primary_term": update.if_primary_term})
+            elif update.increment:
+                action["retry_on_conflict"] = UPDATE_RETRY_ON_CONFLICT
+            return action
+
+        summary = await self._run_bulk(
+            rows, ProductBulkUpdate, to_action, chunk_size, max_chunk_bytes, concurrency, max_retries,
+            noop_rejected=increment_ids.__contains__
+        )
+        summary["updated"] = summary.pop("indexed") - summary["noop"]
+        return create_response(result_code=200, data=summary)
+
+    async def _run_bulk(
+        self, rows: AsyncIterator[Any], model, to_action, chunk_size, max_chunk_bytes, concurrency, max_retries, noop_rejected=None
+    ) -> dict:
+        """Validate each row with model, turn it into a bulk action and stream the actions to the _bulk API"""
+        invalid = list()
+
+        async def actions():
+            index = 0
+            async for raw in rows:
+                try:
+                    if isinstance(raw, (bytes, str)):
+                        row = model.model_validate_json(raw)
+                    else:
+                        row = model.model_validate(raw)
+                except ValidationError as e:
+                    invalid.append({"index": index, "id": None, "status": 400, "error": str(e)})
+                    continue
+                finally:
+                    index += 1
+
+                yield to_action(row)
+
+        summary = await self.repo.bulk_index(
+            actions(),
+            chunk_size=chunk_size,
+            max_chunk_bytes=max_chunk_bytes,
+            concurrency=concurrency,
+            max_retries=max_retries,
+            noop_rejected=noop_rejected
+        )
+        summary["total"] += len(invalid)
+        summary["failed"] += len(invalid)
+        summary["errors"] = invalid[:100] + summary["errors"]
+        return summary
@@ -0,0 +1,65 @@
+from app_mariadb.repository import MariaDBRepository
+from app_mariadb.schemas import ItemResponse
+from common.cache import TieredCache
+from common.db_routing import primary_reads
+from common.unit_of_work import after_commit
+
+
+def item_cache_key(item_id: int) -> str:
+    return f"item:{item_id}"
+
+
+class CachedMariaDBRepository:
+    """
+    Cache layer between MariaDBService and MariaDBRepository.
+    - get_by_id: read-through (LRU -> backend -> primary DB, single-flight)
+    - create: write-through
+    - update/delete/bulk: invalidate
+    Cache writes run after the request's unit of work commits, so a rolled back
+    change never reaches the cache. Methods without caching concerns pass through.
+    """
+
+    def __init__(self, repository: MariaDBRepository, cache: TieredCache, ttl: float = None):
+        self.repo = repository
+        self.cache = cache
+        self.ttl = ttl
+
+    def __getattr__(self, name):
+        return getattr(self.repo, name)
+
+    async def get_by_id(self, item_id: int):
+        async def load():
+            # miss는 primary에서 로드: 무효화 직후 지연된 replica의 이전 row가 TTL 동안 다시 캐시되지 않도록
+            with primary_reads():
+                item = await self.repo.get_by_id(item_id)
+            return ItemResponse.model_validate(item).model_dump() if item else None
+
+        return await self.cache.get_or_load(item_cache_key(item_id), load, ttl=self.ttl)
+
+    async def create(self, item: dict):
+        new_item = await self.repo.create(item)
+        data = ItemResponse.model_validate(new_item).model_dump()
+        await after_commit(lambda: self.cache.set(item_cache_key(new_item.id), data, ttl=self.ttl))
+        return new_item
+
+    async def update(self, item_id: int, updates: dict):
+        updated_item = await self.repo.update(item_id, updates)
+        await after_commit(lambda: self.cache.invalidate(item_cache_key(item_id)))
+        return updated_item
+
+    async def delete(self, item_id: int):
+        deleted = await self.repo.delete(item_id)
+        await after_commit(lambda: self.cache.invalidate(item_cache_key(item_id)))
+        return deleted
+
+    async def bulk_update(self, items: list[dict]) -> set:
+        updated = await self.repo.bulk_update(items)
+        keys = [item_cache_key(item_id) for item_id in updated]
+        await after_commit(lambda: self.cache.invalidate(*keys))
+        return updated
+
+    async def bulk_delete(self, ids: list[int]) -> set:
+        deleted = await self.repo.bulk_delete(ids)
+        keys = [item_cache_key(item_id) for item_id in deleted]
+        await after_commit(lambda: self.cache.invalidate(*keys))
+        return deleted
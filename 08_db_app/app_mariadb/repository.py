@@ -1,19 +1,31 @@
-from sqlalchemy.ext.asyncio import async_sessionmaker
+from typing import Optional
+
 from sqlalchemy.future import select
-from sqlalchemy import update, delete
+from sqlalchemy import update, delete, insert
 
-from common.get_conn import get_mariadb_engine_async
+from common.get_conn import get_mariadb_engine_async, get_mariadb_replica_engines_async, get_mariadb_replica_strategy
+from common.db_routing import async_routing_sessionmaker, use_primary
+from common.unit_of_work import session_scope
 from app_mariadb.models import Base, Item
 
 engine = get_mariadb_engine_async()
+replica_engines = get_mariadb_replica_engines_async()
+# 읽기(get_all, get_by_id, stream_all)는 replica, 쓰기와 쓰기 이후 읽기는 primary
+SessionLocal = async_routing_sessionmaker(
+    engine, replica_engines, get_mariadb_replica_strategy(), expire_on_commit=False
+)
 
 
 class MariaDBRepository:
     def __init__(self):
         self.engine = engine
-        self.SessionLocal = async_sessionmaker(bind=self.engine, expire_on_commit=False)
+        self.SessionLocal = SessionLocal
         # self.initialize_database()  # In Production, not recommend. change it: @router.on_event("startup")
 
+    def session_scope(self):
+        """Share the request's unit of work session if one is active (see common.unit_of_work)"""
+        return session_scope(self.SessionLocal)
+
     async def initialize_database(self):
         """
         Initialize the database by creating tables if they do not exist.
@@ -23,39 +35,115 @@ class MariaDBRepository:
             print("Tables created successfully.")
 
     async def get_all(self):
-        async with self.SessionLocal() as session:
+        async with self.session_scope() as session:
             result = await session.execute(select(Item))
             return result.scalars().all()
 
-    async def create(self, item: dict):
+    async def stream_all(self, batch_size: int = 1000):
+        """
+        Yield every item as row mappings, batch by batch, from a server-side cursor.
+        Owns its session: the response body is still streaming after the request's unit of work ends.
+        """
+        stmt = select(Item.id, Item.name, Item.description).order_by(Item.id).execution_options(yield_per=batch_size)
         async with self.SessionLocal() as session:
+            result = await session.stream(stmt)
+            async for partition in result.mappings().partitions():
+                yield partition
+
+    async def create(self, item: dict):
+        async with self.session_scope() as session:
             new_item = Item(**item)
             session.add(new_item)
-            await session.commit()
-            await session.refresh(new_item)
+            await session.flush()  # INSERT -> primary key populated, no extra SELECT
             return new_item
 
     async def get_by_id(self, item_id: int):
-        async with self.SessionLocal() as session:
-            result = await session.execute(select(Item).where(Item.id == item_id))
-            return result.scalar_one_or_none()
+        async with self.session_scope() as session:
+            return await session.get(Item, item_id)
 
     async def update(self, item_id: int, updates: dict):
-        async with self.SessionLocal() as session:
-            stmt = (
-                update(Item)
-                .where(Item.id == item_id)
-                .values(**updates)
-                .execution_options(synchronize_session="fetch")
-            )
-            _ = await session.execute(stmt)
-            await session.commit()
-            # Return the updated item
-            return await self.get_by_id(item_id)
+        async with self.session_scope() as session:
+            if not updates:
+                return await session.get(Item, item_id)
+
+            # UPDATE ... RETURNING: 수정된 row를 같은 round-trip에서 반환
+            if self.engine.dialect.update_returning:
+                stmt = (
+                    update(Item)
+                    .where(Item.id == item_id)
+                    .values(**updates)
+                    .returning(Item)
+                    .execution_options(synchronize_session="fetch")
+                )
+                result = await session.execute(stmt)
+                return result.scalar_one_or_none()
+
+            # MariaDB has no UPDATE ... RETURNING: load into the identity map and flush the change
+            # (수정할 row는 replica 지연과 무관하게 primary에서 읽음)
+            use_primary(session)
+            item = await session.get(Item, item_id)
+            if item is None:
+                return None
+            for key, value in updates.items():
+                setattr(item, key, value)
+            return item
 
     async def delete(self, item_id: int):
-        async with self.SessionLocal() as session:
+        async with self.session_scope() as session:
             stmt = delete(Item).where(Item.id == item_id)
             result = await session.execute(stmt)
-            await session.commit()
             return result.rowcount > 0
+
+    # Bulk: 청크 단위 한 트랜잭션, executemany 기반
+    async def bulk_create(self, items: list[dict]) -> Optional[list]:
+        """
+        Insert a chunk of items in one transaction.
+        Returns the new ids in input order, or None if the dialect has no INSERT ... RETURNING (MySQL, MariaDB < 10.5).
+        """
+        dialect = self.engine.dialect
+        async with self.SessionLocal.begin() as session:
+            if dialect.insert_executemany_returning:
+                stmt = insert(Item).returning(Item.id, sort_by_parameter_order=True)
+                result = await session.scalars(stmt, items)
+                return list(result.all())
+            if dialect.insert_returning:
+                # MariaDB 10.5+: executemany RETURNING 미지원 -> multi-row INSERT ... VALUES ... RETURNING 한 문장
+                # 한 문장 안의 auto increment id는 VALUES 순서대로 증가 (interleaved lock mode에서도) -> 정렬하면 입력 순서
+                result = await session.scalars(insert(Item).values(items).returning(Item.id))
+                return sorted(result.all())
+            await session.execute(insert(Item), items)
+            return None
+
+    async def bulk_update(self, items: list[dict]) -> set:
+        """
+        Update a chunk of items (each dict carries its primary key "id") in one transaction
+        (the request's unit of work if one is active, so cache invalidation follows its commit).
+        Returns the ids that existed and were updated.
+        """
+        ids = [item["id"] for item in items]
+        async with self.session_scope() as session:
+            use_primary(session)
+            result = await session.execute(select(Item.id).where(Item.id.in_(ids)))
+            existing = set(result.scalars().all())
+            # 변경할 컬럼이 없는 row는 빈 SET 절이 되므로 제외
+            rows = [item for item in items if item["id"] in existing and len(item) > 1]
+            if rows:
+                # ORM bulk UPDATE by primary key -> executemany
+                await session.execute(update(Item), rows)
+            return existing
+
+    async def bulk_delete(self, ids: list[int]) -> set:
+        """
+        Delete a chunk of items in one transaction (the request's unit of work if one is active).
+        Returns the ids that existed and were deleted.
+        """
+        async with self.session_scope() as session:
+            if self.engine.dialect.delete_returning:
+                result = await session.execute(delete(Item).where(Item.id.in_(ids)).returning(Item.id))
+                return set(result.scalars().all())
+            use_primary(session)
+            result = await session.execute(select(Item.id).where(Item.id.in_(ids)))
+            existing = set(result.scalars().all())
+            if existing:
+                await session.execute(delete(Item).where(Item.id.in_(existing)))
+            return existing
@@ -1,16 +1,17 @@
 from sqlalchemy import inspect
-from sqlalchemy.orm import sessionmaker
 
-from common.get_conn import get_mariadb_engine_sync
+from common.get_conn import get_mariadb_engine_sync, get_mariadb_replica_engines_sync, get_mariadb_replica_strategy
+from common.db_routing import routing_sessionmaker
 from app_mariadb.models import Base, Item
 
 engine = get_mariadb_engine_sync()
+replica_engines = get_mariadb_replica_engines_sync()
 
 
 class MariaDBRepository:
     def __init__(self):
         self.engine = engine
-        self.SessionLocal = sessionmaker(bind=self.engine)
+        self.SessionLocal = routing_sessionmaker(self.engine, replica_engines, get_mariadb_replica_strategy())
         self.initialize_database()
 
     def initialize_database(self):
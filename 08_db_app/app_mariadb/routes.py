@@ -1,37 +1,73 @@
-from fastapi import APIRouter
-from app_mariadb.service import MariaDBService
-from app_mariadb.schemas import ItemCreate, ItemUpdate
+from fastapi import APIRouter, Request, Query, Depends
+from app_mariadb.service import MariaDBService, BULK_CHUNK_SIZE, EXPORT_BATCH_SIZE, get_item_cache
+from app_mariadb.schemas import ItemCreate, ItemUpdate, ItemBulkUpdate, ItemBulkDelete
+from app_mariadb.repository import SessionLocal
+from common.ndjson_helper import iter_request_rows, bulk_request_body
+from common.unit_of_work import unit_of_work_dependency
 
 mariadb_router = APIRouter()
-service = MariaDBService()
+service = MariaDBService(cache=get_item_cache())
 
+# 요청 단위 Unit of Work: 한 요청의 repository 호출이 하나의 세션/커넥션을 공유
+# (bulk 엔드포인트는 청크마다 별도 트랜잭션을 쓰므로 제외)
+unit_of_work = Depends(unit_of_work_dependency(SessionLocal))
 
-@mariadb_router.on_event("startup")
-async def startup_event():
-    await service.init_db()
-    print("Database initialization completed.")
 
+# Connection pool 사용량 및 checkout 대기 시간
+@mariadb_router.get("/pool")
+async def pool_stats():
+    return service.pool_stats()
 
-@mariadb_router.get("/items")
-async def get_items():
+
+# stream=true 이면 get_all 대신 streaming export 사용
+@mariadb_router.get("/items", dependencies=[unit_of_work])
+async def get_items(stream: bool = Query(False, description="stream every item as a chunked JSON envelope")):
+    if stream:
+        return service.export_items("json")
     return await service.get_all_items()
 
 
-@mariadb_router.post("/items")
+# Streaming export (NDJSON 또는 chunked JSON envelope), server-side cursor 기반
+@mariadb_router.get("/items/export")
+async def export_items(
+    format: str = Query("ndjson", pattern="^(ndjson|json)$"),
+    batch_size: int = Query(EXPORT_BATCH_SIZE, ge=1, le=10000)
+):
+    return service.export_items(format, batch_size)
+
+
+@mariadb_router.post("/items", dependencies=[unit_of_work])
 async def create_item(item: ItemCreate):
     return await service.create_item(item)
 
 
-@mariadb_router.get("/items/{item_id}")
+# Bulk: JSON array 또는 NDJSON stream (application/x-ndjson)
+# - "/items/{item_id}" 보다 먼저 등록해야 "bulk"가 item_id로 매칭되지 않음
+@mariadb_router.post("/items/bulk", openapi_extra=bulk_request_body(ItemCreate))
+async def bulk_create_items(request: Request, chunk_size: int = Query(BULK_CHUNK_SIZE, ge=1, le=10000)):
+    return await service.bulk_create_items(iter_request_rows(request), chunk_size)
+
+
+@mariadb_router.put("/items/bulk", openapi_extra=bulk_request_body(ItemBulkUpdate))
+async def bulk_update_items(request: Request, chunk_size: int = Query(BULK_CHUNK_SIZE, ge=1, le=10000)):
+    return await service.bulk_update_items(iter_request_rows(request), chunk_size)
+
+
+@mariadb_router.delete("/items/bulk", openapi_extra=bulk_request_body(ItemBulkDelete))
+async def bulk_delete_items(request: Request, chunk_size: int = Query(BULK_CHUNK_SIZE, ge=1, le=10000)):
+    return await service.bulk_delete_items(iter_request_rows(request), chunk_size)
+
+
+@mariadb_router.get("/items/{item_id}", dependencies=[unit_of_work])
 async def get_item(item_id: int):
     return await service.get_item_by_id(item_id)
 
 
-@mariadb_router.put("/items/{item_id}")
+@mariadb_router.put("/items/{item_id}", dependencies=[unit_of_work])
 async def update_item(item_id: int, item: ItemUpdate):
     return await service.update_item(item_id, item)
 
 
-@mariadb_router.delete("/items/{item_id}")
+@mariadb_router.delete("/items/{item_id}", dependencies=[unit_of_work])
 async def delete_item(item_id: int):
     return await service.delete_item(item_id)
@@ -1,6 +1,6 @@
 from pydantic import BaseModel
-from pydantic import ConfigDict
-from typing import Optional
+from pydantic import ConfigDict, model_validator
+from typing import Optional, List
 
 
 # 요청용 모델 (Create/Update)
@@ -14,6 +14,30 @@ class ItemUpdate(BaseModel):
     description: Optional[str] = None
 
 
+# 대량 처리 요청용 모델 (Bulk)
+class ItemBulkUpdate(ItemUpdate):
+    id: int
+
+    # id만 있는 row는 SET 절이 비어 UPDATE 불가 -> 검증 단계에서 row 단위 오류로 처리
+    @model_validator(mode="after")
+    def check_not_empty(self):
+        if not self.model_fields_set - {"id"}:
+            raise ValueError("update needs at least one field besides 'id'")
+        return self
+
+
+class ItemBulkDelete(BaseModel):
+    id: int
+
+    # [1, 2, 3] 형태의 id 목록도 허용
+    @model_validator(mode="before")
+    @classmethod
+    def accept_plain_id(cls, value):
+        if isinstance(value, int):
+            return {"id": value}
+        return value
+
+
 # 응답용 모델
 # from_attributes = True: SQLAlchemy 모델 객체를 Pydantic 모델로 변환할 수 있도록 설정.
 class ItemResponse(BaseModel):
@@ -22,3 +46,19 @@ class ItemResponse(BaseModel):
     description: Optional[str] = None
 
     model_config = ConfigDict(from_attributes=True)
+
+
+# 대량 처리 결과: 요청 row 순서(index) 기준 per-row 결과
+# (id를 돌려받을 수 없는 DB의 bulk create는 성공 row를 건수에만 포함)
+class BulkItemResult(BaseModel):
+    index: int
+    id: Optional[int] = None
+    status: str  # created | updated | deleted | not_found | error
+    error: Optional[str] = None
+
+
+class BulkResult(BaseModel):
+    total: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    results: List[BulkItemResult] = []
@@ -1,21 +1,95 @@
+import logging
+import os
 from fastapi import HTTPException
-from app_mariadb.repository import MariaDBRepository
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, ValidationError
+from sqlalchemy.exc import SQLAlchemyError
+from typing import Any, AsyncIterator, Optional, Type
+from app_mariadb.repository import MariaDBRepository, replica_engines
+from app_mariadb.cached_repository import CachedMariaDBRepository
 from app_mariadb.schemas import ItemCreate, ItemUpdate, ItemResponse
+from app_mariadb.schemas import ItemBulkUpdate, ItemBulkDelete, BulkItemResult, BulkResult
+from common.ndjson_helper import iter_chunks, ndjson_stream, json_envelope_stream, NDJSON_MEDIA_TYPE
 from common.result_helper import create_response
+from common.cache import TieredCache, InMemoryCacheBackend, RedisCacheBackend
+from common.get_conn import get_redis_client_async
+from common.pool_metrics import get_pool_stats
+
+logger = logging.getLogger(__name__)
+
+BULK_CHUNK_SIZE = int(os.getenv("MARIADB_BULK_CHUNK_SIZE", 500))
+# 실패한 청크의 row에 반환하는 오류 (DB 오류 원문은 log에만 기록)
+BULK_CHUNK_ERROR = "database error, chunk rolled back"
+EXPORT_BATCH_SIZE = int(os.getenv("MARIADB_EXPORT_BATCH_SIZE", 1000))
+
+
+def get_item_cache() -> Optional[TieredCache]:
+    """
+    Item cache from environment variables.
+    ITEM_CACHE_BACKEND: redis (default) | memory | none
+    """
+    backend_name = os.getenv("ITEM_CACHE_BACKEND", "redis").lower()
+    if backend_name == "none":
+        return None
+    if backend_name == "memory":
+        backend = InMemoryCacheBackend()
+    else:
+        redis_client = get_redis_client_async(
+            host=os.getenv("REDIS_HOST", "localhost"),
+            port=int(os.getenv("REDIS_PORT", 6379)),
+            db=int(os.getenv("REDIS_DB", 0))
+        )
+        backend = RedisCacheBackend(redis_client, prefix="mariadb:")
+
+    return TieredCache(
+        backend,
+        default_ttl=float(os.getenv("ITEM_CACHE_TTL", 60)),
+        local_ttl=float(os.getenv("ITEM_CACHE_LOCAL_TTL", 5)),
+        local_max_size=int(os.getenv("ITEM_CACHE_LOCAL_SIZE", 1024))
+    )
+
+
+def validate_row(model: Type[BaseModel], raw: Any) -> BaseModel:
+    # NDJSON row는 bytes 그대로 전달되므로 JSON 파싱과 검증을 한 번에 수행
+    if isinstance(raw, (bytes, str)):
+        return model.model_validate_json(raw)
+    return model.model_validate(raw)
 
 
 class MariaDBService:
-    def __init__(self):
-        self.repo = MariaDBRepository()
+    def __init__(self, repo: MariaDBRepository = None, cache: Optional[TieredCache] = None):
+        self.repo = repo or MariaDBRepository()
+        # 캐시 계층: 테스트에서는 InMemoryCacheBackend 기반 TieredCache 주입
+        if cache is not None:
+            self.repo = CachedMariaDBRepository(self.repo, cache)
 
     async def init_db(self):
         await self.repo.initialize_database()
 
+    async def close_db(self):
+        # 종료 시 pool의 connection 정리
+        await self.repo.engine.dispose()
+        for engine in replica_engines:
+            await engine.dispose()
+
+    def pool_stats(self):
+        # pool 고갈 확인용: in_use / overflow / checkout 대기 시간
+        data = get_pool_stats(self.repo.engine)
+        data["replicas"] = [get_pool_stats(engine) for engine in replica_engines]
+        return create_response(result_code=200, data=data)
+
     async def get_all_items(self):
         items = await self.repo.get_all()
         data = [ItemResponse.model_validate(item) for item in items]
         return create_response(result_code=200, data=data)
 
+    # Streaming export: server-side cursor -> StreamingResponse, 메모리 사용량이 테이블 크기와 무관
+    def export_items(self, fmt: str = "ndjson", batch_size: int = EXPORT_BATCH_SIZE):
+        batches = self.repo.stream_all(batch_size=batch_size)
+        if fmt == "ndjson":
+            return StreamingResponse(ndjson_stream(batches), media_type=NDJSON_MEDIA_TYPE)
+        return StreamingResponse(json_envelope_stream(batches), media_type="application/json")
+
     async def create_item(self, item: ItemCreate):
         item_data = item.model_dump()
         new_item = await self.repo.create(item_data)
@@ -30,8 +104,8 @@ class MariaDBService:
         return create_response(result_code=200, data=data)
 
     async def update_item(self, item_id: int, item: ItemUpdate):
-        item_data = await item.model_dump(exclude_unset=True)  # Only include provided fields
-        updated_item = self.repo.update(item_id, item_data)
+        item_data = item.model_dump(exclude_unset=True)  # Only include provided fields
+        updated_item = await self.repo.update(item_id, item_data)
         if not updated_item:
             raise HTTPException(status_code=404, detail="Item not found")
 
@@ -45,3 +119,71 @@ class MariaDBService:
 
         data = {"message": "Item deleted successfully"}
         return create_response(result_code=200, data=data)
+
+    # Bulk: 요청 row를 청크로 묶어 청크당 한 트랜잭션으로 처리, per-row 결과 반환
+    async def bulk_create_items(self, rows: AsyncIterator[Any], chunk_size: int = BULK_CHUNK_SIZE):
+        async def apply(chunk):
+            ids = await self.repo.bulk_create([values for _, values in chunk])
+            if ids is None:
+                # INSERT ... RETURNING이 없는 DB: id를 알 수 없으므로 건수만 집계 (per-row 결과 생략)
+                return [BulkItemResult(index=index, status="created") for index, _ in chunk]
+            return [BulkItemResult(index=index, id=item_id, status="created") for (index, _), item_id in zip(chunk, ids)]
+
+        result = await self._run_bulk(rows, chunk_size, ItemCreate, lambda item: item.model_dump(), apply)
+        return create_response(result_code=200, data=result)
+
+    async def bulk_update_items(self, rows: AsyncIterator[Any], chunk_size: int = BULK_CHUNK_SIZE):
+        async def apply(chunk):
+            updated = await self.repo.bulk_update([values for _, values in chunk])
+            return [
+                BulkItemResult(index=index, id=values["id"], status="updated" if values["id"] in updated else "not_found")
+                for index, values in chunk
+            ]
+
+        result = await self._run_bulk(rows, chunk_size, ItemBulkUpdate, lambda item: item.model_dump(exclude_unset=True), apply)
+        return create_response(result_code=200, data=result)
+
+    async def bulk_delete_items(self, rows: AsyncIterator[Any], chunk_size: int = BULK_CHUNK_SIZE):
+        async def apply(chunk):
+            deleted = await self.repo.bulk_delete([item_id for _, item_id in chunk])
+            return [
+                BulkItemResult(index=index, id=item_id, status="deleted" if item_id in deleted else "not_found")
+                for index, item_id in chunk
+            ]
+
+        result = await self._run_bulk(rows, chunk_size, ItemBulkDelete, lambda item: item.id, apply)
+        return create_response(result_code=200, data=result)
+
+    async def _run_bulk(self, rows, chunk_size, model, to_values, apply) -> BulkResult:
+        """
+        Validate rows chunk by chunk and hand the valid ones to apply().
+        Invalid rows are reported individually; a failed chunk is rolled back, the database
+        error is logged and every row of that chunk is reported with a generic error.
+        Rows created without a known id are counted but not listed in results.
+        """
+        summary = BulkResult()
+        async for chunk in iter_chunks(rows, chunk_size):
+            valid = list()
+            for index, raw in chunk:
+                try:
+                    valid.append((index, to_values(validate_row(model, raw))))
+                except ValidationError as e:
+                    summary.results.append(BulkItemResult(index=index, status="error", error=str(e)))
+            if not valid:
+                continue
+
+            try:
+                summary.results.extend(await apply(valid))
+            except SQLAlchemyError:
+                logger.exception("Bulk chunk of %d rows starting at index %d failed", len(valid), valid[0][0])
+                summary.results.extend(
+                    BulkItemResult(index=index, status="error", error=BULK_CHUNK_ERROR) for index, _ in valid
+                )
+
+        summary.total = len(summary.results)
+        summary.succeeded = sum(1 for r in summary.results if r.status not in ("error", "not_found"))
+        summary.failed = summary.total - summary.succeeded
+        summary.results = sorted(
+            (r for r in summary.results if not (r.status == "created" and r.id is None)), key=lambda r: r.index
+        )
+        return summary
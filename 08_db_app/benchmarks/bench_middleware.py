@@ -0,0 +1,116 @@
+"""
+Timing middleware benchmark: BaseHTTPMiddleware vs pure ASGI
+
+- 같은 app(JSON 응답 + streaming 응답)에 middleware 없음 / BaseHTTPMiddleware / pure ASGI를 적용해 비교
+- uvicorn 없이 ASGI app을 직접 호출 -> 네트워크 비용을 빼고 middleware overhead만 측정
+- concurrency 만큼의 요청을 동시에 흘려 부하 상태의 req/s, p50/p99 측정
+
+run (08_db_app 디렉터리에서)
+    python -m benchmarks.bench_middleware [requests] [concurrency]
+"""
+import asyncio
+import sys
+import time
+
+from fastapi import FastAPI, Request
+from fastapi.responses import StreamingResponse
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from common.metrics import LatencyRegistry
+from common.timing_middleware import TimingMiddleware, route_template
+
+STREAM_CHUNKS = 16
+
+
+# 기존 구현: call_next 기반 (request마다 task + memory stream 추가)
+class BaseHTTPTimingMiddleware(BaseHTTPMiddleware):
+    def __init__(self, app, registry: LatencyRegistry):
+        super().__init__(app)
+        self.registry = registry
+
+    async def dispatch(self, request: Request, call_next):
+        start = time.perf_counter()
+        response = await call_next(request)
+        self.registry.observe(request.method, route_template(request.scope),
+                              response.status_code, time.perf_counter() - start)
+        return response
+
+
+def build_app(middleware=None) -> FastAPI:
+    app = FastAPI()
+    if middleware is not None:
+        app.add_middleware(middleware, registry=LatencyRegistry())
+
+    @app.get("/items/{item_id}")
+    async def get_item(item_id: int):
+        return {"id": item_id, "name": f"item-{item_id}"}
+
+    @app.get("/stream")
+    async def stream():
+        async def chunks():
+            for _ in range(STREAM_CHUNKS):
+                yield b"x" * 1024
+        return StreamingResponse(chunks())
+
+    return app
+
+
+async def call(app, path: str):
+    """Drive one request through the ASGI app and return its latency"""
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+        "scheme": "http", "path": path, "raw_path": path.encode(), "root_path": "", "query_string": b"",
+        "headers": [(b"host", b"bench")], "client": ("127.0.0.1", 0), "server": ("bench", 80),
+    }
+    request_sent = False
+
+    async def receive():
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await asyncio.sleep(3600)  # disconnect 대기: 응답이 끝나면 cancel 됨
+
+    async def send(message):
+        pass
+
+    start = time.perf_counter()
+    await app(scope, receive, send)
+    return time.perf_counter() - start
+
+
+async def run(app, path: str, total: int, concurrency: int):
+    queue = iter(range(total))
+    latencies = []
+
+    async def worker():
+        for _ in queue:
+            latencies.append(await call(app, path))
+
+    await call(app, path)  # warm-up (route/dependency 초기화)
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    return total / elapsed, latencies[len(latencies) // 2], latencies[int(len(latencies) * 0.99)]
+
+
+def main():
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    concurrency = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+
+    variants = (
+        ("no middleware", build_app()),
+        ("BaseHTTPMiddleware", build_app(BaseHTTPTimingMiddleware)),
+        ("pure ASGI", build_app(TimingMiddleware)),
+    )
+    for title, path in (("JSON response", "/items/1"), (f"streaming response ({STREAM_CHUNKS} chunks)", "/stream")):
+        print(f"# {title}, {total} requests, concurrency {concurrency}")
+        for label, app in variants:
+            rps, p50, p99 = asyncio.run(run(app, path, total, concurrency))
+            print(f"{label:<20} {rps:>10.0f} req/s   p50 {p50 * 1000:>7.3f} ms   p99 {p99 * 1000:>7.3f} ms")
+        print()
+
+
+if __name__ == "__main__":
+    main()
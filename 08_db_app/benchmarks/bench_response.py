@@ -0,0 +1,51 @@
+"""
+create_response micro-benchmark: ResponseResult + JSONResponse vs one-pass envelope (pydantic_core.to_json)
+
+run (08_db_app 디렉터리에서)
+    python -m benchmarks.bench_response [rows] [repeat]
+"""
+import sys
+import timeit
+from http import HTTPStatus
+
+from fastapi.responses import JSONResponse
+
+from app_mariadb.schemas import ItemResponse
+from common.response_model import ResponseResult
+from common.result_helper import create_response
+
+
+# 기존 구현: Pydantic envelope -> model_dump() -> stdlib json
+def legacy_create_response(result_code: int, data=None, result_msg: str = None) -> JSONResponse:
+    if not result_msg:
+        result_msg = HTTPStatus(result_code).phrase if result_code in HTTPStatus._value2member_map_ else "Unknown Status"
+    response = ResponseResult(result_code=result_code, result_msg=result_msg, data=data)
+    return JSONResponse(status_code=200, content=response.model_dump())
+
+
+def bench(label: str, func, payload, number: int):
+    seconds = min(timeit.repeat(lambda: func(result_code=200, data=payload), number=number, repeat=5))
+    per_call_us = seconds / number * 1_000_000
+    print(f"{label:<28} {per_call_us:>10.2f} us/response")
+    return per_call_us
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    number = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+
+    items = [ItemResponse(id=i, name=f"item-{i}", description="description " * 4) for i in range(rows)]
+    single = items[0]
+
+    # 두 구현의 출력이 동일한지 먼저 확인
+    assert legacy_create_response(200, items).body == create_response(200, items).body
+
+    for title, payload in ((f"list of {rows} items", items), ("single item", single), ("scalar id", 1)):
+        print(f"# {title}")
+        before = bench("ResponseResult+JSONResponse", legacy_create_response, payload, number)
+        after = bench("to_json envelope", create_response, payload, number)
+        print(f"{'speedup':<28} {before / after:>10.2f} x\n")
+
+
+if __name__ == "__main__":
+    main()
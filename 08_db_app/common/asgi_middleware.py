@@ -0,0 +1,59 @@
+"""
+Pure ASGI middleware base
+
+BaseHTTPMiddleware(@app.middleware("http"))는 요청마다 task와 memory stream을 하나씩 더 거치고,
+streaming 응답의 back-pressure가 끊김. 이 base는 send만 감싸 응답을 그대로 흘려보냄.
+
+subclass는 필요한 hook만 구현:
+- on_request(scope) -> state: 요청 시작 (반환값은 이후 hook에 전달)
+- on_response_start(scope, message, state): status/header 전송 직전 (header 추가 가능)
+- on_complete(scope, status, state, exc): 응답 body 전송까지 끝난 뒤 (예외 시 exc 전달)
+"""
+from typing import Any, Optional, Tuple
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+class ASGIMiddleware:
+    # 적용할 scope type, path prefix (None이면 모든 path)
+    scope_types: Tuple[str, ...] = ("http",)
+
+    def __init__(self, app: ASGIApp, path_prefixes: Optional[Tuple[str, ...]] = None):
+        self.app = app
+        self.path_prefixes = path_prefixes
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] not in self.scope_types or not self._matches(scope):
+            await self.app(scope, receive, send)
+            return
+
+        state = self.on_request(scope)
+        status = 500  # 응답 시작 전에 예외가 나면 바깥의 ServerErrorMiddleware가 500 응답
+
+        async def send_wrapper(message: Message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                self.on_response_start(scope, message, state)
+            await send(message)
+
+        exc = None
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except BaseException as e:
+            exc = e
+            raise
+        finally:
+            self.on_complete(scope, status, state, exc)
+
+    def _matches(self, scope: Scope) -> bool:
+        return self.path_prefixes is None or scope["path"].startswith(self.path_prefixes)
+
+    def on_request(self, scope: Scope) -> Any:
+        return None
+
+    def on_response_start(self, scope: Scope, message: Message, state: Any):
+        pass
+
+    def on_complete(self, scope: Scope, status: int, state: Any, exc: Optional[BaseException]):
+        pass
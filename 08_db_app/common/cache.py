@@ -0,0 +1,199 @@
+"""
+Read-through cache layer
+
+- LRUCache: in-process tier (OrderedDict + TTL), 가장 빠른 1차 캐시
+- CacheBackend: 공유 2차 캐시 (RedisCacheBackend / InMemoryCacheBackend for tests)
+- TieredCache: LRU -> backend -> loader 순으로 조회, 동일 key 동시 miss는 한 번만 로드 (single-flight)
+"""
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+import orjson
+
+logger = logging.getLogger(__name__)
+
+
+class LRUCache:
+    """Bounded in-process cache with per-key expiry"""
+
+    def __init__(self, max_size: int = 1024):
+        self.max_size = max_size
+        self._data: "OrderedDict[str, tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._data[key]
+            return default
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any, ttl: float):
+        self._data[key] = (time.monotonic() + ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+
+    def delete(self, key: str):
+        self._data.pop(key, None)
+
+    def clear(self):
+        self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+
+class CacheBackend:
+    """Shared cache tier interface: values are JSON-serializable python objects"""
+
+    async def get(self, key: str) -> Optional[Any]:
+        raise NotImplementedError
+
+    async def set(self, key: str, value: Any, ttl: float):
+        raise NotImplementedError
+
+    async def delete(self, *keys: str):
+        raise NotImplementedError
+
+
+class InMemoryCacheBackend(CacheBackend):
+    """Process-local backend, for tests and single-process runs"""
+
+    def __init__(self, max_size: int = 10000):
+        self._cache = LRUCache(max_size=max_size)
+
+    async def get(self, key: str) -> Optional[Any]:
+        return self._cache.get(key)
+
+    async def set(self, key: str, value: Any, ttl: float):
+        self._cache.set(key, value, ttl)
+
+    async def delete(self, *keys: str):
+        for key in keys:
+            self._cache.delete(key)
+
+
+class RedisCacheBackend(CacheBackend):
+    """
+    Redis backend (redis.asyncio client).
+    Redis errors are logged and treated as a miss so the database stays the source of truth.
+    """
+
+    def __init__(self, client, prefix: str = "cache:"):
+        self.client = client
+        self.prefix = prefix
+
+    async def get(self, key: str) -> Optional[Any]:
+        try:
+            raw = await self.client.get(self.prefix + key)
+        except Exception as e:
+            logger.warning("Redis cache get failed: %s", e)
+            return None
+        return orjson.loads(raw) if raw is not None else None
+
+    async def set(self, key: str, value: Any, ttl: float):
+        try:
+            await self.client.set(self.prefix + key, orjson.dumps(value), px=int(ttl * 1000))
+        except Exception as e:
+            logger.warning("Redis cache set failed: %s", e)
+
+    async def delete(self, *keys: str):
+        if not keys:
+            return
+        try:
+            await self.client.delete(*(self.prefix + key for key in keys))
+        except Exception as e:
+            logger.warning("Redis cache delete failed: %s", e)
+
+
+class TieredCache:
+    """
+    In-process LRU in front of a shared backend, with single-flight loading.
+    - 진행 중인 load의 future가 key의 generation 역할: invalidate()가 제거하면 그 load 결과는 cache에 저장하지 않음
+      (load 도중 commit된 변경을 이전 값으로 덮어쓰지 않도록, 이후 요청은 새로 load)
+    - local_ttl: in-process tier TTL, 다른 프로세스의 무효화가 반영되기까지의 최대 지연
+    - default_ttl: backend TTL (get_or_load/set 호출 시 key별 ttl로 덮어쓸 수 있음)
+    """
+
+    def __init__(self, backend: CacheBackend, default_ttl: float = 60.0, local_ttl: float = 5.0, local_max_size: int = 1024):
+        self.backend = backend
+        self.default_ttl = default_ttl
+        self.local_ttl = local_ttl
+        self.local = LRUCache(max_size=local_max_size)
+        self._inflight: Dict[str, asyncio.Future] = dict()
+        self.stats = {"local_hits": 0, "backend_hits": 0, "misses": 0, "coalesced": 0}
+
+    async def get_or_load(self, key: str, loader: Callable[[], Awaitable[Any]], ttl: Optional[float] = None) -> Any:
+        """Return the cached value or load it once, even if many callers miss at the same time"""
+        value = self.local.get(key)
+        if value is not None:
+            self.stats["local_hits"] += 1
+            return value
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self.stats["coalesced"] += 1
+            try:
+                return await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                # leader 요청이 취소된 경우 대기자는 취소하지 않고 다시 시도 (대기자 자신의 취소는 그대로 전파)
+                if not inflight.cancelled() or asyncio.current_task().cancelling():
+                    raise
+                return await self.get_or_load(key, loader, ttl)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await self._load(key, loader, ttl, future)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # 대기자가 없을 때 "exception was never retrieved" 경고 방지
+            future.exception()
+            raise
+        else:
+            future.set_result(value)
+            return value
+        finally:
+            # invalidate() 이후 시작된 다른 load는 제거하지 않음
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+
+    def _is_current(self, key: str, future: asyncio.Future) -> bool:
+        """load 시작 이후 invalidate()되지 않았는지"""
+        return self._inflight.get(key) is future
+
+    async def _load(self, key: str, loader, ttl: Optional[float], future: asyncio.Future) -> Any:
+        value = await self.backend.get(key)
+        if value is not None:
+            self.stats["backend_hits"] += 1
+            if self._is_current(key, future):
+                self.local.set(key, value, min(self.local_ttl, ttl or self.default_ttl))
+            return value
+
+        self.stats["misses"] += 1
+        value = await loader()
+        if value is not None and self._is_current(key, future):
+            await self.set(key, value, ttl)
+        return value
+
+    async def set(self, key: str, value: Any, ttl: Optional[float] = None):
+        ttl = ttl or self.default_ttl
+        self.local.set(key, value, min(self.local_ttl, ttl))
+        await self.backend.set(key, value, ttl)
+
+    async def invalidate(self, *keys: str):
+        for key in keys:
+            self.local.delete(key)
+            # 진행 중인 load는 변경 이전 값을 읽었을 수 있음 -> 결과를 저장하지 않고 새 요청도 합류하지 않음
+            self._inflight.pop(key, None)
+        await self.backend.delete(*keys)
@@ -0,0 +1,66 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Set
+
+
+class RequestCoalescer:
+    """
+    Merge single-key lookups that arrive within a short window into one batch call.
+    - batch_loader(keys) -> {key: value}, keys missing from the result resolve to None
+    - window: 첫 요청 이후 batch를 모으는 시간(초)
+    - max_batch_size: 이 크기에 도달하면 window를 기다리지 않고 즉시 전송
+    """
+
+    def __init__(
+        self,
+        batch_loader: Callable[[List[Hashable]], Awaitable[Dict[Hashable, Any]]],
+        window: float = 0.002,
+        max_batch_size: int = 100
+    ):
+        self.batch_loader = batch_loader
+        self.window = window
+        self.max_batch_size = max_batch_size
+        self._pending: Dict[Hashable, asyncio.Future] = dict()
+        self._flush_handle = None
+        self._tasks: Set[asyncio.Task] = set()
+        self.stats = {"requests": 0, "batches": 0, "keys": 0}
+
+    async def load(self, key: Hashable) -> Any:
+        self.stats["requests"] += 1
+        future = self._pending.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._pending[key] = future
+            if len(self._pending) >= self.max_batch_size:
+                self._flush()
+            elif self._flush_handle is None:
+                self._flush_handle = loop.call_later(self.window, self._flush)
+        # 한 호출자가 취소되어도 같은 key를 기다리는 다른 호출자에게 영향이 없도록 shield
+        return await asyncio.shield(future)
+
+    def _flush(self):
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._pending = self._pending, dict()
+        if not batch:
+            return
+        task = asyncio.ensure_future(self._dispatch(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _dispatch(self, batch: Dict[Hashable, asyncio.Future]):
+        self.stats["batches"] += 1
+        self.stats["keys"] += len(batch)
+        try:
+            results = await self.batch_loader(list(batch))
+        except Exception as e:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(e)
+                    future.exception()  # 대기자가 모두 취소된 경우 경고 방지
+            return
+
+        for key, future in batch.items():
+            if not future.done():
+                future.set_result(results.get(key))
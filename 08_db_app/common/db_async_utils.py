@@ -1,19 +1,19 @@
 import os
-from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from common.get_conn import get_mariadb_engine_async, get_mariadb_replica_engines_async, get_mariadb_replica_strategy
+from common.db_routing import async_routing_sessionmaker
 from app_mariadb.models import Base
 
 
 # 환경변수 기반 설정: MariaDB
-DB_USER = os.getenv("MARIADB_USER", "root")
-DB_PASSWORD = os.getenv("MARIADB_PASSWORD", "password")
 DB_HOST = os.getenv("MARIADB_HOST", "localhost")
 DB_PORT = os.getenv("MARIADB_PORT", "3306")
 DB_NAME = os.getenv("MARIADB_DATABASE", "test_db")
-DATABASE_URL = f"mysql+asyncmy://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
 
-# SQLAlchemy 엔진 및 세션 팩토리 (전역적으로 관리)
-engine = create_async_engine(DATABASE_URL, pool_size=5, max_overflow=10, echo=True)
-SessionMaker = async_sessionmaker(bind=engine, expire_on_commit=False)
+# SQLAlchemy 엔진 및 세션 팩토리 (common.get_conn의 engine/pool을 공유, 읽기는 replica로 routing)
+engine = get_mariadb_engine_async()
+SessionMaker = async_routing_sessionmaker(
+    engine, get_mariadb_replica_engines_async(), get_mariadb_replica_strategy(), expire_on_commit=False
+)
 
 
 # DB init
@@ -0,0 +1,96 @@
+"""
+Primary / read-replica routing for SQLAlchemy sessions
+
+- SELECT: replica (session마다 하나를 골라 고정, round robin 또는 least connections)
+- INSERT/UPDATE/DELETE, flush, SELECT ... FOR UPDATE, text(): primary
+- 한 번 primary를 사용한 session의 이후 읽기는 primary (read-your-writes)
+sync Session 기준으로 동작하며, AsyncSession은 sync_session_class로 사용 (engine은 sync_engine 전달).
+"""
+import itertools
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import List, Optional
+
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.sql.selectable import Select, CompoundSelect
+
+REPLICA_STRATEGIES = ("round_robin", "least_connections")
+
+# 요청 단위로 모든 읽기를 primary로 보낼 때 사용 (e.g. 쓰기 직후 redirect된 조회)
+_force_primary: ContextVar[bool] = ContextVar("force_primary", default=False)
+
+
+class ReplicaSelector:
+    """Pick a replica engine: round robin, or the one with the fewest checked-out connections"""
+
+    def __init__(self, engines: List[Engine], strategy: str = "round_robin"):
+        if strategy not in REPLICA_STRATEGIES:
+            raise ValueError(f"Unknown replica strategy: {strategy} (expected one of {REPLICA_STRATEGIES})")
+        self.engines = list(engines)
+        self.strategy = strategy
+        self._cycle = itertools.cycle(self.engines)
+
+    def choose(self) -> Engine:
+        if self.strategy == "least_connections":
+            return min(self.engines, key=_checked_out)
+        return next(self._cycle)
+
+
+def _checked_out(engine: Engine) -> int:
+    checkedout = getattr(engine.pool, "checkedout", None)
+    return checkedout() if checkedout else 0
+
+
+@contextmanager
+def primary_reads():
+    """Route every read in this context to the primary"""
+    token = _force_primary.set(True)
+    try:
+        yield
+    finally:
+        _force_primary.reset(token)
+
+
+def use_primary(session):
+    """Pin a (sync or async) session to the primary for the rest of its life"""
+    session.info["use_primary"] = True
+
+
+def routing_session_class(primary: Engine, replicas: Optional[ReplicaSelector] = None):
+    """Session class bound to primary, sending plain SELECTs to replicas when any are configured"""
+
+    class RoutingSession(Session):
+        def get_bind(self, mapper=None, clause=None, **kw):
+            if not replicas or not replicas.engines:
+                return primary
+            if self._is_read(clause) and not self.info.get("use_primary") and not _force_primary.get():
+                replica = self.info.get("replica")
+                if replica is None:
+                    replica = self.info["replica"] = replicas.choose()
+                return replica
+            self.info["use_primary"] = True
+            return primary
+
+        def _is_read(self, clause) -> bool:
+            return (
+                not self._flushing
+                and isinstance(clause, (Select, CompoundSelect))
+                and getattr(clause, "_for_update_arg", None) is None
+            )
+
+    return RoutingSession
+
+
+def routing_sessionmaker(primary: Engine, replicas: List[Engine] = (), strategy: str = "round_robin", **kwargs) -> sessionmaker:
+    selector = ReplicaSelector(replicas, strategy) if replicas else None
+    return sessionmaker(bind=primary, class_=routing_session_class(primary, selector), **kwargs)
+
+
+def async_routing_sessionmaker(
+    primary: AsyncEngine, replicas: List[AsyncEngine] = (), strategy: str = "round_robin", **kwargs
+) -> async_sessionmaker:
+    selector = ReplicaSelector([engine.sync_engine for engine in replicas], strategy) if replicas else None
+    session_class = routing_session_class(primary.sync_engine, selector)
+    return async_sessionmaker(bind=primary, sync_session_class=session_class, **kwargs)
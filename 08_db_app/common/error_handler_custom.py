@@ -1,20 +1,19 @@
 from fastapi import HTTPException, Request
-from fastapi.responses import JSONResponse
-from common.response_model import ResponseResult
-from http import HTTPStatus
+from fastapi.responses import Response
+from common.result_helper import render_envelope, get_status_phrase
 
 
 # HTTPException to ensure responses match the ResponseResult format
 async def http_exception_handler(request: Request, exc: HTTPException):
     result_code = exc.status_code
-    result_msg = exc.detail if isinstance(exc.detail, str) else HTTPStatus(result_code).phrase
-    response = ResponseResult(result_code=result_code, result_msg=result_msg)
-    return JSONResponse(status_code=200, content=response.model_dump(exclude_none=True))
+    result_msg = exc.detail if isinstance(exc.detail, str) else get_status_phrase(result_code)
+    content = render_envelope(result_code, result_msg=result_msg, exclude_none=True)
+    return Response(content=content, status_code=200, media_type="application/json")
 
 
 # Custom handler for all other exceptions.
 async def generic_exception_handler(request: Request, exc: Exception):
     result_code = 500  # Internal Server Error
     result_msg = str(exc)  # Use exception message
-    response = ResponseResult(result_code=result_code, result_msg=result_msg)
-    return JSONResponse(status_code=result_code, content=response.model_dump(exclude_none=True))
+    content = render_envelope(result_code, result_msg=result_msg, exclude_none=True)
+    return Response(content=content, status_code=result_code, media_type="application/json")
@@ -1,43 +1,94 @@
 # env
 from dotenv import load_dotenv
 import os
+from functools import lru_cache
 from urllib.parse import quote
 # RDB
 from sqlalchemy import create_engine
 from sqlalchemy.ext.asyncio import create_async_engine
+from common.pool_metrics import InstrumentedQueuePool, InstrumentedAsyncAdaptedQueuePool
 # NoSQL
 import redis
+import redis.asyncio as aioredis
 from elasticsearch import AsyncElasticsearch
 
 load_dotenv()
 
 
+# RDB engine factory: pool 설정은 환경변수로 조정
+# - DB_POOL_SIZE / DB_MAX_OVERFLOW: 상시 유지 connection 수 / 순간 추가 허용 수
+# - DB_POOL_TIMEOUT: pool 고갈 시 connection을 기다리는 최대 시간(초)
+# - DB_POOL_RECYCLE: 이 시간(초)보다 오래된 connection은 재연결 (DB/proxy idle timeout 대비)
+# - DB_POOL_PRE_PING: checkout 시 connection 생존 확인
+# - DB_ECHO: SQL 로그 출력 (개발용, 기본 off)
+def get_engine_options() -> dict:
+    return {
+        "pool_size": int(os.getenv("DB_POOL_SIZE", 5)),
+        "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", 10)),
+        "pool_timeout": float(os.getenv("DB_POOL_TIMEOUT", 30)),
+        "pool_recycle": int(os.getenv("DB_POOL_RECYCLE", 1800)),
+        "pool_pre_ping": os.getenv("DB_POOL_PRE_PING", "True").lower() == "true",
+        "echo": os.getenv("DB_ECHO", "False").lower() == "true",
+    }
+
+
+def create_db_engine(db_url: str, is_async: bool = False, **overrides):
+    """
+    Create a sync or async engine with the shared pool options and checkout metrics
+    (see common.pool_metrics.get_pool_stats).
+    """
+    options = {**get_engine_options(), **overrides}
+    if is_async:
+        return create_async_engine(db_url, poolclass=InstrumentedAsyncAdaptedQueuePool, **options)
+    return create_engine(db_url, poolclass=InstrumentedQueuePool, **options)
+
+
 # SQLite
 def get_sqlite_engine(db_url: str = "sqlite:///db.sqlite3"):
-    return create_engine(db_url, connect_args={"check_same_thread": False}, pool_size=5, max_overflow=10)
+    return create_db_engine(db_url, connect_args={"check_same_thread": False})
 
 
 # MariaDB
-def get_mariadb_engine_sync():
+def get_mariadb_url(driver: str, host: str = None, port: str = None) -> str:
     user = os.getenv("MARIADB_USER", None)
     password = quote(os.getenv("MARIADB_PASSWORD", None))
-    host = os.getenv("MARIADB_HOST", "localhost")
-    port = os.getenv("MARIADB_PORT", 3307)
+    host = host or os.getenv("MARIADB_HOST", "localhost")
+    port = port or os.getenv("MARIADB_PORT", 3307)
     database = os.getenv("MARIADB_DATABASE", None)
 
-    db_url = f"mysql+pymysql://{user}:{password}@{host}:{port}/{database}"
-    return create_engine(db_url)
+    return f"mysql+{driver}://{user}:{password}@{host}:{port}/{database}"
+
+
+# Read replica: MARIADB_REPLICA_HOSTS="replica1:3306,replica2:3306" (계정/DB는 primary와 동일)
+# MARIADB_REPLICA_STRATEGY: round_robin (default) | least_connections
+def get_mariadb_replica_urls(driver: str) -> list:
+    hosts = [host.strip() for host in os.getenv("MARIADB_REPLICA_HOSTS", "").split(",") if host.strip()]
+    return [get_mariadb_url(driver, *host.split(":", 1)) for host in hosts]
+
+
+def get_mariadb_replica_strategy() -> str:
+    return os.getenv("MARIADB_REPLICA_STRATEGY", "round_robin")
+
+
+# process 당 engine(= connection pool) 하나를 공유
+@lru_cache(maxsize=None)
+def get_mariadb_engine_sync():
+    return create_db_engine(get_mariadb_url("pymysql"))
 
 
+@lru_cache(maxsize=None)
 def get_mariadb_engine_async():
-    user = os.getenv("MARIADB_USER", None)
-    password = quote(os.getenv("MARIADB_PASSWORD", None))
-    host = os.getenv("MARIADB_HOST", "localhost")
-    port = os.getenv("MARIADB_PORT", 3307)
-    database = os.getenv("MARIADB_DATABASE", None)
+    return create_db_engine(get_mariadb_url("asyncmy"), is_async=True)
+
+
+@lru_cache(maxsize=None)
+def get_mariadb_replica_engines_sync() -> tuple:
+    return tuple(create_db_engine(url) for url in get_mariadb_replica_urls("pymysql"))
 
-    db_url = f"mysql+asyncmy://{user}:{password}@{host}:{port}/{database}"
-    return create_async_engine(db_url)
+
+@lru_cache(maxsize=None)
+def get_mariadb_replica_engines_async() -> tuple:
+    return tuple(create_db_engine(url, is_async=True) for url in get_mariadb_replica_urls("asyncmy"))
 
 
 # Redis
@@ -46,8 +97,22 @@ def get_redis_client(host="localhost", port=6379, db=0):
     return redis.StrictRedis(connection_pool=pool)
 
 
+def get_redis_client_async(host="localhost", port=6379, db=0):
+    pool = aioredis.ConnectionPool(host=host, port=port, db=db)
+    return aioredis.StrictRedis(connection_pool=pool)
+
+
 # Elasticsearch
 def get_elasticsearch_client():
+    """
+    Create an AsyncElasticsearch client. Connection pool / transport options:
+    - ELASTICSEARCH_MAX_CONNECTIONS: connections per node (pool size)
+    - ELASTICSEARCH_HTTP_COMPRESS: gzip request bodies
+    - ELASTICSEARCH_REQUEST_TIMEOUT: default per-request timeout (seconds)
+    - ELASTICSEARCH_MAX_RETRIES / ELASTICSEARCH_RETRY_ON_TIMEOUT: transport retries
+    - ELASTICSEARCH_SNIFF_ON_START / ELASTICSEARCH_SNIFF_ON_NODE_FAILURE: node discovery
+      (클러스터 앞에 load balancer/cloud proxy가 있으면 false 유지)
+    """
     es_host = os.getenv("ELASTICSEARCH_HOST", "localhost")
     es_port = os.getenv("ELASTICSEARCH_PORT", 9200)
     is_secure = os.getenv("ELASTICSEARCH_SECURE", "True").lower() == "true"
@@ -55,6 +120,12 @@ def get_elasticsearch_client():
     es_user = os.getenv("ELASTICSEARCH_USER", None)
     es_password = os.getenv("ELASTICSEARCH_PASSWORD", None)
     max_connection = int(os.getenv("ELASTICSEARCH_MAX_CONNECTIONS", 10))
+    http_compress = os.getenv("ELASTICSEARCH_HTTP_COMPRESS", "True").lower() == "true"
+    request_timeout = float(os.getenv("ELASTICSEARCH_REQUEST_TIMEOUT", 10))
+    max_retries = int(os.getenv("ELASTICSEARCH_MAX_RETRIES", 3))
+    retry_on_timeout = os.getenv("ELASTICSEARCH_RETRY_ON_TIMEOUT", "True").lower() == "true"
+    sniff_on_start = os.getenv("ELASTICSEARCH_SNIFF_ON_START", "False").lower() == "true"
+    sniff_on_node_failure = os.getenv("ELASTICSEARCH_SNIFF_ON_NODE_FAILURE", "False").lower() == "true"
 
     if not es_host.startswith("http"):
         host_list = get_host_list(es_host, es_port, is_secure=is_secure)
@@ -66,11 +137,41 @@ def get_elasticsearch_client():
         basic_auth=(es_user, es_password) if es_user and es_password else None,  # Basic Authentication
         verify_certs=False,  # SSL/TLS 인증 무시 설정, Production에서는 사용 권장
         ssl_show_warn=False,
-        # connections_per_node=max_connection
+        connections_per_node=max_connection,
+        http_compress=http_compress,
+        request_timeout=request_timeout,
+        max_retries=max_retries,
+        retry_on_timeout=retry_on_timeout,
+        sniff_on_start=sniff_on_start,
+        sniff_on_node_failure=sniff_on_node_failure,
+        sniff_timeout=float(os.getenv("ELASTICSEARCH_SNIFF_TIMEOUT", 1)),
+        min_delay_between_sniffing=float(os.getenv("ELASTICSEARCH_SNIFF_MIN_DELAY", 60)),
     )
     return es_client
 
 
+def get_elasticsearch_pool_stats(es_client: AsyncElasticsearch) -> dict:
+    """
+    Connection pool usage per node (best effort: aiohttp connector internals).
+    - in_use: checked-out connections, idle: keep-alive connections ready for reuse
+    """
+    node_pool = es_client.transport.node_pool
+    alive = getattr(node_pool, "_alive_nodes", {})
+    nodes = list()
+    for node in node_pool.all():
+        connector = getattr(getattr(node, "session", None), "connector", None)
+        in_use = len(getattr(connector, "_acquired", ())) if connector else 0
+        idle = sum(len(conns) for conns in getattr(connector, "_conns", {}).values()) if connector else 0
+        nodes.append({
+            "base_url": node.base_url,
+            "alive": node.config in alive,
+            "connections_per_node": node.config.connections_per_node,
+            "in_use": in_use,
+            "idle": idle,
+        })
+    return {"node_count": len(nodes), "alive_count": sum(1 for n in nodes if n["alive"]), "nodes": nodes}
+
+
 def get_host_list(host_data, es_port, is_secure=True):
     protocol = "https" if is_secure else "http"
 
@@ -0,0 +1,99 @@
+"""
+In-memory request latency histograms
+
+- route template(e.g. /mariadb/items/{item_id}) 단위로 집계, raw URL 미사용 -> label cardinality 제한
+- 고정 bucket histogram: observe는 O(log buckets), 메모리는 route 수에 비례
+- p50/p95/p99는 bucket 경계 사이 선형 보간으로 추정
+- Prometheus text exposition format(0.0.4)으로 출력
+"""
+import threading
+from bisect import bisect_left
+from typing import Dict, Iterable, Tuple
+
+# latency bucket 상한(초)
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUANTILES = (0.5, 0.95, 0.99)
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class Histogram:
+    """Fixed-bucket latency histogram (counts per bucket, the last one is +Inf)"""
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def quantile(self, q: float) -> float:
+        """Estimate a quantile from the bucket counts"""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        cumulative = 0
+        for index, bucket_count in enumerate(self.counts):
+            if cumulative + bucket_count >= rank and bucket_count:
+                lower = self.buckets[index - 1] if index > 0 else 0.0
+                if index == len(self.buckets):
+                    return lower  # +Inf bucket: 가장 큰 경계값으로 보고
+                upper = self.buckets[index]
+                return lower + (upper - lower) * (rank - cumulative) / bucket_count
+            cumulative += bucket_count
+        return self.buckets[-1]
+
+
+class LatencyRegistry:
+    """Histograms keyed by (method, route template, status)"""
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self._histograms: Dict[Tuple[str, str, str], Histogram] = dict()
+        # 새 key 등록과 /metrics 출력이 겹칠 때를 위한 lock (기존 key의 observe는 lock 없이 처리)
+        self._lock = threading.Lock()
+
+    def observe(self, method: str, route: str, status: int, seconds: float):
+        key = (method, route, str(status))
+        histogram = self._histograms.get(key)
+        if histogram is None:
+            with self._lock:
+                histogram = self._histograms.setdefault(key, Histogram(self.buckets))
+        histogram.observe(seconds)
+
+    def items(self) -> Iterable[Tuple[Tuple[str, str, str], Histogram]]:
+        with self._lock:
+            return sorted(self._histograms.items())
+
+    def render_prometheus(self, name: str = "http_request_duration_seconds") -> str:
+        lines = [
+            f"# HELP {name} HTTP request latency by route template.",
+            f"# TYPE {name} histogram",
+        ]
+        quantile_lines = [
+            f"# HELP {name}_quantile Estimated latency quantiles from the histogram buckets.",
+            f"# TYPE {name}_quantile gauge",
+        ]
+        for (method, route, status), histogram in self.items():
+            labels = f'method="{method}",route="{_escape(route)}",status="{status}"'
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, histogram.counts):
+                cumulative += bucket_count
+                lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {cumulative}')
+            lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {histogram.count}')
+            lines.append(f"{name}_sum{{{labels}}} {histogram.sum:.6f}")
+            lines.append(f"{name}_count{{{labels}}} {histogram.count}")
+            for q in QUANTILES:
+                quantile_lines.append(f'{name}_quantile{{{labels},quantile="{q}"}} {histogram.quantile(q):.6f}')
+        return "\n".join(lines + quantile_lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+# process 전역 registry (app의 /metrics에서 출력)
+latency_registry = LatencyRegistry()
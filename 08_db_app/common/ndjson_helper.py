@@ -0,0 +1,87 @@
+import orjson
+from fastapi import HTTPException, Request
+from typing import Any, AsyncIterator, List, Tuple, Type
+from pydantic import BaseModel
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+NDJSON_MEDIA_TYPES = (NDJSON_MEDIA_TYPE, "application/ndjson", "application/jsonl")
+
+
+def is_ndjson_request(request: Request) -> bool:
+    content_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+    return content_type in NDJSON_MEDIA_TYPES
+
+
+async def iter_request_rows(request: Request) -> AsyncIterator[Any]:
+    """
+    Iterate over the rows of a JSON array body or an NDJSON stream.
+    - JSON array: yields decoded python objects
+    - NDJSON: yields raw line bytes while the body is still being received (validate with model_validate_json)
+    """
+    if not is_ndjson_request(request):
+        try:
+            body = orjson.loads(await request.body())
+        except orjson.JSONDecodeError:
+            raise HTTPException(status_code=400, detail="Invalid JSON body")
+        if not isinstance(body, list):
+            raise HTTPException(status_code=400, detail="Expected a JSON array or an NDJSON stream")
+        for row in body:
+            yield row
+        return
+
+    buffer = b""
+    async for chunk in request.stream():
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            if line.strip():
+                yield line
+    if buffer.strip():
+        yield buffer
+
+
+async def iter_chunks(rows: AsyncIterator[Any], chunk_size: int) -> AsyncIterator[List[Tuple[int, Any]]]:
+    """Group rows into (index, row) chunks of at most chunk_size"""
+    chunk = list()
+    index = 0
+    async for row in rows:
+        chunk.append((index, row))
+        index += 1
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = list()
+    if chunk:
+        yield chunk
+
+
+def bulk_request_body(model: Type[BaseModel]) -> dict:
+    """openapi_extra for endpoints that read the body themselves (JSON array or NDJSON)"""
+    item_schema = model.model_json_schema()
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {"schema": {"type": "array", "items": item_schema}},
+                "application/x-ndjson": {"schema": item_schema},
+            },
+        }
+    }
+
+
+async def ndjson_stream(batches: AsyncIterator[list]) -> AsyncIterator[bytes]:
+    """Encode batches of rows as NDJSON, one network chunk per batch"""
+    async for batch in batches:
+        yield b"".join(orjson.dumps(dict(row)) + b"\n" for row in batch)
+
+
+async def json_envelope_stream(batches: AsyncIterator[list], result_code: int = 200, result_msg: str = "OK") -> AsyncIterator[bytes]:
+    """Encode batches of rows as a chunked ResponseResult envelope: {"result_code":..,"result_msg":..,"data":[...]}"""
+    yield orjson.dumps({"result_code": result_code, "result_msg": result_msg})[:-1] + b',"data":['
+    first = True
+    async for batch in batches:
+        if not batch:
+            continue
+        body = b",".join(orjson.dumps(dict(row)) for row in batch)
+        yield body if first else b"," + body
+        first = False
+    yield b"]}"
@@ -0,0 +1,97 @@
+"""
+SQLAlchemy connection pool metrics
+
+- checkout wait time: connection 요청부터 pool에서 받을 때까지 걸린 시간 (pool 고갈 시 증가)
+- in-use / idle / overflow: 현재 pool 상태
+- counter는 pool 재생성(engine.dispose(), disconnect 후 invalidate)을 거쳐도 유지, 재생성 횟수는 recreations
+"""
+import time
+from bisect import bisect_left
+
+from sqlalchemy import exc
+from sqlalchemy.pool import QueuePool, AsyncAdaptedQueuePool
+
+# checkout wait histogram bucket 상한(초)
+WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+
+
+class PoolMetrics:
+    """Checkout counters and a wait time histogram for one pool"""
+
+    def __init__(self):
+        self.checkouts = 0
+        self.timeouts = 0
+        self.recreations = 0  # engine.dispose() / 연결 끊김 후 pool 재생성 횟수
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        self.wait_buckets = [0] * (len(WAIT_BUCKETS) + 1)  # 마지막 칸: 가장 큰 bucket 초과
+
+    def observe_wait(self, seconds: float):
+        self.checkouts += 1
+        self.wait_total += seconds
+        self.wait_max = max(self.wait_max, seconds)
+        self.wait_buckets[bisect_left(WAIT_BUCKETS, seconds)] += 1
+
+    def snapshot(self) -> dict:
+        buckets = {f"le_{bound}": count for bound, count in zip(WAIT_BUCKETS, self.wait_buckets)}
+        buckets["gt_max"] = self.wait_buckets[-1]
+        return {
+            "checkouts": self.checkouts,
+            "timeouts": self.timeouts,
+            "recreations": self.recreations,
+            "wait_avg_ms": round(self.wait_total / self.checkouts * 1000, 3) if self.checkouts else 0.0,
+            "wait_max_ms": round(self.wait_max * 1000, 3),
+            "wait_buckets": buckets,
+        }
+
+
+def _instrumented(pool_class):
+    """Subclass of a QueuePool class that times every checkout from the underlying queue"""
+
+    class InstrumentedPool(pool_class):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.metrics = PoolMetrics()
+
+        def _do_get(self):
+            start = time.perf_counter()
+            try:
+                connection = super()._do_get()
+            except exc.TimeoutError:
+                self.metrics.timeouts += 1
+                raise
+            self.metrics.observe_wait(time.perf_counter() - start)
+            return connection
+
+        def recreate(self):
+            # 새 pool 객체로 교체되어도 누적 counter는 유지
+            pool = super().recreate()
+            pool.metrics = self.metrics
+            self.metrics.recreations += 1
+            return pool
+
+    InstrumentedPool.__name__ = f"Instrumented{pool_class.__name__}"
+    return InstrumentedPool
+
+
+InstrumentedQueuePool = _instrumented(QueuePool)
+InstrumentedAsyncAdaptedQueuePool = _instrumented(AsyncAdaptedQueuePool)
+
+
+def get_pool_stats(engine) -> dict:
+    """Pool state + checkout metrics of a sync or async engine"""
+    pool = getattr(engine, "sync_engine", engine).pool
+    stats = {"pool_class": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        stats.update({
+            "size": pool.size(),
+            "in_use": pool.checkedout(),
+            "idle": pool.checkedin(),
+            "overflow": max(pool.overflow(), 0),
+            "max_overflow": pool._max_overflow,
+            "timeout": pool.timeout(),
+        })
+    metrics = getattr(pool, "metrics", None)
+    if metrics is not None:
+        stats.update(metrics.snapshot())
+    return stats
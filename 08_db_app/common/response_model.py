@@ -1,6 +1,6 @@
 from pydantic import BaseModel
 from typing import Optional, Any
-from http import HTTPStatus
+from common.result_helper import get_status_phrase
 
 
 class ResponseResult(BaseModel):
@@ -16,4 +16,4 @@ class ResponseResult(BaseModel):
         super().__init__(**data)
         # Set default result_msg based on result_code if not provided
         if not self.result_msg:
-            self.result_msg = HTTPStatus(self.result_code).phrase if self.result_code in HTTPStatus._value2member_map_ else "Unknown Status"
+            self.result_msg = get_status_phrase(self.result_code)
@@ -1,16 +1,31 @@
-from fastapi.responses import JSONResponse
-from common.response_model import ResponseResult
+from fastapi.responses import Response
+from pydantic_core import to_json
 from typing import Any
 from http import HTTPStatus
 
+# result_code -> reason phrase, 요청마다 HTTPStatus enum 조회를 반복하지 않도록 미리 계산
+STATUS_PHRASES = {status.value: status.phrase for status in HTTPStatus}
 
-def create_response(result_code: int, data: Any = None, result_msg: str = None) -> JSONResponse:
+
+def get_status_phrase(result_code: int) -> str:
+    return STATUS_PHRASES.get(result_code, "Unknown Status")
+
+
+def render_envelope(result_code: int, data: Any = None, result_msg: str = None, exclude_none: bool = False) -> bytes:
     """
-    Create a standardized JSONResponse based on ResponseResult.
-    Ensures result_code and HTTP status_code are synchronized.
+    Serialize a ResponseResult envelope straight to JSON bytes in one pass.
+    Same shape as ResponseResult.model_dump(), without building the Pydantic model.
     """
-    if not result_msg:
-        result_msg = HTTPStatus(result_code).phrase if result_code in HTTPStatus._value2member_map_ else "Unknown Status"
+    envelope = {"result_code": result_code, "result_msg": result_msg or get_status_phrase(result_code), "data": data}
+    if exclude_none and data is None:
+        del envelope["data"]
+    # pydantic_core가 dict/list 안의 Pydantic 모델까지 Rust에서 바로 직렬화 (model_dump() 중간 dict 없음)
+    return to_json(envelope)
 
-    response = ResponseResult(result_code=result_code, result_msg=result_msg, data=data)
-    return JSONResponse(status_code=200, content=response.model_dump())
+
+def create_response(result_code: int, data: Any = None, result_msg: str = None) -> Response:
+    """
+    Create a standardized response in the ResponseResult format.
+    Ensures result_code and HTTP status_code are synchronized.
+    """
+    return Response(content=render_envelope(result_code, data, result_msg), status_code=200, media_type="application/json")
@@ -0,0 +1,58 @@
+"""
+Request timing middleware (pure ASGI)
+
+- 모든 요청의 처리 시간을 route template별 histogram에 기록 (common.metrics)
+- 처리 시간은 응답 body 전송 완료까지 (streaming 응답 포함)
+- 로그는 sampling: LOG_SAMPLE_RATE 비율의 요청과 SLOW_REQUEST_MS 이상 걸린 요청만 기록
+"""
+import logging
+import os
+import random
+import time
+
+from fastapi import Request
+from fastapi.responses import Response
+from starlette.types import Scope
+
+from common.asgi_middleware import ASGIMiddleware
+from common.metrics import LatencyRegistry, latency_registry, PROMETHEUS_CONTENT_TYPE
+
+logger = logging.getLogger("request_timing")
+
+LOG_SAMPLE_RATE = float(os.getenv("REQUEST_LOG_SAMPLE_RATE", 0.01))
+SLOW_REQUEST_MS = float(os.getenv("SLOW_REQUEST_MS", 1000))
+
+# 매칭되는 route가 없는 요청(404 등)은 하나의 label로 묶어 cardinality 제한
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+def route_template(scope: Scope) -> str:
+    """Path template of the matched route (set on the scope by the router)"""
+    route = scope.get("route")
+    return getattr(route, "path", UNMATCHED_ROUTE)
+
+
+class TimingMiddleware(ASGIMiddleware):
+    def __init__(self, app, registry: LatencyRegistry = latency_registry,
+                 sample_rate: float = LOG_SAMPLE_RATE, slow_ms: float = SLOW_REQUEST_MS, path_prefixes=None):
+        super().__init__(app, path_prefixes)
+        self.registry = registry
+        self.sample_rate = sample_rate
+        self.slow_seconds = slow_ms / 1000
+
+    def on_request(self, scope: Scope) -> float:
+        return time.perf_counter()
+
+    def on_complete(self, scope: Scope, status: int, start: float, exc):
+        elapsed = time.perf_counter() - start
+        method, route = scope["method"], route_template(scope)
+        self.registry.observe(method, route, status, elapsed)
+        if elapsed >= self.slow_seconds:
+            logger.warning("slow request %s %s %d %.4fs", method, route, status, elapsed)
+        elif self.sample_rate and random.random() < self.sample_rate:
+            logger.info("%s %s %d %.4fs", method, route, status, elapsed)
+
+
+async def metrics_endpoint(request: Request) -> Response:
+    """Prometheus scrape endpoint"""
+    return Response(latency_registry.render_prometheus(), media_type=PROMETHEUS_CONTENT_TYPE)
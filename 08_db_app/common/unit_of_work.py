@@ -0,0 +1,94 @@
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import Awaitable, Callable, List, Optional
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+# 현재 요청의 Unit of Work (요청 단위로 하나의 세션/커넥션 공유)
+_current_uow: ContextVar[Optional["UnitOfWork"]] = ContextVar("current_uow", default=None)
+
+
+class UnitOfWork:
+    """
+    Request-scoped unit of work.
+    Every repository call made while it is active shares one AsyncSession, so the
+    request checks out a single pooled connection (lazily, on first use) and
+    commits once when the unit of work exits.
+    """
+
+    def __init__(self, session_factory: async_sessionmaker):
+        self.session_factory = session_factory
+        self.session: Optional[AsyncSession] = None
+        self._token = None
+        self._after_commit: List[Callable[[], Awaitable[None]]] = list()
+
+    async def __aenter__(self) -> "UnitOfWork":
+        self.session = self.session_factory()
+        self._token = _current_uow.set(self)
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        try:
+            if exc_type is None:
+                await self.session.commit()
+            else:
+                await self.session.rollback()
+                self._after_commit.clear()
+        finally:
+            await self.session.close()
+            _current_uow.reset(self._token)
+
+        for callback in self._after_commit:
+            await callback()
+
+    async def commit(self):
+        await self.session.commit()
+
+    async def rollback(self):
+        await self.session.rollback()
+
+
+def current_unit_of_work() -> Optional[UnitOfWork]:
+    return _current_uow.get()
+
+
+async def after_commit(callback: Callable[[], Awaitable[None]]):
+    """
+    Run callback once the current unit of work has committed (e.g. cache invalidation),
+    or right away when no unit of work is active (standalone sessions commit immediately).
+    """
+    uow = current_unit_of_work()
+    if uow is None:
+        await callback()
+    else:
+        uow._after_commit.append(callback)
+
+
+@asynccontextmanager
+async def session_scope(session_factory: async_sessionmaker):
+    """
+    Yield the active unit of work's session, or a short-lived session of its own.
+    - inside a unit of work: flush only, the unit of work commits at the end of the request
+    - standalone: commit on success, rollback on error
+    """
+    uow = current_unit_of_work()
+    if uow is not None:
+        yield uow.session
+        await uow.session.flush()
+        return
+
+    async with session_factory() as session:
+        try:
+            yield session
+            await session.commit()
+        except Exception:
+            await session.rollback()
+            raise
+
+
+def unit_of_work_dependency(session_factory: async_sessionmaker):
+    """Build a FastAPI dependency that wraps a request in a UnitOfWork"""
+    async def provide_unit_of_work():
+        async with UnitOfWork(session_factory) as uow:
+            yield uow
+
+    return provide_unit_of_work
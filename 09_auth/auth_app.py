@@ -3,7 +3,7 @@ from starlette.middleware.sessions import SessionMiddleware
 
 from basic_auth_example import router as basic_router
 from basic_auth_sqlite import router as sqlite_router
-from jwt_auth_sqlite import router as jwt_router
+from jwt_auth_sqlite import router as jwt_router, jwks_router
 
 # FastAPI 앱 초기화
 app = FastAPI(title="Authentication API", version="1.0.0")
@@ -17,6 +17,7 @@ app.add_middleware(SessionMiddleware, secret_key=SECRET_KEY)
 app.include_router(basic_router, prefix="/basic", tags=["Basic Authentication"])
 app.include_router(sqlite_router, prefix="/sqlite")
 app.include_router(jwt_router, prefix="/jwt", tags=["JWT Authentication"])
+app.include_router(jwks_router)
 
 
 if __name__ == "__main__":
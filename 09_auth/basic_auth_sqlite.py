@@ -14,13 +14,14 @@ Base.metadata.create_all(bind=engine)
 
 
 # login: 사용자 이름과 비밀번호를 검증하여 접근 허용 (cookie)
+# bcrypt 검증은 전용 worker pool에서 실행 -> async endpoint로 Starlette threadpool 점유 방지
 @router.post("/login/cookie", tags=["Login"])
-def login_with_cookie(
+async def login_with_cookie(
     response: Response,
     credentials: HTTPBasicCredentials = Depends(HTTPBasic()),
     db: Session = Depends(get_db)
 ):
-    login_data = UserService.authenticate_user(db, credentials.username, credentials.password)
+    login_data = await UserService.authenticate_user_async(db, credentials.username, credentials.password)
 
     # 쿠키에 로그인 정보 저장 (보안 향상을 위해 HttpOnly 설정)
     response.set_cookie(key="logged_in_user", value=login_data["username"], httponly=True)
@@ -29,12 +30,12 @@ def login_with_cookie(
 
 # login: 사용자 이름과 비밀번호를 검증하여 접근 허용 (session)
 @router.post("/login", tags=["Login"])
-def login_with_session(
+async def login_with_session(
     request: Request,
     credentials: HTTPBasicCredentials = Depends(HTTPBasic()),
     db: Session = Depends(get_db)
 ):
-    login_data = UserService.authenticate_user(db, credentials.username, credentials.password)
+    login_data = await UserService.authenticate_user_async(db, credentials.username, credentials.password)
 
     # 세션에 로그인 정보 저장
     request.session["username"] = login_data["username"]
@@ -65,8 +66,8 @@ def list_users(db: Session = Depends(get_db)):
 
 # creat user
 @router.post("/users", response_model=UserResponse, status_code=201, tags=["User"])
-def create_user(user: UserCreate, db: Session = Depends(get_db)):
-    return UserService.create_user(db, user)
+async def create_user(user: UserCreate, db: Session = Depends(get_db)):
+    return await UserService.create_user(db, user)
 
 
 # get user data
@@ -77,8 +78,8 @@ def get_user(username: str, db: Session = Depends(get_db)):
 
 # update user data
 @router.put("/users/{username}", response_model=UserResponse, tags=["User"])
-def update_user(username: str, password_update: PasswordUpdate, db: Session = Depends(get_db)):
-    return UserService.update_user(db, username, password_update.current_password, password_update.new_password)
+async def update_user(username: str, password_update: PasswordUpdate, db: Session = Depends(get_db)):
+    return await UserService.update_user(db, username, password_update.current_password, password_update.new_password)
 
 
 # delete user data
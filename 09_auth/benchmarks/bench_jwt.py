@@ -0,0 +1,53 @@
+"""
+JWT verification benchmark: backend별 tokens/sec, decoded-token cache 적용 전/후
+
+- backend 직접 decode (서명 검증 + JSON parse) vs decode_token (TokenCache hit)
+- distinct token 수만큼 미리 발급해 순환 검증 (cache 크기보다 작으면 모두 hit)
+- 설치되지 않은 backend(PyJWT 등)는 건너뜀
+
+run (09_auth 디렉터리에서)
+    python -m benchmarks.bench_jwt [verifications] [distinct_tokens]
+"""
+import sys
+import time
+
+from sqlite_user import jwt_security
+from sqlite_user.jwt_backends import BACKENDS, get_jwt_backend
+
+
+def bench(label: str, verify, tokens, number: int):
+    start = time.perf_counter()
+    for i in range(number):
+        assert verify(tokens[i % len(tokens)])
+    rate = number / (time.perf_counter() - start)
+    print(f"{label:<32} {rate:>12,.0f} tokens/s")
+    return rate
+
+
+def main():
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    distinct = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+
+    for name in BACKENDS:
+        try:
+            backend = get_jwt_backend(name)
+        except RuntimeError as e:
+            print(f"# {name}: skipped ({e})\n")
+            continue
+
+        jwt_security.jwt_backend = backend
+        tokens = [jwt_security.create_access_token({"sub": f"user-{i}"}) for i in range(distinct)]
+
+        print(f"# {name} backend, {distinct} distinct tokens")
+        uncached = bench("decode (no cache)", lambda token: backend.decode(
+            token, jwt_security.SECRET_KEY, algorithms=[jwt_security.ALGORITHM]), tokens, number)
+
+        jwt_security.token_cache.clear()
+        for token in tokens:  # warm-up: 모든 token을 cache에 적재
+            jwt_security.decode_token(token)
+        cached = bench("decode_token (cache hit)", jwt_security.decode_token, tokens, number)
+        print(f"{'speedup':<32} {cached / uncached:>12.1f} x\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,11 +3,13 @@ JWT Request Flow
 1. user join     -> POST /users
 2. user login    -> POST /token : access_token & refresh token
 3. user check    -> GET /users/me : access_token validation
-4. token reissue -> GET /refresh : refresh_token validation & access_token reissue
-5. logout
+4. token reissue -> POST /refresh : refresh_token validation & access_token + refresh_token reissue (rotation)
+5. logout        -> POST /logout : access_token의 jti와 token family 폐기
+6. public keys   -> GET /.well-known/jwks.json : RS256/EdDSA 공개 key (다른 서비스의 local 검증용)
 """
+import os
 import uvicorn
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from fastapi import Security
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 from fastapi.security.api_key import APIKeyHeader
@@ -16,8 +18,13 @@ from sqlalchemy.orm import Session
 from sqlite_user.db import Base, engine, get_db
 from sqlite_user.service import UserService
 from sqlite_user.jwt_security import create_access_token, create_refresh_token, decode_token
+from sqlite_user.jwt_security import get_jwks, new_token_family, revocation
 
 router = APIRouter(tags=["JWT Authentication"])
+# /.well-known 경로는 prefix 없이 app root에 등록
+jwks_router = APIRouter(tags=["JWT Authentication"])
+
+JWKS_MAX_AGE = int(os.getenv("JWKS_MAX_AGE", 300))
 
 # 데이터베이스 초기화
 Base.metadata.create_all(bind=engine)
@@ -27,8 +34,8 @@ oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
 api_key_header = APIKeyHeader(name="Authorization", auto_error=False)  # for jwt token
 
 
-# JWT 토큰 검증 후 사용자 정보 반환
-def get_current_user(api_key: str = Security(api_key_header)):
+# JWT access token 검증 후 claims 반환
+def get_token_payload(api_key: str = Security(api_key_header)):
     if not api_key or not api_key.startswith("Bearer "):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid or missing Authorization header"
@@ -36,14 +43,21 @@ def get_current_user(api_key: str = Security(api_key_header)):
 
     token = api_key[len("Bearer "):]
     payload = decode_token(token)
-    if not payload:
+    if not payload or payload.get("type") != "access":
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid or expired token")
 
-    username = payload.get("sub")
-    if not username:
+    # 폐기 여부: 대부분 Bloom filter에서 바로 통과, 양성일 때만 저장소 조회
+    if revocation.is_revoked(payload):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Token has been revoked")
+
+    if not payload.get("sub"):
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
+    return payload
+
 
-    return {"username": username}
+# JWT 토큰 검증 후 사용자 정보 반환
+def get_current_user(payload: dict = Depends(get_token_payload)):
+    return {"username": payload["sub"]}
 
 
 # 토큰 검증 절차를 거쳐 확인된 사용자 정보 반환
@@ -54,29 +68,31 @@ def read_users_me(current_user: dict = Depends(get_current_user)):
 
 # access_token과 refresh_token 발급
 @router.post("/token")
-def login(
+async def login(
     form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)
 ):
-    user = UserService.authenticate_user(db, form_data.username, form_data.password)
+    user = await UserService.authenticate_user_async(db, form_data.username, form_data.password)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid username or password",
         )
 
-    # 토큰 발급
-    access_token = create_access_token(data={"sub": user["username"]})
-    refresh_token = create_refresh_token(data={"sub": user["username"]})
+    # 토큰 발급: 로그인마다 새 token family
+    claims = {"sub": user["username"], "fam": new_token_family()}
+    access_token = create_access_token(data=claims)
+    refresh_token = create_refresh_token(data=claims)
     return {"access_token": access_token, "refresh_token": refresh_token, "token_type": "bearer"}
 
 
 # 리프레시 토큰을 통해 새로운 access_token 발급
+# rotation: refresh token은 1회만 사용 가능, 새 refresh token을 함께 발급
 @router.post("/refresh")
 def refresh_token(
     refresh_token: str, db: Session = Depends(get_db)
 ):
     payload = decode_token(refresh_token)
-    if not payload:
+    if not payload or payload.get("type") != "refresh" or not payload.get("jti"):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid or expired refresh token",
@@ -86,9 +102,33 @@ def refresh_token(
     if not username:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
 
-    # 새 access_token 발급
-    access_token = create_access_token(data={"sub": username})
-    return {"access_token": access_token, "token_type": "bearer"}
+    # 이미 사용된 refresh token이면 재사용(탈취) 의심 -> family 전체 폐기
+    family_id = payload.get("fam")
+    if not revocation.consume_refresh(payload["jti"], family_id, payload["exp"]):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Refresh token has been revoked")
+
+    # 새 access_token / refresh_token 발급 (같은 family 유지)
+    claims = {"sub": username, "fam": family_id or new_token_family()}
+    access_token = create_access_token(data=claims)
+    new_refresh_token = create_refresh_token(data=claims)
+    return {"access_token": access_token, "refresh_token": new_refresh_token, "token_type": "bearer"}
+
+
+# 로그아웃: 현재 access token과 같은 로그인에서 발급된 모든 token 폐기
+# 다른 worker process는 다음 token 검사 때 저장소의 폐기 feed로 반영 (재구성 주기를 기다리지 않음)
+@router.post("/logout")
+def logout(payload: dict = Depends(get_token_payload)):
+    revocation.revoke_token(payload["jti"], payload["exp"])
+    if payload.get("fam"):
+        revocation.revoke_family(payload["fam"])
+    return {"message": "Logout successful"}
+
+
+# 서명 검증용 공개 key 목록 (JWKS), verifier는 max-age 동안 cache
+@jwks_router.get("/.well-known/jwks.json")
+def jwks(response: Response):
+    response.headers["Cache-Control"] = f"public, max-age={JWKS_MAX_AGE}"
+    return get_jwks()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,79 @@
+"""
+검증된 Basic auth credential cache
+
+- 같은 username/password를 반복 전송하는 machine client -> 매 요청 DB 조회 + bcrypt 검증(수백 ms) 생략
+- plaintext 대신 process별 random key의 HMAC-SHA256(username + password) digest만 저장
+- username 단위 entry, LRU 크기 제한 + 짧은 TTL
+- update_user / delete_user 시 해당 username 무효화
+  (process 메모리 캐시라 다른 worker process의 entry는 TTL 만료까지 유효)
+- 검증과 무효화가 threadpool의 여러 thread에서 동시에 실행되므로 lock으로 보호
+"""
+import hashlib
+import hmac
+import os
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+CREDENTIAL_CACHE_TTL = float(os.getenv("BASIC_AUTH_CACHE_TTL", 60))
+CREDENTIAL_CACHE_SIZE = int(os.getenv("BASIC_AUTH_CACHE_SIZE", 1024))
+
+
+class CredentialCache:
+    def __init__(self, ttl: float = CREDENTIAL_CACHE_TTL, max_size: int = CREDENTIAL_CACHE_SIZE, key: bytes = None):
+        self.ttl = ttl
+        self.max_size = max_size
+        self._key = key or secrets.token_bytes(32)
+        self._data: "OrderedDict[str, tuple[float, bytes]]" = OrderedDict()
+        self._lock = threading.Lock()
+        # 무효화마다 증가: 검증 도중 비밀번호가 바뀐 경우 이전 검증 결과가 다시 캐시되지 않도록 사용
+        self.generation = 0
+
+    def _digest(self, username: str, password: str) -> bytes:
+        # username 길이를 prefix로 붙여 ("ab", "c") / ("a", "bc") 구분
+        message = f"{len(username)}:{username}:{password}".encode('utf-8')
+        return hmac.new(self._key, message, hashlib.sha256).digest()
+
+    def verify(self, username: str, password: str) -> bool:
+        candidate = self._digest(username, password)
+        with self._lock:
+            entry = self._data.get(username)
+            if entry is None:
+                return False
+            expires_at, digest = entry
+            if expires_at < time.monotonic():
+                self._data.pop(username, None)
+                return False
+            if not hmac.compare_digest(digest, candidate):
+                return False
+            self._data.move_to_end(username)
+            return True
+
+    def add(self, username: str, password: str, generation: Optional[int] = None):
+        digest = self._digest(username, password)
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return
+            self._data[username] = (time.monotonic() + self.ttl, digest)
+            self._data.move_to_end(username)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+
+    def invalidate(self, username: str):
+        with self._lock:
+            self.generation += 1
+            self._data.pop(username, None)
+
+    def clear(self):
+        with self._lock:
+            self.generation += 1
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+
+# process 전역 cache
+credential_cache = CredentialCache()
@@ -0,0 +1,109 @@
+"""
+Verifier-side JWKS cache (token을 검증하는 다른 서비스용)
+
+- auth app의 /.well-known/jwks.json을 가져와 kid -> 공개 key로 보관, 검증은 항상 local
+- background thread가 refresh_interval마다 갱신, 실패 시 기존 key 유지
+- 모르는 kid(rotation 직후)는 즉시 갱신하되 min_refresh_interval로 빈도 제한 -> 잘못된 token이 auth app을 두드리지 않음
+
+usage
+    jwks = JWKSClient("http://auth.internal/.well-known/jwks.json")
+    jwks.start()
+    claims = jwks.verify(token)  # InvalidTokenError on failure, access token만 허용
+    claims = jwks.verify(token, expected_type=None)  # type 검사 생략
+"""
+import json
+import logging
+import threading
+import time
+import urllib.request
+from typing import Callable, Dict, Optional
+
+import jwt
+
+from sqlite_user.jwt_backends import InvalidTokenError, unverified_header
+
+logger = logging.getLogger(__name__)
+
+
+class JWKSClient:
+    def __init__(self, jwks_url: str, algorithms=("RS256", "EdDSA"), refresh_interval: float = 300,
+                 min_refresh_interval: float = 30, timeout: float = 5, fetch: Optional[Callable[[], Dict]] = None):
+        self.jwks_url = jwks_url
+        self.algorithms = tuple(algorithms)
+        self.refresh_interval = refresh_interval
+        self.min_refresh_interval = min_refresh_interval
+        self.timeout = timeout
+        self._fetch = fetch or self._fetch_jwks
+        self._keys: Dict[str, jwt.PyJWK] = dict()
+        self._last_refresh = float("-inf")
+        self._refresh_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _fetch_jwks(self) -> Dict:
+        with urllib.request.urlopen(self.jwks_url, timeout=self.timeout) as response:
+            return json.load(response)
+
+    def refresh(self) -> bool:
+        """JWKS를 다시 가져와 key 교체, 실패 시 기존 key 유지"""
+        with self._refresh_lock:
+            self._last_refresh = time.monotonic()
+            try:
+                jwks = self._fetch()
+            except Exception as e:
+                logger.warning("JWKS refresh failed, keeping %d cached keys: %s", len(self._keys), e)
+                return False
+
+            keys = dict()
+            for jwk in jwks.get("keys", []):
+                if jwk.get("alg") not in self.algorithms or not jwk.get("kid"):
+                    continue
+                try:
+                    keys[jwk["kid"]] = jwt.PyJWK(jwk)
+                except jwt.PyJWTError as e:
+                    logger.warning("Skipping invalid JWK %s: %s", jwk.get("kid"), e)
+            self._keys = keys
+            return True
+
+    def start(self):
+        """첫 JWKS를 가져온 뒤 background refresh 시작"""
+        self.refresh()
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="jwks-refresh", daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while not self._stop.wait(self.refresh_interval):
+            self.refresh()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.timeout)
+            self._thread = None
+
+    def get_key(self, kid: str) -> Optional[jwt.PyJWK]:
+        key = self._keys.get(kid)
+        if key is None and time.monotonic() - self._last_refresh >= self.min_refresh_interval:
+            self.refresh()
+            key = self._keys.get(kid)
+        return key
+
+    def verify(self, token: str, expected_type: Optional[str] = "access", **options) -> Dict:
+        """
+        서명(kid별 공개 key), exp, type claim 검증 후 claims 반환, options는 jwt.decode로 전달 (audience 등)
+        기본은 access token만 허용 (refresh token으로 API 호출 방지), expected_type=None이면 type 검사 생략
+        """
+        kid = unverified_header(token).get("kid")
+        key = self.get_key(kid) if isinstance(kid, str) else None
+        if key is None:
+            raise InvalidTokenError(f"Unknown signing key: {kid}")
+        try:
+            # key에 등록된 algorithm만 허용 (header의 alg 바꿔치기 방지)
+            claims = jwt.decode(token, key.key, algorithms=[key.algorithm_name], **options)
+        except jwt.PyJWTError as e:
+            raise InvalidTokenError(str(e)) from e
+        if expected_type is not None and claims.get("type") != expected_type:
+            raise InvalidTokenError(f"Unexpected token type: {claims.get('type')} (expected {expected_type})")
+        return claims
@@ -0,0 +1,137 @@
+"""
+JWT encode/decode backend
+
+- jose: python-jose (기본값)
+- hs256: 표준 라이브러리(hmac/base64/json)만 사용하는 HS256 전용 구현, 범용 JOSE 처리가 없어 가장 빠름
+- pyjwt: PyJWT (optional dependency), RS256/EdDSA 등 비대칭 서명은 이 backend 사용 (cryptography 필요)
+- JWT_BACKEND 환경 변수로 선택, 모든 backend의 HS256 token은 서로 호환
+- headers: kid 등 추가 JOSE header
+- 검증 실패(서명/만료/형식)는 모두 InvalidTokenError로 통일
+"""
+import base64
+import hashlib
+import hmac
+import json
+import time
+from datetime import datetime
+from typing import Dict
+
+
+class InvalidTokenError(Exception):
+    """서명 불일치, 만료, 형식 오류 등 검증 실패"""
+
+
+class JoseBackend:
+    name = "jose"
+
+    def __init__(self):
+        from jose import JWTError, jwt
+        self._jwt = jwt
+        self._error = JWTError
+
+    def encode(self, claims: Dict, key, algorithm: str, headers: Dict = None) -> str:
+        return self._jwt.encode(claims, key, algorithm=algorithm, headers=headers)
+
+    def decode(self, token: str, key, algorithms: list) -> Dict:
+        try:
+            return self._jwt.decode(token, key, algorithms=algorithms)
+        except self._error as e:
+            raise InvalidTokenError(str(e)) from e
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+def _b64decode(data: str) -> bytes:
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+
+def unverified_header(token: str) -> Dict:
+    """서명 검증 전 JOSE header (kid로 검증 key를 고르기 위한 용도)"""
+    try:
+        header = json.loads(_b64decode(token.split(".", 1)[0]))
+    except (ValueError, AttributeError) as e:
+        raise InvalidTokenError(str(e)) from e
+    if not isinstance(header, dict):
+        raise InvalidTokenError("Invalid header")
+    return header
+
+
+class HS256Backend:
+    name = "hs256"
+    _header = _b64encode(json.dumps({"alg": "HS256", "typ": "JWT"}, separators=(",", ":")).encode())
+
+    @staticmethod
+    def _check_algorithm(algorithms):
+        if "HS256" not in algorithms:
+            raise ValueError("hs256 backend only supports the HS256 algorithm")
+
+    def encode(self, claims: Dict, key: str, algorithm: str, headers: Dict = None) -> str:
+        self._check_algorithm([algorithm])
+        claims = {
+            name: int(value.timestamp()) if isinstance(value, datetime) else value
+            for name, value in claims.items()
+        }
+        header = self._header
+        if headers:
+            header = _b64encode(json.dumps({**headers, "alg": "HS256", "typ": "JWT"}, separators=(",", ":")).encode())
+        signing_input = f"{header}.{_b64encode(json.dumps(claims, separators=(',', ':')).encode())}"
+        signature = hmac.new(key.encode(), signing_input.encode("ascii"), hashlib.sha256).digest()
+        return f"{signing_input}.{_b64encode(signature)}"
+
+    def decode(self, token: str, key, algorithms: list) -> Dict:
+        self._check_algorithm(algorithms)
+        try:
+            header, payload, signature = token.split(".")
+            expected = hmac.new(key.encode(), f"{header}.{payload}".encode("ascii"), hashlib.sha256).digest()
+            if not hmac.compare_digest(expected, _b64decode(signature)):
+                raise InvalidTokenError("Signature verification failed")
+            # 서명 확인 후 header의 alg 확인 (alg=none 등 algorithm 바꿔치기 방지)
+            if json.loads(_b64decode(header)).get("alg") != "HS256":
+                raise InvalidTokenError("The specified alg value is not allowed")
+            claims = json.loads(_b64decode(payload))
+        except (ValueError, AttributeError) as e:
+            raise InvalidTokenError(str(e)) from e
+        if not isinstance(claims, dict):
+            raise InvalidTokenError("Invalid payload")
+
+        now = time.time()
+        for name in ("exp", "nbf"):
+            if name in claims and not isinstance(claims[name], (int, float)):
+                raise InvalidTokenError(f"Invalid {name} claim")
+        if "exp" in claims and claims["exp"] <= now:
+            raise InvalidTokenError("Signature has expired")
+        if "nbf" in claims and claims["nbf"] > now:
+            raise InvalidTokenError("The token is not yet valid (nbf)")
+        return claims
+
+
+class PyJWTBackend:
+    name = "pyjwt"
+
+    def __init__(self):
+        try:
+            import jwt
+        except ImportError as e:
+            raise RuntimeError("JWT_BACKEND=pyjwt requires the PyJWT package (pip install PyJWT)") from e
+        self._jwt = jwt
+        self._error = jwt.PyJWTError
+
+    def encode(self, claims: Dict, key, algorithm: str, headers: Dict = None) -> str:
+        return self._jwt.encode(claims, key, algorithm=algorithm, headers=headers)
+
+    def decode(self, token: str, key, algorithms: list) -> Dict:
+        try:
+            return self._jwt.decode(token, key, algorithms=algorithms)
+        except self._error as e:
+            raise InvalidTokenError(str(e)) from e
+
+
+BACKENDS = {backend.name: backend for backend in (JoseBackend, HS256Backend, PyJWTBackend)}
+
+
+def get_jwt_backend(name: str):
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown JWT backend: {name} (expected one of {', '.join(BACKENDS)})")
+    return BACKENDS[name]()
@@ -0,0 +1,203 @@
+"""
+비대칭 JWT 서명 key 관리 (RS256 / EdDSA)
+
+- private key는 JWT_KEYS_DIR의 <kid>.pem 파일, 가장 최근 파일이 서명용 active key (JWT_ACTIVE_KID로 고정 가능)
+- token header의 kid로 검증 key 선택 -> rotation 이후에도 이전 key로 서명된 token 검증 가능
+- 공개 key는 /.well-known/jwks.json으로 배포, 다른 서비스는 secret 없이 검증 (sqlite_user.jwks_client)
+- key 디렉터리는 JWT_KEYS_RELOAD 주기로 다시 읽음 -> 다른 process에서 rotate한 key 반영
+- algorithm과 맞지 않는 key 파일(e.g. RS256 -> EdDSA 전환 후 남은 RSA key)은 경고 후 제외
+- 운영 환경은 배포 전에 key를 만들어 두고 모든 worker가 같은 JWT_KEYS_DIR을 사용
+  (JWT_KEYS_CREATE_IF_MISSING=true는 개발용: key가 없으면 각 worker가 자기 key를 생성)
+
+rotation 절차
+    python -m sqlite_user.jwt_keys rotate    # 새 key 생성 (active), 이전 key는 검증용으로 유지
+    python -m sqlite_user.jwt_keys prune 2   # 최근 2개만 남기고 삭제 (이전 key의 token이 모두 만료된 뒤)
+"""
+import argparse
+import logging
+import os
+import secrets
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from cryptography.exceptions import UnsupportedAlgorithm
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ed25519, rsa
+from jwt.algorithms import OKPAlgorithm, RSAAlgorithm
+
+logger = logging.getLogger(__name__)
+
+ASYMMETRIC_ALGORITHMS = ("RS256", "EdDSA")
+# algorithm별 private key type (다른 type의 key로 서명하면 encode 시 실패)
+PRIVATE_KEY_TYPES = {"RS256": rsa.RSAPrivateKey, "EdDSA": ed25519.Ed25519PrivateKey}
+
+JWT_KEYS_DIR = os.getenv("JWT_KEYS_DIR", "./jwt_keys")
+JWT_ACTIVE_KID = os.getenv("JWT_ACTIVE_KID")
+JWT_KEYS_RELOAD = float(os.getenv("JWT_KEYS_RELOAD", 60))
+JWT_KEYS_CREATE_IF_MISSING = os.getenv("JWT_KEYS_CREATE_IF_MISSING", "false").lower() == "true"
+
+
+def generate_private_key(algorithm: str):
+    if algorithm == "RS256":
+        return rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    if algorithm == "EdDSA":
+        return ed25519.Ed25519PrivateKey.generate()
+    raise ValueError(f"Unsupported asymmetric algorithm: {algorithm} (expected one of {', '.join(ASYMMETRIC_ALGORITHMS)})")
+
+
+def public_jwk(public_key, kid: str, algorithm: str) -> Dict:
+    converter = RSAAlgorithm if algorithm == "RS256" else OKPAlgorithm
+    jwk = converter.to_jwk(public_key, as_dict=True)
+    jwk.update({"kid": kid, "alg": algorithm, "use": "sig"})
+    return jwk
+
+
+class SigningKey:
+    def __init__(self, kid: str, algorithm: str, private_key):
+        self.kid = kid
+        self.algorithm = algorithm
+        self.private_key = private_key
+        self.public_key = private_key.public_key()
+
+    def public_jwk(self) -> Dict:
+        return public_jwk(self.public_key, self.kid, self.algorithm)
+
+
+class SigningKeys:
+    def __init__(self, algorithm: str, keys_dir: str = JWT_KEYS_DIR, active_kid: Optional[str] = JWT_ACTIVE_KID,
+                 reload_interval: float = JWT_KEYS_RELOAD, create_if_missing: bool = JWT_KEYS_CREATE_IF_MISSING):
+        if algorithm not in ASYMMETRIC_ALGORITHMS:
+            raise ValueError(f"Unsupported asymmetric algorithm: {algorithm}")
+        self.algorithm = algorithm
+        self.keys_dir = Path(keys_dir)
+        self.active_kid = active_kid
+        self.reload_interval = reload_interval
+        self._keys: Dict[str, SigningKey] = dict()
+        self._rejected: Dict[str, float] = dict()  # kid -> mtime, 경고는 파일이 바뀔 때만
+        self._active: Optional[SigningKey] = None
+        self._next_reload = 0.0
+        self._lock = threading.Lock()
+        self.reload()
+        # key가 없으면 첫 key 생성 (개발 환경용, worker마다 다른 key가 생길 수 있음)
+        if self._active is None and create_if_missing:
+            self.rotate()
+
+    def _key_files(self) -> List[Path]:
+        if not self.keys_dir.is_dir():
+            return []
+        return sorted(self.keys_dir.glob("*.pem"), key=lambda path: (path.stat().st_mtime, path.stem))
+
+    def reload(self):
+        with self._lock:
+            keys = dict()
+            for path in self._key_files():
+                kid = path.stem
+                cached = self._keys.get(kid)
+                if cached is None:
+                    try:
+                        mtime = path.stat().st_mtime
+                        if self._rejected.get(kid) == mtime:
+                            continue
+                        private_key = serialization.load_pem_private_key(path.read_bytes(), password=None)
+                    except FileNotFoundError:
+                        continue  # 다른 process가 prune
+                    except (ValueError, TypeError, UnsupportedAlgorithm, OSError) as e:
+                        # 손상/암호화된 파일 하나 때문에 모든 요청이 실패하지 않도록 제외 (파일이 바뀌면 다시 시도)
+                        logger.warning("Skipping unreadable signing key %s: %s", path, e)
+                        self._rejected[kid] = mtime
+                        continue
+                    if not isinstance(private_key, PRIVATE_KEY_TYPES[self.algorithm]):
+                        logger.warning("Skipping signing key %s: %s key does not match %s",
+                                       path, type(private_key).__name__, self.algorithm)
+                        self._rejected[kid] = mtime
+                        continue
+                    cached = SigningKey(kid, self.algorithm, private_key)
+                keys[kid] = cached
+            self._keys = keys
+            # active: 지정된 kid, 없으면 가장 최근 key
+            active_kid = self.active_kid if self.active_kid in keys else next(reversed(keys), None)
+            self._active = keys.get(active_kid)
+            self._next_reload = time.monotonic() + self.reload_interval
+
+    def _maybe_reload(self):
+        if time.monotonic() >= self._next_reload:
+            self.reload()
+
+    def rotate(self) -> SigningKey:
+        """새 key 생성 후 active로 사용, 이전 key는 검증용으로 유지"""
+        private_key = generate_private_key(self.algorithm)
+        kid = f"{datetime.now(timezone.utc):%Y%m%d%H%M%S}-{secrets.token_hex(4)}"
+        self.keys_dir.mkdir(parents=True, exist_ok=True)
+        pem = private_key.private_bytes(
+            serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+        )
+        # 처음부터 0600인 임시 파일(*.pem glob 제외)에 쓴 뒤 rename
+        # -> 다른 사용자가 읽을 수 있는 순간이 없고, 다른 worker의 reload()는 완성된 파일만 봄
+        tmp_path = self.keys_dir / f".{kid}.pem.tmp"
+        fd = os.open(tmp_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o600)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(pem)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.keys_dir / f"{kid}.pem")
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        self.active_kid = None
+        self.reload()
+        return self._keys[kid]
+
+    def prune(self, keep: int) -> List[str]:
+        """최근 keep개 key만 남기고 삭제, 삭제된 kid 반환"""
+        files = self._key_files()
+        removed = files[:-keep] if keep > 0 else files
+        for path in removed:
+            path.unlink()
+        self.reload()
+        return [path.stem for path in removed]
+
+    @property
+    def active(self) -> SigningKey:
+        self._maybe_reload()
+        return self._active
+
+    def get(self, kid: str) -> Optional[SigningKey]:
+        key = self._keys.get(kid)
+        if key is None and time.monotonic() >= self._next_reload:
+            self.reload()
+            key = self._keys.get(kid)
+        return key
+
+    def jwks(self) -> Dict:
+        self._maybe_reload()
+        return {"keys": [key.public_jwk() for key in self._keys.values()]}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="JWT signing key rotation")
+    parser.add_argument("--algorithm", default=os.getenv("JWT_ALGORITHM", "RS256"), choices=ASYMMETRIC_ALGORITHMS)
+    parser.add_argument("--keys-dir", default=JWT_KEYS_DIR)
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("rotate", help="generate a new active signing key")
+    prune = commands.add_parser("prune", help="delete all but the newest keys")
+    prune.add_argument("keep", type=int)
+    commands.add_parser("list", help="print the kids, the last one is active")
+    args = parser.parse_args()
+
+    keys = SigningKeys(args.algorithm, keys_dir=args.keys_dir, active_kid=None, create_if_missing=False)
+    if args.command == "rotate":
+        print(keys.rotate().kid)
+    elif args.command == "prune":
+        for kid in keys.prune(args.keep):
+            print(f"removed {kid}")
+    else:
+        for jwk in keys.jwks()["keys"]:
+            print(jwk["kid"])
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,45 @@
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
-from jose import JWTError, jwt
 from passlib.context import CryptContext
 
+from sqlite_user.jwt_backends import InvalidTokenError, get_jwt_backend, unverified_header
+from sqlite_user.token_store import TokenRevocation, get_token_store
+
 # JWT 설정
 SECRET_KEY = "your_secret_key"  # In Production, environment variables recommend
-ALGORITHM = "HS256"
+# HS256(공유 secret) 또는 RS256 / EdDSA(비대칭, kid별 key + JWKS 공개)
+ALGORITHM = os.getenv("JWT_ALGORITHM", "HS256")
 ACCESS_TOKEN_EXPIRE_MINUTES = 15
 REFRESH_TOKEN_EXPIRE_DAYS = 7
 
+# encode/decode backend (jose | hs256 | pyjwt), 검증 결과 cache 크기 (0이면 비활성)
+# 비대칭 algorithm은 PyJWT + cryptography 필요 (python-jose는 EdDSA 미지원)
+JWT_BACKEND = os.getenv("JWT_BACKEND", "jose" if ALGORITHM == "HS256" else "pyjwt")
+TOKEN_CACHE_SIZE = int(os.getenv("JWT_TOKEN_CACHE_SIZE", 4096))
+
+jwt_backend = get_jwt_backend(JWT_BACKEND)
+
+# 비대칭 서명 key (JWT_KEYS_DIR의 <kid>.pem), HS256이면 사용하지 않음
+if ALGORITHM == "HS256":
+    signing_keys = None
+else:
+    from sqlite_user.jwt_keys import SigningKeys
+    signing_keys = SigningKeys(ALGORITHM)
+    # 사용할 key가 없으면 첫 요청의 500 대신 시작 시 실패
+    if signing_keys.active is None:
+        raise RuntimeError(
+            f"No {ALGORITHM} signing key in {signing_keys.keys_dir}: "
+            f"run `python -m sqlite_user.jwt_keys --algorithm {ALGORITHM} rotate` before starting, "
+            "or set JWT_KEYS_CREATE_IF_MISSING=true (development only)"
+        )
+
+# 폐기/rotation 저장소 (TOKEN_STORE: memory | sqlite | redis)
+revocation = TokenRevocation(get_token_store(), family_ttl=timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS).total_seconds())
+
 # 비밀번호 해싱 설정
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
@@ -22,26 +54,100 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+def _encode(claims: dict) -> str:
+    if signing_keys is None:
+        return jwt_backend.encode(claims, SECRET_KEY, ALGORITHM)
+    key = signing_keys.active
+    return jwt_backend.encode(claims, key.private_key, ALGORITHM, headers={"kid": key.kid})
+
+
+def _verification_key(token: str):
+    if signing_keys is None:
+        return SECRET_KEY
+    # header의 kid로 검증 key 선택 (rotation 이전 key로 서명된 token 포함)
+    kid = unverified_header(token).get("kid")
+    key = signing_keys.get(kid) if isinstance(kid, str) else None
+    if key is None:
+        raise InvalidTokenError(f"Unknown signing key: {kid}")
+    return key.public_key
+
+
+# 공개 key 목록 (/.well-known/jwks.json), HS256이면 공개할 key 없음
+def get_jwks() -> dict:
+    return signing_keys.jwks() if signing_keys else {"keys": []}
+
+
+# 로그인 단위 token family id (refresh rotation / logout 시 함께 폐기)
+def new_token_family() -> str:
+    return uuid.uuid4().hex
+
+
 # 액세스 토큰 생성
 def create_access_token(data: dict, expires_delta: timedelta = None):
     to_encode = data.copy()
     expire = datetime.now(timezone.utc) + (expires_delta or timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES))
-    to_encode.update({"exp": expire})
-    return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    to_encode.update({"exp": expire, "jti": uuid.uuid4().hex, "type": "access"})
+    return _encode(to_encode)
 
 
 # 리프레시 토큰 생성
 def create_refresh_token(data: dict, expires_delta: timedelta = None):
     to_encode = data.copy()
     expire = datetime.now(timezone.utc) + (expires_delta or timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS))
-    to_encode.update({"exp": expire})
-    return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    to_encode.update({"exp": expire, "jti": uuid.uuid4().hex, "type": "refresh"})
+    return _encode(to_encode)
+
+
+class TokenCache:
+    """
+    검증된 token -> claims LRU cache, entry는 token의 exp 시각까지만 유효
+    sync dependency(get_token_payload)가 threadpool의 여러 thread에서 동시에 호출하므로 lock으로 보호
+    """
+
+    def __init__(self, max_size: int = TOKEN_CACHE_SIZE):
+        self.max_size = max_size
+        self._data: "OrderedDict[str, dict]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, token: str):
+        with self._lock:
+            claims = self._data.get(token)
+            if claims is None:
+                return None
+            if claims["exp"] <= time.time():
+                self._data.pop(token, None)
+                return None
+            self._data.move_to_end(token)
+            return claims
+
+    def set(self, token: str, claims: dict):
+        # exp 없는 token은 만료 시각을 알 수 없으므로 캐시하지 않음
+        if not self.max_size or not isinstance(claims.get("exp"), (int, float)):
+            return
+        with self._lock:
+            self._data[token] = claims
+            self._data.move_to_end(token)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+
+token_cache = TokenCache()
 
 
-# 토큰 디코딩 및 검증
+# 토큰 디코딩 및 검증: 같은 token의 반복 검증은 cache에서 반환 (서명 검증/JSON parse 생략)
 def decode_token(token: str):
-    try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        return payload
-    except JWTError:
-        return None
+    claims = token_cache.get(token)
+    if claims is None:
+        try:
+            claims = jwt_backend.decode(token, _verification_key(token), algorithms=[ALGORITHM])
+        except InvalidTokenError:
+            return None
+        token_cache.set(token, claims)
+    return dict(claims)  # 호출 측 변경이 cache에 반영되지 않도록 복사본 반환
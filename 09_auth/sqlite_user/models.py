@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String
+from sqlalchemy import Column, Float, Integer, String
 from sqlite_user.db import Base
 
 
@@ -8,3 +8,21 @@ class User(Base):
     id = Column(Integer, primary_key=True, index=True)
     username = Column(String, unique=True, index=True, nullable=False)
     password = Column(String, nullable=False)
+
+
+# 폐기된 JWT(jti/family) 및 사용된 refresh token 기록, expires_at 이후 삭제
+class RevokedToken(Base):
+    __tablename__ = "revoked_tokens"
+
+    key = Column(String, primary_key=True)
+    expires_at = Column(Float, nullable=False, index=True)
+
+
+# 폐기 feed: 다른 worker process가 seq 이후의 폐기만 읽어 Bloom filter에 반영 (AUTOINCREMENT: seq 재사용 없음)
+class RevocationEvent(Base):
+    __tablename__ = "revocation_events"
+    __table_args__ = {"sqlite_autoincrement": True}
+
+    seq = Column(Integer, primary_key=True)
+    key = Column(String, nullable=False)
+    expires_at = Column(Float, nullable=False, index=True)
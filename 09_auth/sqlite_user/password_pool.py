@@ -0,0 +1,66 @@
+"""
+bcrypt 전용 worker pool
+
+- bcrypt hash/verify는 요청당 수백 ms의 CPU 작업 -> sync endpoint에서 돌리면 Starlette threadpool slot을 점유해
+  로그인 폭주 시 다른 sync endpoint까지 대기
+- bcrypt는 연산 중 GIL을 해제하므로 별도 크기의 ThreadPoolExecutor로 충분 (process pool 불필요)
+- 대기열 상한(BCRYPT_MAX_QUEUE)을 넘으면 쌓아두지 않고 즉시 PasswordPoolBusy -> API에서 503 응답
+- work factor(BCRYPT_ROUNDS)는 환경 변수로 설정, 기존 hash는 저장된 salt의 rounds로 검증되므로 변경해도 호환
+"""
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import bcrypt
+
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", 12))
+BCRYPT_WORKERS = int(os.getenv("BCRYPT_WORKERS", min(4, os.cpu_count() or 1)))
+BCRYPT_MAX_QUEUE = int(os.getenv("BCRYPT_MAX_QUEUE", 16))
+
+
+class PasswordPoolBusy(Exception):
+    """실행 중 + 대기 중 작업이 상한에 도달"""
+
+
+def hash_password_sync(password: str, rounds: int = BCRYPT_ROUNDS) -> str:
+    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt(rounds=rounds)).decode('utf-8')
+
+
+def verify_password_sync(plain_password: str, hashed_password: str) -> bool:
+    return bcrypt.checkpw(plain_password.encode('utf-8'), hashed_password.encode('utf-8'))
+
+
+class PasswordPool:
+    def __init__(self, workers: int = BCRYPT_WORKERS, max_queue: int = BCRYPT_MAX_QUEUE, rounds: int = BCRYPT_ROUNDS):
+        self.workers = workers
+        self.max_queue = max_queue
+        self.rounds = rounds
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bcrypt")
+        # event loop thread에서만 증감 -> lock 불필요
+        self._pending = 0
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    async def _run(self, func, *args):
+        if self._pending >= self.workers + self.max_queue:
+            raise PasswordPoolBusy()
+        self._pending += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+        finally:
+            self._pending -= 1
+
+    async def hash(self, password: str) -> str:
+        return await self._run(hash_password_sync, password, self.rounds)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return await self._run(verify_password_sync, plain_password, hashed_password)
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+# process 전역 pool
+password_pool = PasswordPool()
@@ -1,27 +1,52 @@
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 from sqlite_user.models import User
 from sqlite_user.schemas import UserCreate
+from sqlite_user.password_pool import password_pool, PasswordPoolBusy
+from sqlite_user.credential_cache import credential_cache
 from fastapi import HTTPException
-import bcrypt
 
 
-# Hash a plaintext password
-def hash_password(password: str) -> str:
-    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+# async endpoint의 sync DB 작업(query/commit)은 Starlette threadpool에서 실행 -> event loop 차단 방지
+def _find_user(db: Session, username: str):
+    return db.query(User).filter(User.username == username).first()
 
 
-# Verify a plaintext password against a hashed password
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return bcrypt.checkpw(plain_password.encode('utf-8'), hashed_password.encode('utf-8'))
+def _add_user(db: Session, user: User) -> User:
+    db.add(user)
+    db.commit()
+    db.refresh(user)
+    return user
+
+
+# bcrypt를 전용 worker pool에서 실행, pool 대기열이 가득 차면 503
+async def hash_password_async(password: str) -> str:
+    try:
+        return await password_pool.hash(password)
+    except PasswordPoolBusy:
+        raise HTTPException(status_code=503, detail="Too many authentication requests", headers={"Retry-After": "1"})
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    try:
+        return await password_pool.verify(plain_password, hashed_password)
+    except PasswordPoolBusy:
+        raise HTTPException(status_code=503, detail="Too many authentication requests", headers={"Retry-After": "1"})
 
 
 class UserService:
     @staticmethod
-    def authenticate_user(db: Session, username: str, password: str):
-        """사용자 인증 로직"""
-        user = db.query(User).filter(User.username == username).first()
-        if not user or not verify_password(password, user.password):
+    async def authenticate_user_async(db: Session, username: str, password: str):
+        """사용자 인증 로직 (async endpoint용, bcrypt는 worker pool에서 실행)"""
+        # 최근 검증된 credential이면 DB 조회/bcrypt 생략
+        if credential_cache.verify(username, password):
+            return {"message": "Login successful", "username": username}
+
+        generation = credential_cache.generation
+        user = await run_in_threadpool(_find_user, db, username)
+        if not user or not await verify_password_async(password, user.password):
             raise HTTPException(status_code=401, detail="Invalid username or password")
+        credential_cache.add(user.username, password, generation)
         return {"message": "Login successful", "username": user.username}
 
     @staticmethod
@@ -29,17 +54,14 @@ class UserService:
         return db.query(User).all()
 
     @staticmethod
-    def create_user(db: Session, user: UserCreate):
-        existing_user = db.query(User).filter(User.username == user.username).first()
+    async def create_user(db: Session, user: UserCreate):
+        existing_user = await run_in_threadpool(_find_user, db, user.username)
         if existing_user:
             raise HTTPException(status_code=400, detail="Username already exists")
 
-        hashed_password = hash_password(user.password)
+        hashed_password = await hash_password_async(user.password)
         new_user = User(username=user.username, password=hashed_password)
-        db.add(new_user)
-        db.commit()
-        db.refresh(new_user)
-        return new_user
+        return await run_in_threadpool(_add_user, db, new_user)
 
     @staticmethod
     def get_user(db: Session, username: str):
@@ -50,18 +72,19 @@ class UserService:
 
     # 현재 비밀번호를 검증한 후 비밀번호를 변경
     @staticmethod
-    def update_user(db: Session, username: str, current_password: str, new_password: str):
-        user = db.query(User).filter(User.username == username).first()
+    async def update_user(db: Session, username: str, current_password: str, new_password: str):
+        user = await run_in_threadpool(_find_user, db, username)
         if not user:
             raise HTTPException(status_code=404, detail="User not found")
 
         # 현재 비밀번호 검증
-        if not verify_password(current_password, user.password):
+        if not await verify_password_async(current_password, user.password):
             raise HTTPException(status_code=401, detail="Current password is incorrect")
 
         # 새 비밀번호 해싱 후 저장
-        user.password = hash_password(new_password)
-        db.commit()
+        user.password = await hash_password_async(new_password)
+        await run_in_threadpool(db.commit)
+        credential_cache.invalidate(username)
         return {"message": "Password updated successfully"}
 
     @staticmethod
@@ -72,4 +95,5 @@ class UserService:
 
         db.delete(user)
         db.commit()
+        credential_cache.invalidate(username)
         return {"message": "User deleted successfully"}
@@ -0,0 +1,372 @@
+"""
+JWT 폐기(revocation) / refresh token rotation 저장소
+
+- 모든 token에 jti, 로그인 단위 family id(fam) 부여
+  - /refresh: refresh token은 1회만 사용 가능 (used:<jti>), 재사용 감지 시 family 전체 폐기
+  - /logout: access token의 jti와 family 폐기 -> 같은 로그인에서 발급된 token 모두 무효
+- 폐기 목록(jti:<id>, fam:<id>)은 TTL이 지나면 삭제 (token 만료 이후에는 기록 불필요)
+- 저장소: memory / sqlite(기본값, users.db) / redis (TOKEN_STORE 환경 변수)
+- Bloom filter front: "폐기되지 않음"이 대부분이므로 filter에 없으면 저장소 조회 없이 통과
+  - 같은 process의 폐기는 즉시 반영
+  - 다른 process의 폐기는 매 검사 전에 저장소의 폐기 feed(revoked_since)에서 마지막 cursor 이후 key만 받아 반영
+    - sqlite: revocation_events table의 seq range 조회 (새 폐기가 없으면 빈 primary key range 1회)
+    - redis: pub/sub으로 push받은 key (재구독 시 전체 목록으로 보충), 검사 시 network 왕복 없음
+  - TOKEN_BLOOM_REFRESH 주기로 저장소에서 재구성 (만료된 key 정리), background thread에서 실행, 첫 구성만 동기
+  - 재구성은 폐기 key(jti:, fam:) prefix만 조회, refresh 사용 기록(used:)은 읽지 않음
+  - filter 양성(폐기 또는 false positive)일 때만 저장소 확인
+"""
+import bisect
+import hashlib
+import logging
+import math
+import os
+import threading
+import time
+from typing import Iterable, Optional
+
+import redis
+from sqlalchemy import delete, func, select
+from sqlalchemy.exc import IntegrityError
+
+from sqlite_user.db import SessionLocal
+from sqlite_user.models import RevocationEvent, RevokedToken
+
+logger = logging.getLogger(__name__)
+
+TOKEN_STORE = os.getenv("TOKEN_STORE", "sqlite")
+TOKEN_BLOOM_CAPACITY = int(os.getenv("TOKEN_BLOOM_CAPACITY", 100000))
+TOKEN_BLOOM_ERROR_RATE = float(os.getenv("TOKEN_BLOOM_ERROR_RATE", 0.001))
+TOKEN_BLOOM_REFRESH = float(os.getenv("TOKEN_BLOOM_REFRESH", 30))
+
+# key prefix: 폐기 목록(bloom 재구성 대상)과 refresh token 사용 기록을 분리
+REVOKED_PREFIXES = ("jti:", "fam:")
+USED_PREFIX = "used:"
+
+
+def _prefix_end(prefix: str) -> str:
+    """prefix로 시작하는 모든 문자열보다 큰 최소 문자열 (index range 조회용)"""
+    return prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+
+class BloomFilter:
+    """고정 크기 Bloom filter (blake2b double hashing), 삭제 불가 -> 주기적으로 새로 구성"""
+
+    def __init__(self, capacity: int = TOKEN_BLOOM_CAPACITY, error_rate: float = TOKEN_BLOOM_ERROR_RATE):
+        self.size = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, key: str):
+        digest = hashlib.blake2b(key.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hash_count))
+
+    def add(self, key: str):
+        for position in self._positions(key):
+            self._bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, key: str) -> bool:
+        return all(self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+
+
+class MemoryTokenStore:
+    """Process-local store, for tests and single-process runs"""
+
+    def __init__(self):
+        self._data = dict()
+        self._lock = threading.Lock()
+        self._events = list()  # (seq, key, expires_at), seq 순
+        self._seq = 0
+
+    def add(self, key: str, expires_at: float):
+        with self._lock:
+            self._data[key] = expires_at
+            self._seq += 1
+            self._events.append((self._seq, key, expires_at))
+
+    def add_if_absent(self, key: str, expires_at: float) -> bool:
+        with self._lock:
+            if self.contains(key):
+                return False
+            self._data[key] = expires_at
+            return True
+
+    def contains(self, key: str) -> bool:
+        expires_at = self._data.get(key)
+        return expires_at is not None and expires_at > time.time()
+
+    def keys(self, prefix: str = "") -> Iterable[str]:
+        now = time.time()
+        with self._lock:
+            return [key for key, expires_at in self._data.items() if key.startswith(prefix) and expires_at > now]
+
+    def revoked_since(self, cursor: Optional[int]):
+        """cursor 이후 add()된 key와 새 cursor, cursor가 None이면 현재 위치만 반환"""
+        with self._lock:
+            if cursor is None:
+                return [], self._seq
+            start = bisect.bisect_right(self._events, cursor, key=lambda event: event[0])
+            return [key for _, key, _ in self._events[start:]], self._seq
+
+    def purge_expired(self):
+        now = time.time()
+        with self._lock:
+            for key in [key for key, expires_at in self._data.items() if expires_at <= now]:
+                del self._data[key]
+            self._events = [event for event in self._events if event[2] > now]
+
+
+class SQLiteTokenStore:
+    """revoked_tokens table (sqlite_user.db), 만료 row는 purge_expired() 호출(bloom 재구성) 시 삭제"""
+
+    def __init__(self, session_factory=SessionLocal):
+        self.session_factory = session_factory
+
+    def add(self, key: str, expires_at: float):
+        with self.session_factory() as session:
+            session.merge(RevokedToken(key=key, expires_at=expires_at))
+            session.add(RevocationEvent(key=key, expires_at=expires_at))
+            session.commit()
+
+    def add_if_absent(self, key: str, expires_at: float) -> bool:
+        with self.session_factory() as session:
+            # 만료된 같은 key가 남아 있으면 먼저 삭제, primary key 충돌로 원자적 1회 보장
+            session.execute(delete(RevokedToken).where(
+                RevokedToken.key == key, RevokedToken.expires_at <= time.time()
+            ))
+            session.add(RevokedToken(key=key, expires_at=expires_at))
+            try:
+                session.commit()
+            except IntegrityError:
+                session.rollback()
+                return False
+            return True
+
+    def contains(self, key: str) -> bool:
+        with self.session_factory() as session:
+            row = session.get(RevokedToken, key)
+            return row is not None and row.expires_at > time.time()
+
+    def keys(self, prefix: str = "") -> Iterable[str]:
+        stmt = select(RevokedToken.key).where(RevokedToken.expires_at > time.time())
+        if prefix:
+            # primary key index range 조회 (다른 prefix의 row는 읽지 않음)
+            stmt = stmt.where(RevokedToken.key >= prefix, RevokedToken.key < _prefix_end(prefix))
+        with self.session_factory() as session:
+            return list(session.scalars(stmt))
+
+    def revoked_since(self, cursor: Optional[int]):
+        """cursor(seq) 이후 add()된 key와 새 cursor, cursor가 None이면 현재 위치만 반환"""
+        with self.session_factory() as session:
+            if cursor is None:
+                return [], session.scalar(select(func.max(RevocationEvent.seq))) or 0
+            rows = session.execute(
+                select(RevocationEvent.seq, RevocationEvent.key).where(RevocationEvent.seq > cursor).order_by(RevocationEvent.seq)
+            ).all()
+        return [key for _, key in rows], (rows[-1].seq if rows else cursor)
+
+    def purge_expired(self):
+        now = time.time()
+        with self.session_factory() as session:
+            session.execute(delete(RevokedToken).where(RevokedToken.expires_at <= now))
+            session.execute(delete(RevocationEvent).where(RevocationEvent.expires_at <= now))
+            session.commit()
+
+
+class RedisTokenStore:
+    """
+    Redis key + EX(TTL), 만료 삭제는 Redis가 처리
+    폐기는 pub/sub(channel)으로도 전달, listener thread가 받은 key를 revoked_since()로 넘김 (process당 TokenRevocation 1개 기준)
+    """
+
+    prefix = "revoked:"
+    channel = "revoked-events"
+
+    def __init__(self, client: redis.Redis):
+        self.client = client
+        self._pending = list()
+        self._pending_lock = threading.Lock()
+        self._listener: Optional[threading.Thread] = None
+
+    @staticmethod
+    def _ttl(expires_at: float) -> int:
+        return max(1, math.ceil(expires_at - time.time()))
+
+    def add(self, key: str, expires_at: float):
+        pipe = self.client.pipeline()
+        pipe.set(self.prefix + key, 1, ex=self._ttl(expires_at))
+        pipe.publish(self.channel, key)
+        pipe.execute()
+
+    def add_if_absent(self, key: str, expires_at: float) -> bool:
+        return bool(self.client.set(self.prefix + key, 1, ex=self._ttl(expires_at), nx=True))
+
+    def contains(self, key: str) -> bool:
+        return self.client.exists(self.prefix + key) == 1
+
+    def keys(self, prefix: str = "") -> Iterable[str]:
+        return [
+            key.decode()[len(self.prefix):]
+            for key in self.client.scan_iter(match=self.prefix + prefix + "*", count=1000)
+        ]
+
+    def revoked_since(self, cursor: Optional[int]):
+        """listener가 받은 뒤 아직 전달하지 않은 key (cursor는 사용하지 않음)"""
+        if self._listener is None:
+            with self._pending_lock:
+                if self._listener is None:
+                    self._listener = threading.Thread(target=self._listen, name="token-revocation-listener", daemon=True)
+                    self._listener.start()
+        with self._pending_lock:
+            keys, self._pending = self._pending, list()
+        return keys, 0
+
+    def _listen(self):
+        while True:
+            try:
+                pubsub = self.client.pubsub()
+                pubsub.subscribe(self.channel)
+                for message in pubsub.listen():
+                    if message["type"] == "subscribe":
+                        # 구독 이전 / 연결이 끊긴 동안의 폐기는 현재 목록 전체로 보충
+                        keys = [key for prefix in REVOKED_PREFIXES for key in self.keys(prefix)]
+                    elif message["type"] == "message":
+                        keys = [message["data"].decode()]
+                    else:
+                        continue
+                    with self._pending_lock:
+                        self._pending.extend(keys)
+            except Exception as e:
+                logger.warning("Token revocation listener disconnected, resubscribing: %s", e)
+                time.sleep(1)
+
+    def purge_expired(self):
+        pass  # Redis TTL이 처리
+
+
+# 08_db_app/common/get_conn.get_redis_client와 같은 방식의 client 생성
+def get_redis_client(host="localhost", port=6379, db=0):
+    pool = redis.ConnectionPool(host=host, port=port, db=db)
+    return redis.StrictRedis(connection_pool=pool)
+
+
+def get_token_store(name: str = TOKEN_STORE):
+    if name == "memory":
+        return MemoryTokenStore()
+    if name == "sqlite":
+        return SQLiteTokenStore()
+    if name == "redis":
+        return RedisTokenStore(get_redis_client(
+            host=os.getenv("TOKEN_STORE_REDIS_HOST", "localhost"),
+            port=int(os.getenv("TOKEN_STORE_REDIS_PORT", 6379)),
+            db=int(os.getenv("TOKEN_STORE_REDIS_DB", 0)),
+        ))
+    raise ValueError(f"Unknown token store: {name} (expected memory, sqlite or redis)")
+
+
+class TokenRevocation:
+    def __init__(self, store, family_ttl: float, capacity: int = TOKEN_BLOOM_CAPACITY,
+                 error_rate: float = TOKEN_BLOOM_ERROR_RATE, refresh_interval: float = TOKEN_BLOOM_REFRESH):
+        self.store = store
+        # family는 그 family의 마지막 refresh token이 만료될 때까지 폐기 상태 유지
+        self.family_ttl = family_ttl
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.refresh_interval = refresh_interval
+        self._bloom: Optional[BloomFilter] = None
+        # 저장소 폐기 feed에서 마지막으로 반영한 위치
+        self._cursor: Optional[int] = None
+        self._next_refresh = 0.0
+        self._lock = threading.Lock()
+        # background 재구성 중 이 process에서 추가된 폐기 (새 filter로 교체할 때 반영)
+        self._refreshing = False
+        self._revoked_during_refresh = list()
+
+    def _build_bloom(self) -> BloomFilter:
+        """저장소의 폐기 목록으로 filter 구성 (만료 key 삭제 + 다른 process의 폐기 반영)"""
+        self.store.purge_expired()
+        bloom = BloomFilter(self.capacity, self.error_rate)
+        for prefix in REVOKED_PREFIXES:
+            for key in self.store.keys(prefix):
+                bloom.add(key)
+        return bloom
+
+    def _ensure_bloom(self):
+        if self._bloom is None:
+            # 첫 구성은 동기: 빈 filter로 시작하면 기존 폐기 token이 통과함
+            with self._lock:
+                if self._bloom is None:
+                    # feed 위치를 먼저 기록: 구성 도중 추가된 폐기는 다음 _sync()에서 반영
+                    _, self._cursor = self.store.revoked_since(None)
+                    self._bloom = self._build_bloom()
+                    self._next_refresh = time.monotonic() + self.refresh_interval
+            return
+        if self._refreshing or time.monotonic() < self._next_refresh:
+            return
+        with self._lock:
+            if self._refreshing or time.monotonic() < self._next_refresh:
+                return
+            self._refreshing = True
+        threading.Thread(target=self._refresh_bloom, name="token-bloom-refresh", daemon=True).start()
+
+    def _refresh_bloom(self):
+        """background thread: 새 filter를 만든 뒤 교체, 실패 시 기존 filter 유지"""
+        bloom = None
+        try:
+            bloom = self._build_bloom()
+        except Exception as e:
+            logger.warning("Token bloom filter refresh failed, keeping the current filter: %s", e)
+        with self._lock:
+            if bloom is not None:
+                for key in self._revoked_during_refresh:
+                    bloom.add(key)
+                self._bloom = bloom
+            self._revoked_during_refresh.clear()
+            self._refreshing = False
+            self._next_refresh = time.monotonic() + self.refresh_interval
+
+    def _add_to_bloom(self, keys: Iterable[str]):
+        with self._lock:
+            for key in keys:
+                self._bloom.add(key)
+                if self._refreshing:
+                    self._revoked_during_refresh.append(key)
+
+    def _sync(self):
+        """다른 process의 폐기를 filter에 반영 (저장소 feed에서 cursor 이후 key만 조회)"""
+        keys, cursor = self.store.revoked_since(self._cursor)
+        if keys:
+            self._add_to_bloom(keys)
+        with self._lock:
+            self._cursor = max(self._cursor, cursor)
+
+    def _revoke(self, key: str, expires_at: float):
+        self.store.add(key, expires_at)
+        self._ensure_bloom()
+        self._add_to_bloom([key])
+
+    def revoke_token(self, jti: str, expires_at: float):
+        self._revoke(f"jti:{jti}", expires_at)
+
+    def revoke_family(self, family_id: str):
+        self._revoke(f"fam:{family_id}", time.time() + self.family_ttl)
+
+    def is_revoked(self, claims: dict) -> bool:
+        self._ensure_bloom()
+        self._sync()
+        bloom = self._bloom
+        keys = [f"{prefix}:{claims[name]}" for prefix, name in (("jti", "jti"), ("fam", "fam")) if claims.get(name)]
+        # filter에 없으면 확실히 폐기되지 않음 -> 저장소 조회 생략
+        return any(self.store.contains(key) for key in keys if key in bloom)
+
+    def consume_refresh(self, jti: str, family_id: Optional[str], expires_at: float) -> bool:
+        """refresh token 1회 사용 처리, 폐기된 family이거나 재사용이면 False (재사용 시 family 폐기)"""
+        if family_id and self.store.contains(f"fam:{family_id}"):
+            return False
+        if self.store.add_if_absent(f"{USED_PREFIX}{jti}", expires_at):
+            return True
+        # 이미 사용된 refresh token의 재사용 -> 탈취 가능성, 해당 로그인의 모든 token 폐기
+        if family_id:
+            self.revoke_family(family_id)
+        return False
@@ -0,0 +1,118 @@
+"""
+app_elasticsearch 테스트용 가짜 Elasticsearch
+
+실제 AsyncElasticsearch client와 helper(async_streaming_bulk 등)는 그대로 사용하고 HTTP 요청만 가로챔
+- server.on(method, path, handler): path는 정규식, handler(request)는 body dict 또는 (status, body) 반환
+  (handler 대신 dict를 넘기면 고정 응답)
+- server.requests: 받은 요청 기록 (FakeRequest: method, path, params, body)
+- 등록되지 않은 요청은 400 -> BadRequestError
+
+usage
+    server = FakeElasticsearch()
+    server.on("POST", r"/products/_search", {"hits": {"total": {"value": 0}, "hits": []}})
+    client = server.client()
+"""
+import json
+import re
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, List, Union
+from urllib.parse import parse_qsl, unquote, urlsplit
+
+from elastic_transport import ApiResponseMeta, BaseAsyncNode, HttpHeaders
+from elastic_transport._node._base import NodeApiResponse
+from elasticsearch import AsyncElasticsearch
+
+
+@dataclass
+class FakeRequest:
+    method: str
+    path: str
+    params: dict
+    body: Any
+
+
+class FakeNode(BaseAsyncNode):
+    _CLIENT_META_HTTP_CLIENT = ("fake", "0")
+    server: "FakeElasticsearch" = None
+
+    async def perform_request(self, method, target, body=None, headers=None, request_timeout=None):
+        url = urlsplit(target)
+        request = FakeRequest(method, unquote(url.path), dict(parse_qsl(url.query)), self._decode(body, headers))
+        status, response = await self.server.handle(request)
+        meta = ApiResponseMeta(
+            status=status,
+            http_version="1.1",
+            headers=HttpHeaders({"content-type": "application/json", "x-elastic-product": "Elasticsearch"}),
+            duration=0.0,
+            node=self.config,
+        )
+        return NodeApiResponse(meta, json.dumps(response).encode())
+
+    @staticmethod
+    def _decode(body, headers):
+        if not body:
+            return None
+        text = body.decode() if isinstance(body, bytes) else body
+        if headers and "x-ndjson" in headers.get("content-type", ""):
+            return [json.loads(line) for line in text.splitlines() if line]
+        return json.loads(text)
+
+    async def close(self):
+        pass
+
+
+class FakeElasticsearch:
+    def __init__(self):
+        self.routes: List[tuple] = list()
+        self.requests: List[FakeRequest] = list()
+
+    def on(self, method: str, path: str, handler: Union[Callable, dict]):
+        self.routes.insert(0, (method, re.compile(path), handler))
+        return self
+
+    def calls(self, method: str, path: str) -> List[FakeRequest]:
+        pattern = re.compile(path)
+        return [request for request in self.requests if request.method == method and pattern.fullmatch(request.path)]
+
+    async def handle(self, request: FakeRequest):
+        self.requests.append(request)
+        for method, pattern, handler in self.routes:
+            if method == request.method and pattern.fullmatch(request.path):
+                response = handler(request) if callable(handler) else handler
+                if hasattr(response, "__await__"):
+                    response = await response
+                return response if isinstance(response, tuple) else (200, response)
+        return 400, error_body("fake_route_exception", f"no fake route for {request.method} {request.path}")
+
+    def client(self, **kwargs) -> AsyncElasticsearch:
+        node_class = type("BoundFakeNode", (FakeNode,), {"server": self})
+        return AsyncElasticsearch("http://fake-es:9200", node_class=node_class, max_retries=0, **kwargs)
+
+
+def error_body(error_type: str, reason: str, status: int = 400) -> dict:
+    return {"error": {"type": error_type, "reason": reason, "root_cause": [{"type": error_type, "reason": reason}]}, "status": status}
+
+
+def bulk_handler(status_for: Callable[[dict, dict], int] = None, result_for: Callable[[dict, dict], str] = None):
+    """
+    _bulk 응답 생성: (action metadata, source) 쌍마다 status_for로 상태 결정 (기본 201/200)
+    429 등 실패 status는 error를 포함한 item으로 응답, 성공 item의 result는 result_for로 지정 가능 (e.g. "noop")
+    """
+    def handle(request: FakeRequest):
+        items, lines = list(), request.body
+        i = 0
+        while i < len(lines):
+            op, meta = next(iter(lines[i].items()))
+            source = lines[i + 1] if op != "delete" else None
+            i += 1 if op == "delete" else 2
+            status = status_for(meta, source) if status_for else (200 if op == "update" else 201)
+            item = {"_index": meta.get("_index"), "_id": meta.get("_id") or f"auto-{time.monotonic_ns()}", "status": status}
+            if status >= 300:
+                item["error"] = {"type": "es_rejected_execution_exception" if status == 429 else "error", "reason": "rejected"}
+            else:
+                item["result"] = result_for(meta, source) if result_for else ("updated" if op == "update" else "created")
+            items.append({op: item})
+        return {"took": 1, "errors": any("error" in next(iter(item.values())) for item in items), "items": items}
+
+    return handle
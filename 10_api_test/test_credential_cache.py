@@ -0,0 +1,63 @@
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent / "09_auth"))
+from sqlite_user.credential_cache import CredentialCache  # noqa: E402
+
+
+def test_cache_hits_only_for_the_verified_password_and_stores_no_plaintext():
+    cache = CredentialCache(ttl=60, max_size=2)
+    cache.add("alice", "s3cret")
+
+    assert cache.verify("alice", "s3cret")
+    assert not cache.verify("alice", "wrong")
+    assert not cache.verify("bob", "s3cret")
+    assert all(b"s3cret" not in digest for _, digest in cache._data.values())
+
+
+def test_invalidate_and_stale_generation_are_not_cached():
+    cache = CredentialCache(ttl=60)
+    generation = cache.generation
+    cache.add("alice", "old")
+    cache.invalidate("alice")
+
+    # 무효화 이전에 시작된 검증 결과는 다시 캐시하지 않음
+    cache.add("alice", "old", generation)
+    assert not cache.verify("alice", "old")
+
+
+def test_expired_and_evicted_entries_miss():
+    cache = CredentialCache(ttl=0, max_size=1)
+    cache.add("alice", "pw")
+    assert not cache.verify("alice", "pw")
+
+    cache = CredentialCache(ttl=60, max_size=1)
+    cache.add("alice", "pw")
+    cache.add("bob", "pw")
+    assert len(cache) == 1 and not cache.verify("alice", "pw")
+
+
+def test_concurrent_verify_and_invalidate_do_not_raise():
+    cache = CredentialCache(ttl=60, max_size=2)
+    start = threading.Barrier(8)
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+
+    def hammer(worker):
+        start.wait()
+        for i in range(2000):
+            username = f"user{i % 4}"
+            if worker % 2:
+                cache.add(username, "secret")
+                cache.verify(username, "secret")
+            else:
+                cache.invalidate(username)  # delete_user가 verify 도중 entry 제거
+
+    try:
+        with ThreadPoolExecutor(8) as pool:
+            list(pool.map(hammer, range(8)))
+    finally:
+        sys.setswitchinterval(interval)
+    assert len(cache) <= 2
@@ -0,0 +1,410 @@
+import asyncio
+import sys
+from pathlib import Path
+
+import orjson
+import pytest
+import pytest_asyncio
+from elasticsearch import ApiError
+from fastapi import HTTPException
+
+sys.path.append(str(Path(__file__).resolve().parent))
+sys.path.append(str(Path(__file__).resolve().parent.parent / "08_db_app"))
+from es_fake import FakeElasticsearch, bulk_handler, error_body  # noqa: E402
+from app_elasticsearch.models import ProductIncrement, ProductSearchQuery, ProductUpdate  # noqa: E402
+from app_elasticsearch.query_builder import QueryBuilder  # noqa: E402
+from app_elasticsearch.repository import ElasticsearchRepository  # noqa: E402
+from app_elasticsearch.service import ElasticsearchService  # noqa: E402
+
+
+@pytest_asyncio.fixture
+async def es():
+    server = FakeElasticsearch()
+    client = server.client()
+    server.service = ElasticsearchService(ElasticsearchRepository(client, "products"))
+    yield server
+    await client.close()
+
+
+async def rows(items):
+    for item in items:
+        yield item
+
+
+def body(response) -> dict:
+    return orjson.loads(response.body)
+
+
+def product(i: int, **fields) -> dict:
+    return {"id": f"p{i}", "name": f"product {i}", "category": "tools", "price": 10.0 + i, "description": None, **fields}
+
+
+# _bulk indexing
+@pytest.mark.asyncio
+async def test_bulk_index_chunks_and_reports_invalid_rows(es):
+    es.on("PUT", "/_bulk", bulk_handler())
+    items = [product(i) for i in range(5)] + [{"id": "bad", "name": "no price"}]
+
+    summary = body(await es.service.bulk_index_products(rows(items), chunk_size=2, concurrency=2, max_retries=0))["data"]
+
+    assert summary["total"] == 6 and summary["indexed"] == 5 and summary["failed"] == 1
+    assert summary["errors"][0]["index"] == 5 and summary["errors"][0]["status"] == 400
+    requests = es.calls("PUT", "/_bulk")
+    assert sorted(len(request.body) // 2 for request in requests) == [1, 2, 2]
+    actions = [line["index"] for request in requests for line in request.body[::2]]
+    assert {action["_id"] for action in actions} == {f"p{i}" for i in range(5)}
+    assert all(action["_index"] == "products" for action in actions)
+
+
+@pytest.mark.asyncio
+async def test_bulk_index_retries_rejected_documents(es):
+    attempts = dict()
+
+    def status_for(meta, source):
+        attempts[meta["_id"]] = attempts.get(meta["_id"], 0) + 1
+        if meta["_id"] == "p1" and attempts["p1"] == 1:
+            return 429  # 첫 시도만 거부 -> helper가 backoff 후 재전송
+        return 400 if meta["_id"] == "p2" else 201
+
+    es.on("PUT", "/_bulk", bulk_handler(status_for))
+    summary = await es.service.repo.bulk_index(
+        rows([{"_id": f"p{i}", "_source": product(i)} for i in range(3)]), concurrency=1, max_retries=2, initial_backoff=0
+    )
+
+    assert attempts == {"p0": 1, "p1": 2, "p2": 1}
+    assert summary["indexed"] == 2 and summary["failed"] == 1
+    assert summary["errors"] == [{"id": "p2", "status": 400, "error": {"type": "error", "reason": "rejected"}}]
+
+
+def hits(*ids, total: int = None, with_sort: bool = True) -> dict:
+    hit_list = [
+        {"_id": doc_id, "_source": {k: v for k, v in product(i).items() if k != "id"}, **({"sort": [i]} if with_sort else {})}
+        for i, doc_id in ids
+    ]
+    return {"hits": {"total": {"value": total if total is not None else len(hit_list)}, "hits": hit_list}}
+
+
+# point-in-time + search_after paging
+@pytest.mark.asyncio
+async def test_pit_cursor_pages_and_closes_on_last_page(es):
+    es.on("POST", "/products/_pit", {"id": "pit-1"})
+    es.on("DELETE", "/_pit", {"succeeded": True, "num_freed": 1})
+    es.on("POST", "/_search", lambda request: (
+        {**hits((2, "p2"), total=3), "pit_id": "pit-2"} if request.body.get("search_after")
+        else {**hits((0, "p0"), (1, "p1"), total=3), "pit_id": "pit-1"}
+    ))
+
+    # data는 기존과 같은 상품 list, 전체 건수와 cursor는 header
+    first = await es.service.get_all_products(size=2, use_pit=True)
+    assert [item["id"] for item in body(first)["data"]] == ["p0", "p1"]
+    assert first.headers["X-Total-Count"] == "3"
+    next_cursor = first.headers["X-Next-Cursor"]
+    assert QueryBuilder.decode_cursor(next_cursor) == ("pit-1", [1])
+    request = es.calls("POST", "/_search")[0].body
+    assert request["pit"]["id"] == "pit-1" and request["sort"] == [{"_shard_doc": "asc"}]
+
+    second = await es.service.get_all_products(size=2, cursor=next_cursor)
+    assert [item["id"] for item in body(second)["data"]] == ["p2"] and "X-Next-Cursor" not in second.headers
+    assert es.calls("POST", "/_search")[1].body["search_after"] == [1]
+    # 마지막 페이지: 응답의 최신 pit_id로 닫음
+    assert [request.body for request in es.calls("DELETE", "/_pit")] == [{"id": "pit-2"}]
+
+
+@pytest.mark.asyncio
+async def test_pit_cursor_errors(es):
+    es.on("DELETE", "/_pit", {"succeeded": True, "num_freed": 1})
+    es.on("POST", "/_search", (404, error_body("search_context_missing_exception", "No search context found", 404)))
+
+    with pytest.raises(HTTPException) as expired:
+        await es.service.get_all_products(size=2, cursor=QueryBuilder.encode_cursor("old-pit", [1]))
+    assert expired.value.status_code == 410
+    with pytest.raises(HTTPException) as malformed:
+        await es.service.get_all_products(size=2, cursor="not-a-cursor")
+    assert malformed.value.status_code == 400
+
+    # 404 이외의 실패: 새로 연 PIT를 닫고 원래 오류 전달
+    es.on("POST", "/products/_pit", {"id": "pit-1"})
+    es.on("POST", "/_search", (500, error_body("search_phase_execution_exception", "all shards failed", 500)))
+    with pytest.raises(ApiError):
+        await es.service.get_all_products(size=2, use_pit=True)
+    assert es.calls("DELETE", "/_pit")[-1].body == {"id": "pit-1"}
+
+
+@pytest.mark.asyncio
+async def test_export_iterates_pit_batches(es):
+    es.on("POST", "/products/_pit", {"id": "pit-1"})
+    es.on("DELETE", "/_pit", {"succeeded": True, "num_freed": 1})
+    es.on("POST", "/_search", lambda request: (
+        hits((2, "p2")) if request.body.get("search_after") else hits((0, "p0"), (1, "p1"))
+    ))
+
+    batches = [batch async for batch in es.service.repo.iter_all(batch_size=2)]
+
+    assert [[hit["_id"] for hit in batch] for batch in batches] == [["p0", "p1"], ["p2"]]
+    assert all(request.body["track_total_hits"] is False for request in es.calls("POST", "/_search"))
+    assert len(es.calls("DELETE", "/_pit")) == 1
+
+
+# compiled search template cache
+def test_search_template_matches_dsl_and_is_reused():
+    options = dict(query="keyboard", filters={"category": "tools"}, sort_by="price", order="asc", size=5)
+    before = QueryBuilder.cache_stats()
+
+    first = QueryBuilder.build_search_body(**options)
+    first["query"]["bool"]["filter"][0]["term"]["category"] = "changed"  # 반환값 수정이 템플릿에 남지 않아야 함
+    second = QueryBuilder.build_search_body(**{**options, "query": "mouse", "search_after": None})
+
+    assert second == QueryBuilder.build_search_query(**{**options, "query": "mouse"}).to_dict()
+    paged = dict(options, search_after=[10.0, 3], pit_id="pit-1")
+    assert QueryBuilder.build_search_body(**paged) == QueryBuilder.build_search_query(**paged).to_dict()
+    stats = QueryBuilder.cache_stats()
+    assert stats["hits"] - before["hits"] >= 1 and stats["misses"] - before["misses"] <= 2
+
+
+@pytest.mark.asyncio
+async def test_search_cache_stats_uses_response_envelope(es):
+    response = body(es.service.search_cache_stats())
+    assert response["result_code"] == 200 and set(response["data"]) == {"hits", "misses", "size", "max_size"}
+
+
+# _source filtering / filter_path projection
+@pytest.mark.asyncio
+async def test_search_projects_source_and_response(es):
+    def search(request):
+        # _source_includes 적용 (Elasticsearch와 같이 요청한 필드만 반환)
+        response = hits((0, "p0"), with_sort=False)
+        includes = request.params["_source_includes"].split(",")
+        for hit in response["hits"]["hits"]:
+            hit["_source"] = {key: value for key, value in hit["_source"].items() if key in includes}
+        return response
+
+    es.on("POST", "/products/_search", search)
+
+    default = body(await es.service.search(ProductSearchQuery(query="product")))["data"]
+    assert default["list"][0] == {"id": "p0", "name": "product 0", "category": "tools", "description": None,
+                                  "price": 10.0, "tags": [], "stock": None}
+    projected = body(await es.service.search(ProductSearchQuery(query="product", fields=["name"])))["data"]
+    assert projected["list"] == [{"id": "p0", "name": "product 0"}]
+
+    default_request, projected_request = es.calls("POST", "/products/_search")
+    assert default_request.params["_source_includes"] == "name,category,price,description"
+    assert projected_request.params["_source_includes"] == "name"
+    assert "hits.hits._source" in default_request.params["filter_path"]
+
+
+@pytest.mark.asyncio
+async def test_search_documents_passes_projection_options(es):
+    es.on("POST", "/products/_search", hits())
+
+    await es.service.repo.search_documents(
+        {"match_all": {}}, source_excludes=["description"], docvalue_fields=["price"], filter_path="hits.hits._id"
+    )
+
+    request = es.calls("POST", "/products/_search")[0]
+    assert request.params["_source_excludes"] == "description" and request.params["filter_path"] == "hits.hits._id"
+    assert request.body == {"query": {"match_all": {}}, "docvalue_fields": ["price"]}
+
+
+def mget_handler(request):
+    docs = list()
+    for doc_id in request.body["ids"]:
+        if doc_id.startswith("missing"):
+            docs.append({"_index": "products", "_id": doc_id, "found": False})
+        else:
+            i = int(doc_id[1:])
+            source = {k: v for k, v in product(i).items() if k != "id"}
+            docs.append({"_index": "products", "_id": doc_id, "found": True, "_seq_no": i, "_primary_term": 1, "_source": source})
+    return {"docs": docs}
+
+
+# _mget batch lookup + single-get coalescing
+@pytest.mark.asyncio
+async def test_concurrent_single_gets_share_one_mget(es):
+    es.on("POST", "/products/_mget", mget_handler)
+
+    responses = await asyncio.gather(*(es.service.get_product_by_id(doc_id) for doc_id in ("p1", "p2", "p1", "missing-1")))
+
+    assert len(es.calls("POST", "/products/_mget")) == 1
+    assert sorted(es.calls("POST", "/products/_mget")[0].body["ids"]) == ["missing-1", "p1", "p2"]
+    first, second, third, missing = (body(response) for response in responses)
+    assert first["data"]["name"] == "product 1" and first["data"]["seq_no"] == 1 and first == third
+    assert second["data"]["primary_term"] == 1
+    assert missing["result_code"] == 404
+
+
+@pytest.mark.asyncio
+async def test_batch_get_deduplicates_and_reports_missing(es):
+    es.on("POST", "/products/_mget", mget_handler)
+
+    data = body(await es.service.get_products_by_ids(["p2", "missing-1", "p2", "p1"]))["data"]
+
+    assert es.calls("POST", "/products/_mget")[0].body == {"ids": ["p2", "missing-1", "p1"]}
+    assert [item["id"] for item in data["list"]] == ["p2", "p1"]
+    assert data["missing"] == ["missing-1"]
+
+
+# facets
+@pytest.mark.asyncio
+async def test_facets_are_built_and_flattened(es):
+    es.on("POST", "/products/_search", {
+        "hits": {"total": {"value": 7}},
+        "aggregations": {
+            "categories": {"buckets": [{"key": "tools", "doc_count": 5}, {"key": "toys", "doc_count": 2}]},
+            "prices": {"buckets": [{"key": "cheap", "to": 50.0, "doc_count": 6}, {"key": "50.0-*", "from": 50.0, "doc_count": 1}]},
+        },
+    })
+    query = ProductSearchQuery.model_validate({
+        "size": 0,
+        "use_pit": True,
+        "aggs": {
+            "categories": {"type": "terms", "field": "category", "size": 5},
+            "prices": {"type": "range", "field": "price", "ranges": [{"key": "cheap", "to": 50}, {"from": 50}]},
+            "histogram": {"type": "histogram", "field": "price", "interval": 10},
+        },
+    })
+
+    data = body(await es.service.search(query))["data"]
+
+    assert data["total"] == 7 and data["list"] == [] and data["next_cursor"] is None
+    assert data["aggregations"]["categories"] == [{"key": "tools", "count": 5}, {"key": "toys", "count": 2}]
+    assert data["aggregations"]["prices"][1] == {"key": "50.0-*", "count": 1, "from": 50.0}
+    request = es.calls("POST", "/products/_search")[0].body
+    assert request["size"] == 0 and "pit" not in request  # size=0: point-in-time 없이 count/facet만
+    assert request["aggs"] == {
+        "categories": {"terms": {"field": "category", "size": 5}},
+        "prices": {"range": {"field": "price", "ranges": [{"key": "cheap", "to": 50.0}, {"from": 50.0}]}},
+        "histogram": {"histogram": {"field": "price", "interval": 10.0, "min_doc_count": 0}},
+    }
+
+
+@pytest.mark.asyncio
+async def test_facets_are_skipped_on_cursor_pages(es):
+    es.on("POST", "/_search", hits((2, "p2")))
+    es.on("DELETE", "/_pit", {"succeeded": True, "num_freed": 1})
+    query = ProductSearchQuery.model_validate({
+        "size": 2, "cursor": QueryBuilder.encode_cursor("pit-1", [1]),
+        "aggs": {"categories": {"type": "terms", "field": "category"}},
+    })
+
+    data = body(await es.service.search(query))["data"]
+
+    assert "aggs" not in es.calls("POST", "/_search")[0].body and "aggregations" not in data
+
+
+def reindex_routes(es, task: dict):
+    es.on("PUT", r"/_index_template/products-template", {"acknowledged": True})
+    es.on("GET", "/_alias/products", {"products-old": {"aliases": {"products": {}}}})
+    es.on("PUT", r"/products-\d+", {"acknowledged": True, "index": "products-new"})
+    es.on("GET", r"/products-\d+/_settings/.*", lambda request: {
+        request.path.split("/")[1]: {"settings": {"index.refresh_interval": "1s", "index.number_of_replicas": "1"}}
+    })
+    es.on("PUT", r"/[^/]+/_settings", {"acknowledged": True})
+    es.on("POST", r"/products-\d+/_refresh", {"_shards": {"failed": 0}})
+    es.on("POST", "/_reindex", {"task": "node:1"})
+    es.on("GET", "/_tasks/node:1", task)
+    es.on("POST", "/_aliases", {"acknowledged": True})
+
+
+# alias reindex
+@pytest.mark.asyncio
+async def test_reindex_blocks_source_writes_until_swap(es):
+    reindex_routes(es, {"completed": True, "response": {"total": 3, "created": 3, "failures": []}})
+
+    summary = await es.service.reindex(poll_interval=0)
+
+    assert summary["swapped"] and summary["source"] == ["products-old"] and summary["created"] == 3
+    order = [(request.method, request.path, request.body) for request in es.requests]
+    block = order.index(("PUT", "/products-old/_settings", {"index.blocks.write": True}))
+    unblock = order.index(("PUT", "/products-old/_settings", {"index.blocks.write": None}))
+    reindex = next(i for i, (method, path, _) in enumerate(order) if path == "/_reindex")
+    swap = next(i for i, (method, path, _) in enumerate(order) if path == "/_aliases")
+    assert block < reindex < swap < unblock
+    assert order[swap][2]["actions"] == [
+        {"add": {"index": summary["dest"], "alias": "products"}}, {"remove": {"index": "products-old", "alias": "products"}}
+    ]
+    # bulk load mode 종료 후 원래 설정 복원
+    restored = [request.body for request in es.calls("PUT", f"/{summary['dest']}/_settings")]
+    assert restored[-1] == {"index.refresh_interval": "1s", "index.number_of_replicas": "1"}
+
+
+@pytest.mark.asyncio
+async def test_reindex_failure_keeps_alias_and_unblocks_writes(es):
+    reindex_routes(es, {"completed": True, "response": {"total": 3, "created": 2, "failures": [{"id": "p1"}]}})
+
+    summary = await es.service.reindex(poll_interval=0)
+
+    assert not summary["swapped"] and summary["failures"] == [{"id": "p1"}]
+    assert es.calls("POST", "/_aliases") == []
+    assert es.calls("PUT", "/products-old/_settings")[-1].body == {"index.blocks.write": None}
+
+
+# batched partial updates
+@pytest.mark.asyncio
+async def test_bulk_update_reports_rejected_decrements_per_id(es):
+    def result_for(meta, source):
+        if "script" in source:
+            # 재고 부족 -> script가 ctx.op = 'noop'
+            return "noop" if source["script"]["params"]["increments"]["stock"] < -5 else "updated"
+        return "noop" if source["doc"] == {"name": "same"} else "updated"
+
+    es.on("PUT", "/_bulk", bulk_handler(result_for=result_for))
+    updates = [
+        {"id": "p1", "name": "renamed"},
+        {"id": "p2", "name": "same"},
+        {"id": "p3", "increment": {"stock": -1}},
+        {"id": "p4", "increment": {"stock": -10}},
+        {"id": "p5", "increment": {"stock": -1}, "if_seq_no": 3, "if_primary_term": 1},
+    ]
+
+    summary = body(await es.service.bulk_update_products(rows(updates), max_retries=0))["data"]
+
+    assert summary["updated"] == 3 and summary["noop"] == 1 and summary["failed"] == 1
+    assert summary["errors"] == [{"id": "p4", "status": 409, "error": "update rejected by script"}]
+    actions = {line["update"]["_id"]: line["update"] for line in es.calls("PUT", "/_bulk")[0].body[::2]}
+    assert actions["p3"]["retry_on_conflict"] == 3 and "retry_on_conflict" not in actions["p5"]
+    assert actions["p5"]["if_seq_no"] == 3 and actions["p5"]["if_primary_term"] == 1
+
+
+@pytest.mark.asyncio
+async def test_update_with_stale_version_conflicts(es):
+    es.on("POST", "/products/_update/p1", lambda request: (
+        (409, error_body("version_conflict_engine_exception", "version conflict", 409)) if request.params.get("if_seq_no") == "3"
+        else {"_id": "p1", "result": "noop" if "script" in request.body else "updated", "_seq_no": 4, "_primary_term": 1}
+    ))
+
+    with pytest.raises(HTTPException) as conflict:
+        await es.service.update_product("p1", ProductUpdate(price=9.5), if_seq_no=3, if_primary_term=1)
+    assert conflict.value.status_code == 409
+    assert es.calls("POST", "/products/_update/p1")[0].params == {"if_seq_no": "3", "if_primary_term": "1"}
+
+    updated = body(await es.service.update_product("p1", ProductUpdate(price=9.5), if_seq_no=4, if_primary_term=1))
+    assert updated["data"] == {"result": "updated", "seq_no": 4, "primary_term": 1}
+    with pytest.raises(HTTPException) as insufficient:
+        await es.service.increment_product("p1", ProductIncrement(stock=-100))
+    assert insufficient.value.status_code == 409
+    assert es.calls("POST", "/products/_update/p1")[-1].params == {"retry_on_conflict": "3"}
+
+
+# autocomplete
+@pytest.mark.asyncio
+async def test_suggest_caches_normalized_prefix(es):
+    es.on("POST", "/products/_search", {"suggest": {"product-suggest": [{"options": [{"_id": "p1", "text": "Wireless Keyboard"}]}]}})
+
+    first = body(await es.service.suggest("  Wire ", size=3))["data"]
+    second = body(await es.service.suggest("wire", size=3))["data"]
+
+    assert first == second == {"list": [{"id": "p1", "name": "Wireless Keyboard"}]}
+    request = es.calls("POST", "/products/_search")
+    assert len(request) == 1 and request[0].body["suggest"]["product-suggest"]["prefix"] == "wire"
+    assert request[0].params["filter_path"].startswith("suggest.product-suggest.options")
+
+
+@pytest.mark.asyncio
+async def test_suggest_on_unmigrated_index_points_to_reindex(es):
+    es.on("POST", "/products/_search", (400, error_body(
+        "search_phase_execution_exception", "Field [name.suggest] is not a completion suggest field"
+    )))
+
+    with pytest.raises(HTTPException) as error:
+        await es.service.suggest("wire")
+    assert error.value.status_code == 409 and "index_cli reindex" in error.value.detail
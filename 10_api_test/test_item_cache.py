@@ -0,0 +1,111 @@
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parent.parent / "08_db_app"))
+from common.cache import LRUCache, InMemoryCacheBackend, TieredCache  # noqa: E402
+
+
+def make_loader(value, delay: float = 0):
+    calls = {"count": 0}
+
+    async def loader():
+        calls["count"] += 1
+        await asyncio.sleep(delay)
+        return value
+
+    return loader, calls
+
+
+@pytest.mark.asyncio
+async def test_read_through_loads_once():
+    cache = TieredCache(InMemoryCacheBackend())
+    loader, calls = make_loader({"id": 1, "name": "item"})
+
+    assert await cache.get_or_load("item:1", loader) == {"id": 1, "name": "item"}
+    assert await cache.get_or_load("item:1", loader) == {"id": 1, "name": "item"}
+    assert calls["count"] == 1
+    assert cache.stats["local_hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_single_flight_coalesces_concurrent_misses():
+    cache = TieredCache(InMemoryCacheBackend())
+    loader, calls = make_loader({"id": 1}, delay=0.01)
+
+    results = await asyncio.gather(*(cache.get_or_load("item:1", loader) for _ in range(10)))
+    assert all(result == {"id": 1} for result in results)
+    assert calls["count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_invalidate_reloads_from_loader():
+    backend = InMemoryCacheBackend()
+    cache = TieredCache(backend)
+    loader, calls = make_loader({"id": 1})
+
+    await cache.get_or_load("item:1", loader)
+    await cache.invalidate("item:1")
+    assert await backend.get("item:1") is None
+
+    await cache.get_or_load("item:1", loader)
+    assert calls["count"] == 2
+
+
+@pytest.mark.asyncio
+async def test_waiters_retry_when_leader_is_cancelled():
+    cache = TieredCache(InMemoryCacheBackend())
+    loader, calls = make_loader({"id": 1}, delay=0.05)
+
+    leader = asyncio.create_task(cache.get_or_load("item:1", loader))
+    await asyncio.sleep(0)
+    waiters = [asyncio.create_task(cache.get_or_load("item:1", loader)) for _ in range(3)]
+    await asyncio.sleep(0.01)
+    leader.cancel()
+
+    assert await asyncio.gather(*waiters) == [{"id": 1}] * 3
+    assert leader.cancelled()
+    assert calls["count"] == 2  # 취소된 leader 1회 + 대기자 중 하나가 다시 로드
+
+
+@pytest.mark.asyncio
+async def test_invalidate_during_load_discards_the_stale_value():
+    backend = InMemoryCacheBackend()
+    cache = TieredCache(backend)
+    row = {"name": "old"}
+    loaded = asyncio.Event()
+    release = asyncio.Event()
+
+    async def loader():
+        value = dict(row)  # update commit 이전의 row를 읽음
+        loaded.set()
+        await release.wait()
+        return value
+
+    stale = asyncio.create_task(cache.get_or_load("item:1", loader))
+    await loaded.wait()
+    # update commit -> invalidate, 이후 요청은 진행 중인 stale load에 합류하지 않음
+    row["name"] = "new"
+    await cache.invalidate("item:1")
+    loaded.clear()
+    fresh = asyncio.create_task(cache.get_or_load("item:1", loader))
+    await asyncio.wait_for(loaded.wait(), 1)
+    release.set()
+
+    assert await stale == {"name": "old"}
+    assert await fresh == {"name": "new"}
+    assert await backend.get("item:1") == {"name": "new"}
+    assert await cache.get_or_load("item:1", loader) == {"name": "new"}
+
+
+def test_lru_evicts_least_recently_used():
+    lru = LRUCache(max_size=2)
+    lru.set("a", 1, ttl=60)
+    lru.set("b", 2, ttl=60)
+    lru.get("a")
+    lru.set("c", 3, ttl=60)
+
+    assert lru.get("b") is None
+    assert lru.get("a") == 1 and lru.get("c") == 3
@@ -0,0 +1,160 @@
+import json
+import logging
+import os
+import sys
+from pathlib import Path
+
+import pytest
+import pytest_asyncio
+from pydantic import ValidationError
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import create_async_engine
+
+# repository 모듈은 import 시 MariaDB engine을 만들기만 함 (연결 없음), 테스트는 SQLite로 교체
+for name, value in (("MARIADB_USER", "test"), ("MARIADB_PASSWORD", "test"), ("MARIADB_DATABASE", "test")):
+    os.environ.setdefault(name, value)
+sys.path.append(str(Path(__file__).resolve().parent.parent / "08_db_app"))
+from app_mariadb.cached_repository import CachedMariaDBRepository, item_cache_key  # noqa: E402
+from app_mariadb.models import Base, Item  # noqa: E402
+from app_mariadb.repository import MariaDBRepository  # noqa: E402
+from app_mariadb.schemas import ItemBulkUpdate  # noqa: E402
+from app_mariadb.service import BULK_CHUNK_ERROR, MariaDBService  # noqa: E402
+from common.cache import InMemoryCacheBackend, TieredCache  # noqa: E402
+from common.db_routing import async_routing_sessionmaker  # noqa: E402
+from common.unit_of_work import UnitOfWork  # noqa: E402
+
+
+@pytest_asyncio.fixture
+async def repo(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'items.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    repository = MariaDBRepository()
+    repository.engine = engine
+    repository.SessionLocal = async_routing_sessionmaker(engine, expire_on_commit=False)
+    yield repository
+    await engine.dispose()
+
+
+def test_bulk_update_row_needs_a_field_besides_id():
+    with pytest.raises(ValidationError):
+        ItemBulkUpdate.model_validate({"id": 1})
+    assert ItemBulkUpdate.model_validate({"id": 1, "name": "x"}).model_dump(exclude_unset=True) == {"id": 1, "name": "x"}
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_skips_rows_without_columns(repo):
+    ids = await repo.bulk_create([{"name": "a"}, {"name": "b"}])
+
+    updated = await repo.bulk_update([{"id": ids[0], "name": "renamed"}, {"id": ids[1]}, {"id": 999, "name": "x"}])
+
+    assert updated == set(ids)
+    assert (await repo.get_by_id(ids[0])).name == "renamed"
+    assert (await repo.get_by_id(ids[1])).name == "b"
+
+
+@pytest.mark.asyncio
+async def test_cached_update_invalidates_only_after_commit(repo):
+    cache = TieredCache(InMemoryCacheBackend())
+    cached = CachedMariaDBRepository(repo, cache)
+    item_id = (await repo.bulk_create([{"name": "a"}]))[0]
+    assert (await cached.get_by_id(item_id))["name"] == "a"
+
+    # rollback: after_commit 콜백은 실행되지 않고 기존 cache 유지
+    with pytest.raises(RuntimeError):
+        async with UnitOfWork(repo.SessionLocal):
+            await cached.update(item_id, {"name": "rolled back"})
+            raise RuntimeError()
+    assert cache.local.get(item_cache_key(item_id))["name"] == "a"
+    assert (await repo.get_by_id(item_id)).name == "a"
+
+    async with UnitOfWork(repo.SessionLocal):
+        await cached.update(item_id, {"name": "b"})
+        assert cache.local.get(item_cache_key(item_id)) is not None  # commit 전에는 무효화하지 않음
+    assert cache.local.get(item_cache_key(item_id)) is None
+    assert (await cached.get_by_id(item_id))["name"] == "b"
+
+
+@pytest.mark.asyncio
+async def test_cached_bulk_update_follows_unit_of_work(repo):
+    cache = TieredCache(InMemoryCacheBackend())
+    cached = CachedMariaDBRepository(repo, cache)
+    ids = await repo.bulk_create([{"name": "a"}, {"name": "b"}])
+    for item_id in ids:
+        await cached.get_by_id(item_id)
+
+    with pytest.raises(RuntimeError):
+        async with UnitOfWork(repo.SessionLocal):
+            await cached.bulk_update([{"id": item_id, "name": "x"} for item_id in ids])
+            raise RuntimeError()
+    assert [(await repo.get_by_id(item_id)).name for item_id in ids] == ["a", "b"]
+    assert all(cache.local.get(item_cache_key(item_id)) for item_id in ids)
+
+    # unit of work 없이 호출하면 bulk 트랜잭션 commit 직후 무효화
+    assert await cached.bulk_update([{"id": ids[0], "name": "x"}]) == {ids[0]}
+    assert cache.local.get(item_cache_key(ids[0])) is None
+    assert (await cached.get_by_id(ids[0]))["name"] == "x"
+
+
+@pytest.mark.asyncio
+async def test_cache_miss_loads_from_primary_not_lagging_replica(repo, tmp_path):
+    # replica: 복제가 지연되어 이전 값을 가진 별도 SQLite 파일
+    replica = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'replica.db'}")
+    async with replica.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    item_id = (await repo.bulk_create([{"name": "fresh"}]))[0]
+    async with replica.begin() as conn:
+        await conn.execute(Item.__table__.insert(), {"id": item_id, "name": "stale"})
+    repo.SessionLocal = async_routing_sessionmaker(repo.engine, [replica], expire_on_commit=False)
+    cache = TieredCache(InMemoryCacheBackend())
+
+    assert (await repo.get_by_id(item_id)).name == "stale"  # 일반 읽기는 replica
+    assert (await CachedMariaDBRepository(repo, cache).get_by_id(item_id))["name"] == "fresh"
+    await replica.dispose()
+
+
+async def rows_of(*rows):
+    for row in rows:
+        yield row
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_ids_without_executemany_returning(repo, monkeypatch):
+    # MariaDB 10.5+: INSERT ... RETURNING은 되지만 executemany RETURNING은 불가
+    monkeypatch.setattr(repo.engine.dialect, "insert_executemany_returning", False)
+    await repo.bulk_create([{"name": "existing"}])
+
+    ids = await repo.bulk_create([{"name": f"item-{i}", "description": None} for i in range(5)])
+
+    assert [(await repo.get_by_id(item_id)).name for item_id in ids] == [f"item-{i}" for i in range(5)]
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_reports_counts_only_without_returning(repo, monkeypatch):
+    monkeypatch.setattr(repo.engine.dialect, "insert_executemany_returning", False)
+    monkeypatch.setattr(repo.engine.dialect, "insert_returning", False)
+    service = MariaDBService(repo=repo)
+
+    response = await service.bulk_create_items(rows_of({"name": "a"}, {"name": "b"}, {"bad": 1}), chunk_size=10)
+
+    data = json.loads(response.body)["data"]
+    assert (data["total"], data["succeeded"], data["failed"]) == (3, 2, 1)
+    assert [(r["index"], r["status"]) for r in data["results"]] == [(2, "error")]
+
+
+@pytest.mark.asyncio
+async def test_bulk_chunk_failure_hides_the_database_error(repo, monkeypatch, caplog):
+    async def failing_bulk_create(items):
+        raise OperationalError("INSERT INTO items ...", {}, Exception("secret schema detail"))
+
+    monkeypatch.setattr(repo, "bulk_create", failing_bulk_create)
+    service = MariaDBService(repo=repo)
+
+    with caplog.at_level(logging.ERROR, logger="app_mariadb.service"):
+        response = await service.bulk_create_items(rows_of({"name": "a"}, {"name": "b"}), chunk_size=10)
+
+    data = json.loads(response.body)["data"]
+    assert data["failed"] == 2
+    assert {r["error"] for r in data["results"]} == {BULK_CHUNK_ERROR}
+    assert "secret schema detail" not in response.body.decode()
+    assert "secret schema detail" in caplog.text
@@ -0,0 +1,67 @@
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from pathlib import Path
+
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parent.parent / "09_auth"))
+from sqlite_user import jwt_security  # noqa: E402
+from sqlite_user.jwt_backends import InvalidTokenError, get_jwt_backend  # noqa: E402
+
+
+def test_decode_token_caches_until_exp(monkeypatch):
+    jwt_security.token_cache.clear()
+    token = jwt_security.create_access_token({"sub": "alice"})
+
+    assert jwt_security.decode_token(token)["sub"] == "alice"
+    assert len(jwt_security.token_cache) == 1
+
+    # cache hit는 backend 검증 없이 반환, 반환값 변경은 cache에 영향 없음
+    monkeypatch.setattr(jwt_security.jwt_backend, "decode", lambda *args, **kwargs: pytest.fail("not cached"))
+    jwt_security.decode_token(token)["sub"] = "mallory"
+    assert jwt_security.decode_token(token)["sub"] == "alice"
+
+    # exp가 지난 entry는 cache에서 제거 후 재검증
+    expired = jwt_security.create_access_token({"sub": "bob"}, expires_delta=timedelta(seconds=-1))
+    jwt_security.token_cache.set(expired, {"sub": "bob", "exp": 0})
+    monkeypatch.undo()
+    assert jwt_security.decode_token(expired) is None
+
+
+@pytest.mark.parametrize("encoder, decoder", [("jose", "hs256"), ("hs256", "jose")])
+def test_hs256_backend_is_compatible_with_jose(encoder, decoder):
+    token = jwt_security.create_access_token({"sub": "alice"})
+    token = get_jwt_backend(encoder).encode(get_jwt_backend("jose").decode(
+        token, jwt_security.SECRET_KEY, ["HS256"]), jwt_security.SECRET_KEY, "HS256")
+
+    assert get_jwt_backend(decoder).decode(token, jwt_security.SECRET_KEY, ["HS256"])["sub"] == "alice"
+
+    forged = get_jwt_backend(encoder).encode({"sub": "alice"}, "another_secret_key", "HS256")
+    with pytest.raises(InvalidTokenError):
+        get_jwt_backend(decoder).decode(forged, jwt_security.SECRET_KEY, ["HS256"])
+
+
+def test_token_cache_is_safe_under_concurrent_expiry_and_eviction():
+    # 짧은 GIL switch interval로 thread 간 interleaving 유도
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    cache = jwt_security.TokenCache(max_size=2)
+    start = threading.Barrier(8)
+
+    def hammer(worker):
+        start.wait()
+        for i in range(2000):
+            token = f"token-{i % 4}"
+            # 절반은 이미 만료된 entry -> 여러 thread가 동시에 삭제
+            cache.set(token, {"sub": token, "exp": time.time() + (60 if worker % 2 else -1)})
+            cache.get(token)
+
+    try:
+        with ThreadPoolExecutor(8) as pool:
+            list(pool.map(hammer, range(8)))
+    finally:
+        sys.setswitchinterval(interval)
+    assert len(cache) <= 2
@@ -0,0 +1,127 @@
+import os
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, select, text
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+# layerd app settings는 import 시점에 필수 값을 검증하므로 테스트용 값 지정
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+for name in ("DB_HOST", "DB_USER", "DB_PASSWORD", "DB_NAME", "SECRET_KEY"):
+    os.environ.setdefault(name, "test")
+# 08_db_app/app.py와 이름이 겹치므로 layerd의 app package를 먼저 검색
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "11_architecture" / "layerd"))
+from app.api.v1.dependencies import get_sync_user_crud  # noqa: E402
+from app.api.v1.endpoints import user_sync  # noqa: E402
+from app.crud.user import UserCRUD  # noqa: E402
+from app.db.base import Base, backfill_user_created_at  # noqa: E402
+from app.models.user import User  # noqa: E402
+from app.utils.cursor import (  # noqa: E402
+    InvalidCursorError, decode_cursor, encode_cursor, keyset_filter, keyset_order_by
+)
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    base = datetime(2024, 1, 1)
+    with Session(engine) as session:
+        # created_at 중복 포함
+        created = [base, base + timedelta(days=3), base, base + timedelta(days=1), base + timedelta(days=1), base + timedelta(days=2)]
+        for i, created_at in enumerate(created, start=1):
+            session.add(User(id=i, username=f"user{i}", email=f"user{i}@example.com", password_hash="x", created_at=created_at))
+        session.commit()
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def session(engine):
+    with Session(engine) as session:
+        yield session
+
+
+def paginate(session, sort_key, limit):
+    seen, cursor = [], None
+    while True:
+        query = select(User).order_by(*keyset_order_by(sort_key)).limit(limit + 1)
+        seek = keyset_filter(sort_key, cursor)
+        if seek is not None:
+            query = query.where(seek)
+        users = list(session.scalars(query))
+        seen += [user.id for user in users[:limit]]
+        if len(users) <= limit:
+            return seen
+        cursor = encode_cursor(sort_key, users[limit - 1])
+
+
+@pytest.mark.parametrize("limit", [1, 2, 4])
+def test_created_at_pagination_visits_every_row_once(session, limit):
+    assert paginate(session, "created_at", limit) == [1, 3, 4, 5, 6, 2]
+    assert paginate(session, "id", limit) == [1, 2, 3, 4, 5, 6]
+
+
+def test_created_at_seek_is_a_row_value_comparison(session):
+    cursor = encode_cursor("created_at", session.get(User, 3))
+    sql = str(keyset_filter("created_at", cursor).compile(compile_kwargs={"literal_binds": True}))
+
+    assert sql.startswith("(users.created_at, users.id) >")
+    assert " OR " not in sql
+
+
+def test_cursor_round_trips_and_rejects_mismatches(session):
+    user = session.get(User, 3)
+    assert decode_cursor(encode_cursor("created_at", user), "created_at") == (datetime(2024, 1, 1), 3)
+
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(encode_cursor("id", user), "created_at")
+    with pytest.raises(InvalidCursorError):
+        decode_cursor("not-a-cursor", "id")
+
+
+def test_backfill_fills_null_created_at(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'legacy.db'}")
+    with engine.begin() as conn:
+        # created_at이 nullable이던 시기의 table
+        conn.execute(text(
+            "CREATE TABLE users (id INTEGER PRIMARY KEY, created_at DATETIME, updated_at DATETIME)"
+        ))
+        conn.execute(text("INSERT INTO users VALUES (1, NULL, '2024-01-02 00:00:00'), (2, NULL, NULL)"))
+
+    backfill_user_created_at(engine)
+
+    with engine.connect() as conn:
+        rows = dict(conn.execute(text("SELECT id, created_at FROM users")).all())
+    assert rows[1] == "2024-01-02 00:00:00"
+    assert rows[2] is not None
+    engine.dispose()
+
+
+def test_users_endpoint_pages_through_keyset_cursor(engine):
+    app = FastAPI()
+    app.include_router(user_sync.router)
+    app.dependency_overrides[get_sync_user_crud] = lambda: UserCRUD(Session(engine))
+    client = TestClient(app)
+
+    seen, cursor = [], None
+    while True:
+        params = {"pagination": "cursor", "sort": "created_at", "limit": 2, "total_mode": "exact"}
+        if cursor:
+            params["cursor"] = cursor
+        response = client.get("/users/", params=params)
+        assert response.status_code == 200
+        body = response.json()
+        assert body["total"] == 6
+        seen += [user["id"] for user in body["users"]]
+        cursor = body["next_cursor"]
+        if not cursor:
+            break
+
+    assert seen == [1, 3, 4, 5, 6, 2]
+    assert client.get("/users/", params={"cursor": "not-a-cursor"}).status_code == 400
@@ -0,0 +1,93 @@
+import sys
+from pathlib import Path
+
+import pytest
+from sqlalchemy import Column, Integer, String, create_engine, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+# 08_db_app/app.py와 이름이 겹치므로 layerd의 app package를 먼저 검색
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "11_architecture" / "layerd"))
+from app.db.routing import ReplicaSelector, create_routing_session_class, primary_reads  # noqa: E402
+
+Base = declarative_base()
+
+
+class Note(Base):
+    __tablename__ = "notes"
+    id = Column(Integer, primary_key=True)
+    body = Column(String(50))
+
+
+def make_databases(tmp_path):
+    # 두 SQLite 파일이 primary / replica 역할, 각자 자기 이름의 row만 가짐
+    for name in ("primary", "replica"):
+        engine = create_engine(f"sqlite:///{tmp_path / name}.db")
+        Base.metadata.create_all(engine)
+        with engine.begin() as conn:
+            conn.execute(Note.__table__.insert(), {"id": 1, "body": name})
+        engine.dispose()
+    return {name: str(tmp_path / f"{name}.db") for name in ("primary", "replica")}
+
+
+def test_sync_session_routes_reads_and_keeps_read_your_writes(tmp_path):
+    paths = make_databases(tmp_path)
+    primary, replica = create_engine(f"sqlite:///{paths['primary']}"), create_engine(f"sqlite:///{paths['replica']}")
+    SessionLocal = sessionmaker(bind=primary, class_=create_routing_session_class(primary, ReplicaSelector([replica])))
+
+    with SessionLocal() as session:
+        assert session.scalar(select(Note.body).where(Note.id == 1)) == "replica"
+
+    with SessionLocal() as session:
+        session.add(Note(id=2, body="written"))
+        session.commit()
+        assert session.scalar(select(Note.body).where(Note.id == 2)) == "written"
+
+    with SessionLocal() as session, primary_reads():
+        assert session.get(Note, 1).body == "primary"
+
+    with SessionLocal() as session:
+        assert session.scalar(select(Note.body).where(Note.id == 1).with_for_update()) == "primary"
+        assert session.get(Note, 2).body == "written"  # FOR UPDATE 이후 같은 session은 primary 유지
+
+    # replica가 없으면 항상 primary
+    with sessionmaker(bind=primary, class_=create_routing_session_class(primary))() as session:
+        assert session.get(Note, 1).body == "primary"
+
+
+def test_replica_selector_strategies(tmp_path):
+    paths = make_databases(tmp_path)
+    busy, idle = create_engine(f"sqlite:///{paths['primary']}"), create_engine(f"sqlite:///{paths['replica']}")
+    static = create_engine("sqlite://", poolclass=StaticPool)
+
+    selector = ReplicaSelector([busy, idle])
+    assert [selector.choose() for _ in range(3)] == [busy, idle, busy]
+    with busy.connect():
+        assert ReplicaSelector([busy, idle], strategy="least_connections").choose() is idle
+        # checkout 수를 제공하지 않는 pool은 idle로 간주
+        assert ReplicaSelector([busy, static], strategy="least_connections").choose() is static
+
+    with pytest.raises(ValueError):
+        ReplicaSelector([busy], strategy="random")
+
+
+@pytest.mark.asyncio
+async def test_async_session_uses_routing_sync_session(tmp_path):
+    paths = make_databases(tmp_path)
+    primary = create_async_engine(f"sqlite+aiosqlite:///{paths['primary']}")
+    replica = create_async_engine(f"sqlite+aiosqlite:///{paths['replica']}")
+    AsyncSessionLocal = sessionmaker(
+        bind=primary,
+        class_=AsyncSession,
+        sync_session_class=create_routing_session_class(primary.sync_engine, ReplicaSelector([replica.sync_engine])),
+        expire_on_commit=False,
+    )
+
+    async with AsyncSessionLocal() as session:
+        assert (await session.get(Note, 1)).body == "replica"
+        with primary_reads():
+            assert (await session.scalar(select(Note.body).where(Note.id == 1))) == "primary"
+
+    await primary.dispose()
+    await replica.dispose()
@@ -0,0 +1,61 @@
+import asyncio
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+sys.path.append(str(Path(__file__).resolve().parent.parent / "09_auth"))
+from sqlite_user import service  # noqa: E402
+from sqlite_user.db import Base  # noqa: E402
+from sqlite_user.password_pool import PasswordPool, PasswordPoolBusy  # noqa: E402
+from sqlite_user.schemas import UserCreate  # noqa: E402
+
+
+@pytest.mark.asyncio
+async def test_hash_and_verify_use_configured_work_factor():
+    pool = PasswordPool(workers=1, max_queue=0, rounds=4)
+    hashed = await pool.hash("secret")
+
+    assert hashed.startswith("$2b$04$")
+    assert await pool.verify("secret", hashed)
+    assert not await pool.verify("wrong", hashed)
+    pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_full_queue_rejects_immediately():
+    pool = PasswordPool(workers=1, max_queue=1, rounds=4)
+    hashed = await pool.hash("secret")
+
+    results = await asyncio.gather(*(pool.verify("secret", hashed) for _ in range(3)), return_exceptions=True)
+
+    assert results[:2] == [True, True]
+    assert isinstance(results[2], PasswordPoolBusy)
+    assert pool.pending == 0
+    pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_async_service_keeps_db_work_off_the_event_loop(monkeypatch):
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    query_threads = set()
+    event.listen(engine, "before_cursor_execute", lambda *args: query_threads.add(threading.get_ident()))
+    monkeypatch.setattr(service.password_pool, "rounds", 4)
+    service.credential_cache.clear()
+
+    with sessionmaker(bind=engine)() as db:
+        await service.UserService.create_user(db, UserCreate(username="alice", password="secret"))
+        await service.UserService.update_user(db, "alice", "secret", "changed")
+        assert (await service.UserService.authenticate_user_async(db, "alice", "changed"))["username"] == "alice"
+        with pytest.raises(HTTPException):
+            await service.UserService.authenticate_user_async(db, "alice", "secret")
+
+    assert query_threads and threading.get_ident() not in query_threads
+    service.credential_cache.clear()
+    engine.dispose()
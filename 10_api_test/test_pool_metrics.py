@@ -0,0 +1,25 @@
+import sys
+from pathlib import Path
+
+from sqlalchemy import text
+
+sys.path.append(str(Path(__file__).resolve().parent.parent / "08_db_app"))
+from common.get_conn import create_db_engine  # noqa: E402
+from common.pool_metrics import get_pool_stats  # noqa: E402
+
+
+def test_checkout_metrics_survive_pool_recreation(tmp_path):
+    engine = create_db_engine(f"sqlite:///{tmp_path / 'pool.db'}", pool_pre_ping=False)
+    for _ in range(2):
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+    assert get_pool_stats(engine)["checkouts"] == 2
+
+    engine.dispose()  # pool.recreate(): 새 pool 객체로 교체
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+
+    stats = get_pool_stats(engine)
+    assert stats["pool_class"] == "InstrumentedQueuePool"
+    assert stats["checkouts"] == 3 and stats["recreations"] == 1
+    engine.dispose()
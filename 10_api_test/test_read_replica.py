@@ -0,0 +1,87 @@
+import sys
+from pathlib import Path
+
+import pytest
+from sqlalchemy import Column, Integer, String, create_engine, select
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.orm import declarative_base
+
+sys.path.append(str(Path(__file__).resolve().parent.parent / "08_db_app"))
+from common.db_routing import (  # noqa: E402
+    ReplicaSelector, async_routing_sessionmaker, primary_reads, routing_sessionmaker
+)
+
+Base = declarative_base()
+
+
+class Note(Base):
+    __tablename__ = "notes"
+    id = Column(Integer, primary_key=True)
+    body = Column(String(50))
+
+
+def make_engines(tmp_path, url_prefix="sqlite:///"):
+    # 두 SQLite 파일이 primary / replica 역할, replica에는 "replica" row만 존재
+    engines = dict()
+    for name in ("primary", "replica"):
+        engine = create_engine(f"sqlite:///{tmp_path / name}.db")
+        Base.metadata.create_all(engine)
+        with engine.begin() as conn:
+            conn.execute(Note.__table__.insert(), {"id": 1, "body": name})
+        engine.dispose()
+        engines[name] = f"{url_prefix}{tmp_path / name}.db"
+    return engines
+
+
+def test_sync_reads_go_to_replica_and_writes_to_primary(tmp_path):
+    urls = make_engines(tmp_path)
+    primary, replica = create_engine(urls["primary"]), create_engine(urls["replica"])
+    SessionLocal = routing_sessionmaker(primary, [replica])
+
+    with SessionLocal() as session:
+        assert session.scalar(select(Note.body).where(Note.id == 1)) == "replica"
+
+    with SessionLocal() as session:
+        session.add(Note(id=2, body="written"))
+        session.commit()
+        # read-your-writes: 쓰기 이후 같은 session의 읽기는 primary
+        assert session.scalar(select(Note.body).where(Note.id == 2)) == "written"
+
+    with SessionLocal() as session, primary_reads():
+        assert session.get(Note, 1).body == "primary"
+
+    with SessionLocal() as session:
+        assert session.get(Note, 2) is None  # replica에는 복제되지 않음
+
+
+def test_least_connections_prefers_idle_replica(tmp_path):
+    urls = make_engines(tmp_path)
+    busy, idle = create_engine(urls["primary"]), create_engine(urls["replica"])
+    selector = ReplicaSelector([busy, idle], strategy="least_connections")
+
+    with busy.connect():
+        assert selector.choose() is idle
+
+    with pytest.raises(ValueError):
+        ReplicaSelector([busy], strategy="random")
+
+
+@pytest.mark.asyncio
+async def test_async_session_routing(tmp_path):
+    urls = make_engines(tmp_path, url_prefix="sqlite+aiosqlite:///")
+    primary, replica = create_async_engine(urls["primary"]), create_async_engine(urls["replica"])
+    SessionLocal = async_routing_sessionmaker(primary, [replica], expire_on_commit=False)
+
+    async with SessionLocal() as session:
+        assert (await session.get(Note, 1)).body == "replica"
+
+    async with SessionLocal.begin() as session:
+        session.add(Note(id=3, body="async"))
+
+    async with SessionLocal() as session:
+        assert await session.get(Note, 3) is None
+        with primary_reads():
+            assert (await session.scalar(select(Note.body).where(Note.id == 3))) == "async"
+
+    await primary.dispose()
+    await replica.dispose()
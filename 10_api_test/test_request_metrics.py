@@ -0,0 +1,62 @@
+import asyncio
+import sys
+from pathlib import Path
+
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+sys.path.append(str(Path(__file__).resolve().parent.parent / "08_db_app"))
+from common.metrics import Histogram, LatencyRegistry  # noqa: E402
+from common.timing_middleware import TimingMiddleware  # noqa: E402
+
+
+def test_histogram_quantiles_interpolate_within_buckets():
+    histogram = Histogram(buckets=(0.01, 0.1, 1.0))
+    for _ in range(90):
+        histogram.observe(0.005)
+    for _ in range(10):
+        histogram.observe(0.5)
+
+    assert histogram.count == 100
+    assert 0 < histogram.quantile(0.5) <= 0.01
+    assert 0.1 < histogram.quantile(0.99) <= 1.0
+
+
+def test_middleware_records_route_template_not_raw_path():
+    registry = LatencyRegistry()
+    app = FastAPI()
+    app.add_middleware(TimingMiddleware, registry=registry, sample_rate=0)
+
+    @app.get("/items/{item_id}")
+    async def get_item(item_id: int):
+        return {"id": item_id}
+
+    client = TestClient(app)
+    for item_id in range(5):
+        assert client.get(f"/items/{item_id}").status_code == 200
+    client.get("/missing")
+
+    counts = {key: histogram.count for key, histogram in registry.items()}
+    assert counts == {("GET", "/items/{item_id}", "200"): 5, ("GET", "<unmatched>", "404"): 1}
+    assert 'route="/items/{item_id}",status="200",quantile="0.95"' in registry.render_prometheus()
+
+
+def test_streaming_response_is_timed_until_the_last_chunk():
+    registry = LatencyRegistry()
+    app = FastAPI()
+    app.add_middleware(TimingMiddleware, registry=registry, sample_rate=0)
+
+    @app.get("/stream")
+    async def stream():
+        async def chunks():
+            for _ in range(3):
+                await asyncio.sleep(0.02)
+                yield b"chunk"
+        return StreamingResponse(chunks())
+
+    response = TestClient(app).get("/stream")
+
+    assert response.content == b"chunk" * 3
+    histogram = dict(registry.items())[("GET", "/stream", "200")]
+    assert histogram.sum >= 0.06
@@ -0,0 +1,166 @@
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent / "09_auth"))
+from sqlalchemy import create_engine  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+from sqlite_user.db import Base  # noqa: E402
+from sqlite_user.token_store import BloomFilter, MemoryTokenStore, SQLiteTokenStore, TokenRevocation  # noqa: E402
+
+
+class CountingStore(MemoryTokenStore):
+    def __init__(self):
+        super().__init__()
+        self.lookups = 0
+
+    def contains(self, key):
+        self.lookups += 1
+        return super().contains(key)
+
+
+class SlowScanStore(MemoryTokenStore):
+    """keys() 호출 prefix와 thread 기록, release 전까지 scan 대기"""
+
+    def __init__(self):
+        super().__init__()
+        self.scans = list()
+        self.release = threading.Event()
+        self.release.set()
+
+    def keys(self, prefix=""):
+        self.scans.append((prefix, threading.get_ident()))
+        self.release.wait(5)
+        return super().keys(prefix)
+
+
+def wait_for_refresh(revocation):
+    deadline = time.monotonic() + 5
+    while revocation._refreshing and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert not revocation._refreshing
+
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    for i in range(1000):
+        bloom.add(f"jti:{i}")
+
+    assert all(f"jti:{i}" in bloom for i in range(1000))
+    assert sum(f"other:{i}" in bloom for i in range(1000)) < 50
+
+
+def test_not_revoked_tokens_skip_the_store():
+    store = CountingStore()
+    revocation = TokenRevocation(store, family_ttl=60)
+    revocation.revoke_token("revoked", time.time() + 60)
+
+    assert not revocation.is_revoked({"jti": "fresh", "fam": "family"})
+    assert store.lookups == 0
+    assert revocation.is_revoked({"jti": "revoked"})
+
+
+def test_refresh_reuse_revokes_the_family():
+    revocation = TokenRevocation(MemoryTokenStore(), family_ttl=60)
+    expires_at = time.time() + 60
+
+    assert revocation.consume_refresh("r1", "family", expires_at)
+    assert revocation.consume_refresh("r2", "family", expires_at)
+    # r1 재사용 -> family 폐기, 같은 family의 다음 refresh/access token도 거부
+    assert not revocation.consume_refresh("r1", "family", expires_at)
+    assert not revocation.consume_refresh("r3", "family", expires_at)
+    assert revocation.is_revoked({"jti": "access", "fam": "family"})
+
+
+def test_expired_entries_are_evicted():
+    store = MemoryTokenStore()
+    store.add("jti:old", time.time() - 1)
+    store.add("jti:new", time.time() + 60)
+
+    assert not store.contains("jti:old")
+    assert store.keys() == ["jti:new"]
+
+
+def test_bloom_rebuild_scans_only_revocation_keys():
+    store = SlowScanStore()
+    store.add("used:r1", time.time() + 60)
+    store.add("jti:revoked", time.time() + 60)
+    revocation = TokenRevocation(store, family_ttl=60)
+
+    assert revocation.is_revoked({"jti": "revoked"})
+    assert {prefix for prefix, _ in store.scans} == {"jti:", "fam:"}
+    assert "used:r1" not in revocation._bloom
+
+
+def test_bloom_refresh_runs_off_the_request_path():
+    store = SlowScanStore()
+    revocation = TokenRevocation(store, family_ttl=60, refresh_interval=0)
+    assert not revocation.is_revoked({"jti": "fresh"})  # 첫 구성은 동기
+
+    # 다른 process의 폐기: 저장소 feed로 즉시 반영, 재구성 완료는 기다리지 않음
+    store.add("jti:elsewhere", time.time() + 60)
+    store.release.clear()
+    store.scans.clear()
+    started = time.monotonic()
+    assert revocation.is_revoked({"jti": "elsewhere"})
+    assert not revocation.is_revoked({"jti": "fresh"})
+    assert time.monotonic() - started < 1
+
+    # 재구성 중 이 process의 폐기는 새 filter에도 반영
+    revocation.revoke_token("during", time.time() + 60)
+    store.release.set()
+    wait_for_refresh(revocation)
+
+    assert threading.get_ident() not in {thread for _, thread in store.scans}
+    assert "jti:elsewhere" in revocation._bloom
+    assert "jti:during" in revocation._bloom
+    assert revocation.is_revoked({"jti": "during"})
+
+
+def test_failed_refresh_keeps_the_current_filter():
+    store = SlowScanStore()
+    revocation = TokenRevocation(store, family_ttl=60, refresh_interval=0)
+    revocation.revoke_token("revoked", time.time() + 60)
+
+    def broken_keys(prefix=""):
+        raise RuntimeError("store down")
+
+    store.keys = broken_keys
+    revocation.is_revoked({"jti": "fresh"})
+    wait_for_refresh(revocation)
+
+    assert "jti:revoked" in revocation._bloom
+
+
+def test_revocation_on_one_worker_is_seen_by_another_on_the_next_check(tmp_path):
+    # 같은 SQLite 파일을 쓰는 두 worker process
+    engine = create_engine(f"sqlite:///{tmp_path / 'tokens.db'}", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine)
+    worker_a = TokenRevocation(SQLiteTokenStore(sessionmaker(bind=engine)), family_ttl=60, refresh_interval=3600)
+    worker_b = TokenRevocation(SQLiteTokenStore(sessionmaker(bind=engine)), family_ttl=60, refresh_interval=3600)
+    assert not worker_b.is_revoked({"jti": "access", "fam": "family"})
+
+    worker_a.revoke_token("access", time.time() + 60)
+    worker_a.revoke_family("family")
+
+    assert worker_b.is_revoked({"jti": "access"})
+    assert worker_b.is_revoked({"jti": "other", "fam": "family"})
+    assert not worker_b.is_revoked({"jti": "fresh"})
+    engine.dispose()
+
+
+def test_revocation_feed_skips_used_keys_and_drops_expired_events():
+    store = MemoryTokenStore()
+    _, cursor = store.revoked_since(None)
+    store.add_if_absent("used:r1", time.time() + 60)
+    store.add("jti:old", time.time() - 1)
+    store.add("jti:new", time.time() + 60)
+
+    keys, cursor = store.revoked_since(cursor)
+    assert keys == ["jti:old", "jti:new"]
+    assert store.revoked_since(cursor) == ([], cursor)
+
+    store.purge_expired()
+    assert store.revoked_since(0) == (["jti:new"], cursor)
@@ -22,8 +22,23 @@ async def get_users(
     user_service: UserServiceDep,  # type: ignore
     skip: int = Query(0),
     limit: int = Query(100, le=1000),
-    search: Optional[str] = Query(None)
+    search: Optional[str] = Query(None),
+    pagination: str = Query("offset", pattern="^(offset|cursor)$"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page (implies pagination=cursor)"),
+    sort: str = Query("id", pattern="^(id|created_at)$", description="keyset sort key for cursor pagination"),
+    total_mode: str = Query("none", pattern="^(exact|estimated|none)$", description="total count for cursor pagination")
 ):
+    if cursor or pagination == "cursor":
+        users, next_cursor, total = await user_service.get_users_with_cursor(
+            limit=limit, cursor=cursor, search=search, sort_key=sort, total_mode=total_mode
+        )
+        return UserListResponse(
+            users=[UserResponse.model_validate(u) for u in users],
+            total=total,
+            per_page=limit,
+            next_cursor=next_cursor
+        )
+
     users, total = await user_service.get_users_with_pagination(skip, limit, search)
     return UserListResponse(
         users=[UserResponse.model_validate(u) for u in users],
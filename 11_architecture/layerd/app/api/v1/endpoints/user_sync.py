@@ -1,5 +1,5 @@
 # app/api/v1/endpoints/user_sync.py
-from fastapi import APIRouter, Query, status
+from fastapi import APIRouter, HTTPException, Query, status
 from typing import Optional
 
 from app.api.v1.dependencies import UserServiceDep
@@ -7,6 +7,7 @@ from app.schemas.user import (
     UserCreate, UserUpdate, UserResponse,
     UserListResponse, UserDetailResponse, UserDeleteResponse
 )
+from app.utils.cursor import InvalidCursorError
 
 router = APIRouter()
 
@@ -22,8 +23,26 @@ def get_users(
     user_service: UserServiceDep,  # type: ignore
     skip: int = Query(0),
     limit: int = Query(100, le=1000),
-    search: Optional[str] = Query(None)
+    search: Optional[str] = Query(None),
+    pagination: str = Query("offset", pattern="^(offset|cursor)$"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page (implies pagination=cursor)"),
+    sort: str = Query("id", pattern="^(id|created_at)$", description="keyset sort key for cursor pagination"),
+    total_mode: str = Query("none", pattern="^(exact|estimated|none)$", description="total count for cursor pagination")
 ):
+    if cursor or pagination == "cursor":
+        try:
+            users, next_cursor, total = user_service.crud.get_users_keyset(
+                limit=limit, cursor=cursor, search=search, sort_key=sort, total_mode=total_mode
+            )
+        except InvalidCursorError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+        return UserListResponse(
+            users=[UserResponse.model_validate(u) for u in users],
+            total=total,
+            per_page=limit,
+            next_cursor=next_cursor
+        )
+
     users, total = user_service.crud.get_users(skip=skip, limit=limit, search=search)
     return UserListResponse(
         users=[UserResponse.model_validate(u) for u in users],
@@ -1,6 +1,6 @@
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings as PydanticSettings
-from typing import Optional
+from typing import List, Optional
 
 
 class Settings(PydanticSettings):
@@ -23,6 +23,10 @@ class Settings(PydanticSettings):
     database_pool_size: int = Field(5, env="DB_POOL_SIZE")
     database_max_overflow: int = Field(10, env="DB_MAX_OVERFLOW")
 
+    # Read Replicas (comma separated sync URLs, e.g. "mysql+pymysql://...@replica1/db,...")
+    read_replica_urls: Optional[str] = Field(None, env="READ_REPLICA_URLS")
+    replica_strategy: str = Field("round_robin", env="REPLICA_STRATEGY")
+
     # Security
     secret_key: str = Field(..., env="SECRET_KEY")
 
@@ -52,8 +56,22 @@ class Settings(PydanticSettings):
     @property
     def async_database_url(self) -> str:
         """Get async version of database URL"""
+        if self.database_url.startswith("sqlite://"):
+            return self.database_url.replace("sqlite://", "sqlite+aiosqlite://", 1)
         return self.database_url.replace("mysql+pymysql://", "mysql+aiomysql://")
 
+    @property
+    def replica_urls(self) -> List[str]:
+        """Sync URLs of the read replicas"""
+        if not self.read_replica_urls:
+            return []
+        return [url.strip() for url in self.read_replica_urls.split(",") if url.strip()]
+
+    @property
+    def async_replica_urls(self) -> List[str]:
+        """Async URLs of the read replicas"""
+        return [url.replace("mysql+pymysql://", "mysql+aiomysql://") for url in self.replica_urls]
+
     @property
     def database_config(self) -> dict:
         """Get database configuration for engine creation"""
@@ -77,7 +95,9 @@ def get_mode_info() -> dict:
         "database_url": settings.database_url,
         "async_database_url": settings.async_database_url,
         "pool_size": settings.database_pool_size,
-        "max_overflow": settings.database_max_overflow
+        "max_overflow": settings.database_max_overflow,
+        "read_replicas": len(settings.replica_urls),
+        "replica_strategy": settings.replica_strategy
     }
 
 
@@ -1,11 +1,17 @@
 """ /app/crud/user.py """
 from sqlalchemy.orm import Session
-from sqlalchemy import or_
-from typing import List, Optional
+from sqlalchemy import or_, text
+from typing import List, Optional, Tuple
 
 from app.models.user import User
 from app.schemas.user import UserCreate, UserUpdate
 from app.core.security import PasswordManager
+from app.utils.cursor import encode_cursor, keyset_filter, keyset_order_by
+
+ESTIMATED_COUNT_SQL = text(
+    "SELECT TABLE_ROWS FROM information_schema.TABLES "
+    "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table_name"
+)
 
 
 class UserCRUD:
@@ -43,6 +49,54 @@ class UserCRUD:
 
         return users, total
 
+    def get_users_keyset(
+        self,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        search: Optional[str] = None,
+        sort_key: str = "id",
+        total_mode: str = "none"
+    ) -> Tuple[List[User], Optional[str], Optional[int]]:
+        """
+        Get users with keyset(seek) pagination.
+        Returns the page of users, the cursor for the next page (None on the last page)
+        and the total count according to total_mode ('exact', 'estimated' or 'none').
+        """
+        query = self.db.query(User)
+
+        if search:
+            search_filter = or_(
+                User.username.contains(search),
+                User.email.contains(search),
+                User.full_name.contains(search)
+            )
+            query = query.filter(search_filter)
+
+        total = None
+        if total_mode == "exact":
+            total = query.count()
+        elif total_mode == "estimated" and not search:
+            total = self.estimate_user_count()
+
+        seek_filter = keyset_filter(sort_key, cursor)
+        if seek_filter is not None:
+            query = query.filter(seek_filter)
+
+        # limit + 1 건을 조회해 다음 페이지 존재 여부를 판단
+        users = query.order_by(*keyset_order_by(sort_key)).limit(limit + 1).all()
+        next_cursor = None
+        if len(users) > limit:
+            users = users[:limit]
+            next_cursor = encode_cursor(sort_key, users[-1]) if users else None
+
+        return users, next_cursor, total
+
+    def estimate_user_count(self) -> Optional[int]:
+        """Get the table statistics row estimate (MySQL/MariaDB only)"""
+        if self.db.get_bind().dialect.name not in ("mysql", "mariadb"):
+            return None
+        return self.db.execute(ESTIMATED_COUNT_SQL, {"table_name": User.__tablename__}).scalar()
+
     def create_user(self, user_data: UserCreate) -> User:
         """Create new user"""
         # Hash password
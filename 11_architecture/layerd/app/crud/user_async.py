@@ -1,11 +1,17 @@
 """/app/crud/user_async.py"""
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, or_, func
+from sqlalchemy import select, or_, func, text
 from typing import List, Optional, Tuple
 
 from app.models.user import User
 from app.schemas.user import UserCreate, UserUpdate
 from app.core.security import PasswordManager
+from app.utils.cursor import encode_cursor, keyset_filter, keyset_order_by
+
+ESTIMATED_COUNT_SQL = text(
+    "SELECT TABLE_ROWS FROM information_schema.TABLES "
+    "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table_name"
+)
 
 
 class AsyncUserCRUD:
@@ -63,6 +69,62 @@ class AsyncUserCRUD:
 
         return list(users), total
 
+    async def get_users_keyset(
+        self,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        search: Optional[str] = None,
+        sort_key: str = "id",
+        total_mode: str = "none"
+    ) -> Tuple[List[User], Optional[str], Optional[int]]:
+        """
+        Get a list of users with keyset(seek) pagination.
+        Returns the page of users, the cursor for the next page (None on the last page)
+        and the total count according to total_mode ('exact', 'estimated' or 'none').
+        """
+        query = select(User)
+        count_query = select(func.count(User.id))
+
+        # Apply search filter if provided
+        if search:
+            search_filter = or_(
+                User.username.ilike(f"%{search}%"),
+                User.email.ilike(f"%{search}%"),
+                User.full_name.ilike(f"%{search}%")
+            )
+            query = query.where(search_filter)
+            count_query = count_query.where(search_filter)
+
+        total = None
+        if total_mode == "exact":
+            total_result = await self.db.execute(count_query)
+            total = total_result.scalar()
+        elif total_mode == "estimated" and not search:
+            total = await self.estimate_user_count()
+
+        seek_filter = keyset_filter(sort_key, cursor)
+        if seek_filter is not None:
+            query = query.where(seek_filter)
+
+        # Fetch limit + 1 rows to know whether a next page exists
+        query = query.order_by(*keyset_order_by(sort_key)).limit(limit + 1)
+        result = await self.db.execute(query)
+        users = list(result.scalars().all())
+
+        next_cursor = None
+        if len(users) > limit:
+            users = users[:limit]
+            next_cursor = encode_cursor(sort_key, users[-1]) if users else None
+
+        return users, next_cursor, total
+
+    async def estimate_user_count(self) -> Optional[int]:
+        """Get the table statistics row estimate (MySQL/MariaDB only)"""
+        if self.db.get_bind().dialect.name not in ("mysql", "mariadb"):
+            return None
+        result = await self.db.execute(ESTIMATED_COUNT_SQL, {"table_name": User.__tablename__})
+        return result.scalar()
+
     async def create_user(self, user_data: UserCreate) -> User:
         """Create a new user"""
         hashed_password = PasswordManager.hash_password(user_data.password)
@@ -1,7 +1,8 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, inspect, text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from app.core.config import settings
+from app.db.routing import ReplicaSelector, create_routing_session_class
 
 # Create database engine
 engine = create_engine(
@@ -11,8 +12,20 @@ engine = create_engine(
     pool_recycle=300
 )
 
+# Read replica engines (reads are routed to them, see app/db/routing.py)
+replica_engines = [
+    create_engine(url, echo=settings.debug, pool_pre_ping=True, pool_recycle=300)
+    for url in settings.replica_urls
+]
+replica_selector = ReplicaSelector(replica_engines, settings.replica_strategy) if replica_engines else None
+
 # Create SessionLocal class
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+SessionLocal = sessionmaker(
+    autocommit=False,
+    autoflush=False,
+    bind=engine,
+    class_=create_routing_session_class(engine, replica_selector)
+)
 
 # Create Base class for models
 Base = declarative_base()
@@ -30,6 +43,26 @@ def get_db():
 def create_tables():
     """Create all database tables"""
     Base.metadata.create_all(bind=engine)
+    backfill_user_created_at(engine)
+
+
+def backfill_user_created_at(bind):
+    """
+    Fill NULL users.created_at and make the column NOT NULL on tables created before it was required.
+    create_all() does not alter existing tables; the keyset cursor relies on created_at never being NULL.
+    """
+    columns = {column["name"]: column for column in inspect(bind).get_columns("users")}
+    if "created_at" not in columns or not columns["created_at"]["nullable"]:
+        return
+    with bind.begin() as conn:
+        conn.execute(text(
+            "UPDATE users SET created_at = COALESCE(updated_at, CURRENT_TIMESTAMP) WHERE created_at IS NULL"
+        ))
+        # SQLite는 column 변경 불가 -> backfill만 (새로 만든 table은 이미 NOT NULL)
+        if bind.dialect.name in ("mysql", "mariadb"):
+            conn.execute(text(
+                "ALTER TABLE users MODIFY created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP"
+            ))
 
 
 def drop_tables():
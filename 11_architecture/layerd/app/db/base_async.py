@@ -1,6 +1,7 @@
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import sessionmaker
 from app.core.config import settings
+from app.db.routing import ReplicaSelector, create_routing_session_class
 
 engine = create_async_engine(
     settings.async_database_url,
@@ -9,8 +10,21 @@ engine = create_async_engine(
     pool_recycle=300
 )
 
+replica_engines = [
+    create_async_engine(url, echo=settings.debug, pool_pre_ping=True, pool_recycle=300)
+    for url in settings.async_replica_urls
+]
+replica_selector = (
+    ReplicaSelector([replica.sync_engine for replica in replica_engines], settings.replica_strategy)
+    if replica_engines else None
+)
+
 AsyncSessionLocal = sessionmaker(
-    bind=engine, class_=AsyncSession, autocommit=False, autoflush=False
+    bind=engine,
+    class_=AsyncSession,
+    sync_session_class=create_routing_session_class(engine.sync_engine, replica_selector),
+    autocommit=False,
+    autoflush=False
 )
 
 
@@ -0,0 +1,74 @@
+"""/app/db/routing.py"""
+import itertools
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import List, Optional
+
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.selectable import Select, CompoundSelect
+
+REPLICA_STRATEGIES = ("round_robin", "least_connections")
+
+_force_primary: ContextVar[bool] = ContextVar("force_primary", default=False)
+
+
+class ReplicaSelector:
+    """Chooses the replica engine for a new session"""
+
+    def __init__(self, engines: List[Engine], strategy: str = "round_robin"):
+        if strategy not in REPLICA_STRATEGIES:
+            raise ValueError(f"Unknown replica strategy: {strategy}")
+        self.engines = list(engines)
+        self.strategy = strategy
+        self._cycle = itertools.cycle(self.engines)
+
+    def choose(self) -> Engine:
+        if self.strategy == "least_connections":
+            # Fewest connections currently checked out of the engine's pool
+            return min(self.engines, key=_checked_out)
+        return next(self._cycle)
+
+
+def _checked_out(engine: Engine) -> int:
+    # Pools without a checkout count (NullPool, StaticPool) count as idle
+    checkedout = getattr(engine.pool, "checkedout", None)
+    return checkedout() if checkedout else 0
+
+
+@contextmanager
+def primary_reads():
+    """Send every read made inside this block to the primary"""
+    token = _force_primary.set(True)
+    try:
+        yield
+    finally:
+        _force_primary.reset(token)
+
+
+def create_routing_session_class(primary: Engine, replicas: Optional[ReplicaSelector] = None):
+    """
+    Build a Session class that routes statements between primary and replicas.
+    Plain SELECTs go to one replica picked per session. Writes, flushes and
+    SELECT ... FOR UPDATE go to the primary, and once a session has used the
+    primary its later reads stay there too (read-your-writes).
+    Async sessions use it as sync_session_class with the engines' sync_engine.
+    """
+
+    class RoutingSession(Session):
+        def get_bind(self, mapper=None, clause=None, **kw):
+            if replicas is None or not replicas.engines:
+                return primary
+            is_read = (
+                not self._flushing
+                and isinstance(clause, (Select, CompoundSelect))
+                and getattr(clause, "_for_update_arg", None) is None
+            )
+            if is_read and not self.info.get("use_primary") and not _force_primary.get():
+                if "replica" not in self.info:
+                    self.info["replica"] = replicas.choose()
+                return self.info["replica"]
+            self.info["use_primary"] = True
+            return primary
+
+    return RoutingSession
@@ -33,9 +33,10 @@ class UserResponse(UserBase):
 
 class UserListResponse(BaseModel):
     users: list[UserResponse]
-    total: int
-    page: int
+    total: Optional[int] = None  # None when total_mode is 'none' (or estimate unavailable)
+    page: Optional[int] = None  # offset pagination only
     per_page: int
+    next_cursor: Optional[str] = None  # cursor pagination only, None on the last page
 
 
 class UserDetailResponse(UserResponse):
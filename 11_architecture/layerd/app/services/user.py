@@ -5,6 +5,7 @@ from typing import Union
 from app.crud.user import UserCRUD
 from app.crud.user_async import AsyncUserCRUD
 from app.schemas.user import UserCreate, UserUpdate
+from app.utils.cursor import InvalidCursorError
 
 
 class UserService:
@@ -63,3 +64,17 @@ class UserService:
 
     async def get_users_with_pagination(self, skip: int = 0, limit: int = 100, search: str = None):
         return await self.crud.get_users(skip=skip, limit=limit, search=search) if self.is_async else self.crud.get_users(skip=skip, limit=limit, search=search)
+
+    async def get_users_with_cursor(
+        self,
+        limit: int = 100,
+        cursor: str = None,
+        search: str = None,
+        sort_key: str = "id",
+        total_mode: str = "none"
+    ):
+        kwargs = dict(limit=limit, cursor=cursor, search=search, sort_key=sort_key, total_mode=total_mode)
+        try:
+            return await self.crud.get_users_keyset(**kwargs) if self.is_async else self.crud.get_users_keyset(**kwargs)
+        except InvalidCursorError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
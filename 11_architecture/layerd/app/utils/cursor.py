@@ -0,0 +1,74 @@
+"""
+Keyset(seek) pagination cursor helpers
+
+- cursor는 마지막으로 반환된 row의 정렬 키 값을 base64url(JSON)로 감싼 opaque 문자열
+- offset 방식과 달리 깊은 페이지에서도 인덱스 seek 한 번으로 다음 페이지를 조회
+- created_at 정렬은 (created_at, id) > (:c, :id) row value 비교 -> ix_users_created_at_id range scan
+  (created_at은 NOT NULL, 기존 NULL row는 app.db.base.backfill_user_created_at으로 채움)
+"""
+import base64
+import json
+from datetime import datetime
+from typing import Any, Optional, Tuple
+
+from sqlalchemy import tuple_
+
+from app.models.user import User
+
+# 지원하는 keyset 정렬 키: (id) 또는 (created_at, id)
+CURSOR_SORT_KEYS = ("id", "created_at")
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a cursor cannot be decoded or does not match the sort key"""
+
+
+def encode_cursor(sort_key: str, user: User) -> str:
+    """Encode the sort key values of the last user on a page"""
+    if sort_key == "created_at":
+        values = [user.created_at.isoformat(), user.id]
+    else:
+        values = [user.id]
+
+    raw = json.dumps({"k": sort_key, "v": values}, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort_key: str) -> Tuple[Any, ...]:
+    """Decode a cursor back into the sort key values"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        key, values = payload["k"], payload["v"]
+    except (ValueError, TypeError, KeyError) as e:
+        raise InvalidCursorError("Malformed cursor") from e
+
+    if key != sort_key:
+        raise InvalidCursorError(f"Cursor was issued for sort key '{key}', not '{sort_key}'")
+
+    try:
+        if sort_key == "created_at":
+            created_at, user_id = values
+            return datetime.fromisoformat(created_at), int(user_id)
+        (user_id,) = values
+        return (int(user_id),)
+    except (ValueError, TypeError) as e:
+        raise InvalidCursorError("Malformed cursor") from e
+
+
+def keyset_order_by(sort_key: str) -> tuple:
+    """ORDER BY columns for the given sort key (id is always the tie-breaker)"""
+    if sort_key == "created_at":
+        return User.created_at.asc(), User.id.asc()
+    return (User.id.asc(),)
+
+
+def keyset_filter(sort_key: str, cursor: Optional[str]):
+    """WHERE clause that seeks past the cursor, or None for the first page"""
+    if not cursor:
+        return None
+
+    values = decode_cursor(cursor, sort_key)
+    if sort_key == "created_at":
+        return tuple_(User.created_at, User.id) > tuple_(*values)
+    return User.id > values[0]